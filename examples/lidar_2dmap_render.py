@@ -339,13 +339,13 @@ Map Information:
             dimension = map_data['dimension']
             
             # Check if we have valid data
-            if not cell_data or fetch_info.cell_width <= 0 or fetch_info.cell_height <= 0:
+            if len(cell_data) == 0 or fetch_info.cell_width <= 0 or fetch_info.cell_height <= 0:
                 print("Warning: Invalid or empty map data")
                 return
             
             # Convert cell data to numpy array and reshape
             if NUMPY_AVAILABLE:
-                map_array = np.array(cell_data, dtype=np.uint8)
+                map_array = np.asarray(cell_data, dtype=np.uint8)
                 expected_size = fetch_info.cell_height * fetch_info.cell_width
                 if len(map_array) != expected_size:
                     print("Warning: Map data size mismatch. Expected {}, got {}".format(expected_size, len(map_array)))
@@ -461,7 +461,7 @@ Map Information:
                                  ha='center', va='center', transform=self.ax_hist.transAxes,
                                  fontsize=12, bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
             
-            print(f"Histogram updated: {len(histogram_data)} bins, max value: {max(histogram_data) if histogram_data else 0:.1f}")
+            print(f"Histogram updated: {len(histogram_data)} bins, max value: {max(histogram_data) if len(histogram_data) else 0:.1f}")
             
         except Exception as e:
             print("Error updating histogram: {}".format(e))
@@ -205,7 +205,7 @@ class LiDAR2DMapSaver:
                 l2p_mapping=self.l2p_mapping
             )
             
-            if not cell_data:
+            if len(cell_data) == 0:
                 print("Warning: No map cell data available from generated map")
                 return None
             
@@ -232,12 +232,9 @@ class LiDAR2DMapSaver:
             fetch_info = map_data['fetch_info']
             cell_data = map_data['cell_data']
             
-            # Reshape cell data to 2D grid
-            grid = np.array(cell_data).reshape(fetch_info.cell_height, fetch_info.cell_width)
-            
             # Convert to image format (0-255)
             # Both l2p and raw data are returned as uint8 by the SDK
-            grid_uint8 = np.array(cell_data, dtype=np.uint8).reshape(fetch_info.cell_height, fetch_info.cell_width)
+            grid_uint8 = np.asarray(cell_data, dtype=np.uint8).reshape(fetch_info.cell_height, fetch_info.cell_width)
          
             
             # Create PIL image (flip vertically for correct orientation)
@@ -261,16 +258,19 @@ class LiDAR2DMapSaver:
         # Calculate statistics (both l2p and raw data are uint8)
         total_cells = len(cell_data)
         
+        # Count every cell value once instead of looping over the grid per class
+        counts = np.bincount(np.asarray(cell_data, dtype=np.uint8), minlength=256)
+        
         if self.l2p_mapping:
             # Linear mapping: use specific uint8 values
-            occupied_cells = sum(1 for x in cell_data if x == 255)  # Occupied = 255
-            free_cells = sum(1 for x in cell_data if x == 127)      # Free = 127
-            unknown_cells = sum(1 for x in cell_data if x == 0)     # Unknown = 0
+            occupied_cells = int(counts[255])   # Occupied = 255
+            free_cells = int(counts[127])       # Free = 127
+            unknown_cells = int(counts[0])      # Unknown = 0
         else:
             # Raw log-odd data as uint8: use threshold-based approach
-            occupied_cells = sum(1 for x in cell_data if x > 180)   # High values = occupied
-            free_cells = sum(1 for x in cell_data if x < 75)        # Low values = free
-            unknown_cells = sum(1 for x in cell_data if 75 <= x <= 180)  # Mid values = unknown
+            occupied_cells = int(counts[181:].sum())     # High values = occupied
+            free_cells = int(counts[:75].sum())          # Low values = free
+            unknown_cells = int(counts[75:181].sum())    # Mid values = unknown
         
         map_width = dimension.max_x - dimension.min_x
         map_height = dimension.max_y - dimension.min_y
@@ -27,6 +27,7 @@ import time
 import argparse
 import signal
 import math
+import functools
 import threading
 from typing import Optional, List, Tuple, Dict
 from collections import deque
@@ -133,11 +134,17 @@ except ImportError:
 # Setup SDK import
 AuroraSDK, AuroraSDKError, ConnectionError, DataNotReadyError = setup_sdk_import()
 
+# Map point raster settings (2D): pixels per bbox rounding step and point color (green, alpha 0.6)
+RASTER_PIXELS_PER_STEP = 128
+MAP_POINT_RGBA = (0, 128, 0, 153)
+
 
 class VectorMapRenderer:
     """Advanced vector-based map visualization using matplotlib."""
     
     def __init__(self, enable_3d=False, max_history=1000):
+        if max_history < 1:
+            raise ValueError("max_history must be at least 1, got {}".format(max_history))
         self.sdk = None
         self.running = True
         self.enable_3d = enable_3d and MATPLOTLIB_3D_AVAILABLE
@@ -148,7 +155,10 @@ class VectorMapRenderer:
         self.keyframes = []
         self.loop_closures = []
         self.current_pose = None
-        self.pose_history = deque(maxlen=max_history)
+        # Pose history ring buffer: O(1) append, contiguous (x, y, z) rows for plotting
+        self._pose_buf = np.empty((max_history, 3), dtype=np.float32) if MATPLOTLIB_AVAILABLE else None
+        self._pose_head = 0
+        self._pose_count = 0
         self.timestamp_history = deque(maxlen=max_history)
         
         # Matplotlib setup
@@ -158,6 +168,27 @@ class VectorMapRenderer:
         self.trajectory_line = None
         self.pose_history_line = None
         self.current_pose_marker = None
+        self.map_image = None
+        
+        # Rasterized map points (2D), cached per (rounded view bbox, zoom bucket, map version)
+        self._map_version = 0
+        self._map_xy = None
+        self._map_xy_version = -1
+        self._render_map_rgba = functools.lru_cache(maxsize=32)(self._render_map_rgba_uncached)
+        
+        # Specialize the per-frame drawing for 2D or 3D once, instead of branching on every frame
+        if self.enable_3d:
+            self._draw_points = self._draw_points_3d
+            self._draw_trajectory = self._draw_trajectory_3d
+            self._draw_pose_history = self._draw_pose_history_3d
+            self._draw_pose_marker = self._draw_pose_marker_3d
+            self._refresh_map_raster = lambda: None
+        else:
+            self._draw_points = self._draw_points_2d
+            self._draw_trajectory = self._draw_trajectory_2d
+            self._draw_pose_history = self._draw_pose_history_2d
+            self._draw_pose_marker = self._draw_pose_marker_2d
+            self._refresh_map_raster = self._update_map_raster
         
         # Animation and threading
         self.ani = None
@@ -221,23 +252,33 @@ class VectorMapRenderer:
         # Initialize empty plots
         if self.enable_3d:
             # 3D plots
-            self.scatter_points = self.ax.scatter([], [], [], s=1, c='green', alpha=0.6, label='Map Points')
+            self.scatter_points = self.ax.scatter([], [], [], s=1, c='green', alpha=0.6, label='Map Points',
+                                                   rasterized=True, zorder=1)
             self.trajectory_line, = self.ax.plot([], [], [], 'r-', linewidth=2, label='Keyframe Trajectory')
-            self.pose_history_line, = self.ax.plot([], [], [], 'b-', linewidth=1, alpha=0.7, label='Pose History')
+            self.pose_history_line, = self.ax.plot([], [], [], 'b-', linewidth=1, alpha=0.7, label='Pose History',
+                                                    rasterized=True, zorder=2)
             self.current_pose_marker, = self.ax.plot([], [], [], 'ro', markersize=8, label='Current Pose')
         else:
             # 2D plots
-            self.scatter_points = self.ax.scatter([], [], s=2, c='green', alpha=0.6, label='Map Points')
+            self.scatter_points = self.ax.scatter([], [], s=2, c='green', alpha=0.6, label='Map Points',
+                                                   rasterized=True, zorder=1)
             self.trajectory_line, = self.ax.plot([], [], 'r-', linewidth=2, label='Keyframe Trajectory')
-            self.pose_history_line, = self.ax.plot([], [], 'b-', linewidth=1, alpha=0.7, label='Pose History')
+            self.pose_history_line, = self.ax.plot([], [], 'b-', linewidth=1, alpha=0.7, label='Pose History',
+                                                    rasterized=True, zorder=2)
             self.current_pose_marker, = self.ax.plot([], [], 'ro', markersize=8, label='Current Pose')
+            # Map points are displayed as a cached RGBA raster; the empty scatter above only feeds the legend
+            self.map_image = self.ax.imshow(np.zeros((1, 1, 4), dtype=np.uint8), extent=(0, 1, 0, 1),
+                                            origin='lower', interpolation='nearest', zorder=1, visible=False)
+            # View limits are managed explicitly (the raster extent must not autoscale the axes)
+            self.ax.set_autoscale_on(False)
         
         self.ax.legend()
         
-        # Add text for statistics
-        self.stats_text = self.fig.text(0.02, 0.98, '', transform=self.fig.transFigure,
-                                       verticalalignment='top', fontsize=10,
-                                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        # Add text for statistics (axes-relative so it is redrawn together with the other blitted artists)
+        text_fn = self.ax.text2D if self.enable_3d else self.ax.text
+        self.stats_text = text_fn(0.02, 0.98, '', transform=self.ax.transAxes,
+                                  verticalalignment='top', fontsize=10,
+                                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
         plt.tight_layout()
     
@@ -317,6 +358,7 @@ class VectorMapRenderer:
             # Disable auto-scale during manual pan
             self.auto_scale = False
             
+            self._update_map_raster()
             self.fig.canvas.draw_idle()
         
         elif self.zoom_active and event.xdata is not None and event.ydata is not None:
@@ -343,6 +385,7 @@ class VectorMapRenderer:
             # Disable auto-scale during manual zoom
             self.auto_scale = False
             
+            self._update_map_raster()
             self.fig.canvas.draw_idle()
             self.last_mouse_pos = (event.xdata, event.ydata)
     
@@ -387,6 +430,7 @@ class VectorMapRenderer:
         # Disable auto-scale during manual zoom
         self.auto_scale = False
         
+        self._update_map_raster()
         self.fig.canvas.draw_idle()
     
     def _show_help(self):
@@ -420,7 +464,7 @@ Toolbar:
     def _reset_view(self):
         """Reset the view to fit all data."""
         with self.data_lock:
-            if self.map_points or self.keyframes or self.pose_history:
+            if self.map_points or self.keyframes or self._pose_count:
                 self._update_view_bounds()
     
     def _save_visualization(self):
@@ -429,19 +473,51 @@ Toolbar:
         filename = "aurora_map_{}".format(timestamp)
         
         # Save as high-quality PNG
-        self.fig.savefig("{}.png".format(filename), dpi=300, bbox_inches='tight')
+        self._savefig("{}.png".format(filename), dpi=300, bbox_inches='tight')
         
-        # Save as vector PDF
-        self.fig.savefig("{}.pdf".format(filename), bbox_inches='tight')
+        # Save as vector PDF (map points stay vector; the pose history is rasterized at the given dpi)
+        self._savefig("{}.pdf".format(filename), dpi=300, bbox_inches='tight')
         
         print("Visualization saved as {}.png and {}.pdf".format(filename, filename))
     
+    def _savefig(self, filename, **kwargs):
+        """Save the figure with the map points as a full-resolution vector scatter.
+
+        The on-screen 2D view shows map points through a coarse cached raster;
+        exports draw every point instead so saved maps do not lose resolution.
+        """
+        if self.map_image is None:
+            self.fig.savefig(filename, **kwargs)
+            return
+        with self.data_lock:
+            if self.map_points:
+                self._draw_points()
+            map_xy = self._map_xy
+        if map_xy is None or len(map_xy) == 0:
+            self.fig.savefig(filename, **kwargs)
+            return
+        raster_visible = self.map_image.get_visible()
+        self.map_image.set_visible(False)
+        self.scatter_points.set_offsets(map_xy)
+        self.scatter_points.set_rasterized(False)
+        try:
+            self.fig.savefig(filename, **kwargs)
+        finally:
+            self.scatter_points.set_offsets(np.empty((0, 2)))
+            self.scatter_points.set_rasterized(True)
+            self.map_image.set_visible(raster_visible)
+    
     def _clear_data(self):
         """Clear all map data."""
         with self.data_lock:
             self.map_points.clear()
+            self._map_version += 1
+            # Drop the cached points and rasters so the cleared map is not redrawn
+            self._map_xy = None
+            self._render_map_rgba.cache_clear()
             self.keyframes.clear()
-            self.pose_history.clear()
+            self._pose_head = 0
+            self._pose_count = 0
             self.timestamp_history.clear()
             self.current_pose = None
             print("Map data cleared")
@@ -458,7 +534,7 @@ Toolbar:
             print("\n=== Map Statistics ===")
             print("Map Points: {}".format(len(self.map_points)))
             print("Keyframes: {}".format(len(self.keyframes)))
-            print("Pose History: {}".format(len(self.pose_history)))
+            print("Pose History: {}".format(self._pose_count))
             if self.stats['map_bounds']:
                 bounds = self.stats['map_bounds']
                 print("Map Bounds: X=[{:.2f}, {:.2f}], Y=[{:.2f}, {:.2f}]".format(bounds[0], bounds[1], bounds[2], bounds[3]))
@@ -472,6 +548,7 @@ Toolbar:
             # Update map points
             if new_map_points:
                 self.map_points = new_map_points
+                self._map_version += 1
             
             # Update keyframes
             if new_keyframes:
@@ -496,7 +573,9 @@ Toolbar:
             if new_current_pose:
                 self.current_pose = new_current_pose
                 current_time = time.time()
-                self.pose_history.append((new_current_pose[0], new_current_pose[1], new_current_pose[2]))
+                self._pose_buf[self._pose_head] = new_current_pose[:3]
+                self._pose_head = (self._pose_head + 1) % self.max_history
+                self._pose_count = min(self._pose_count + 1, self.max_history)
                 self.timestamp_history.append(current_time)
             
             # Update statistics
@@ -505,6 +584,12 @@ Toolbar:
             
             self.last_update_time = time.time()
     
+    def _pose_history_array(self):
+        """Return the pose history as an (N, 3) array, oldest pose first."""
+        if self._pose_count < self.max_history:
+            return self._pose_buf[:self._pose_count]
+        return np.roll(self._pose_buf, -self._pose_head, axis=0)
+    
     def _calculate_bounds(self):
         """Calculate bounds for all data."""
         all_x, all_y, all_z = [], [], []
@@ -522,10 +607,11 @@ Toolbar:
             all_z.extend([k['position'][2] for k in self.keyframes])
         
         # Add pose history
-        if self.pose_history:
-            all_x.extend([p[0] for p in self.pose_history])
-            all_y.extend([p[1] for p in self.pose_history])
-            all_z.extend([p[2] for p in self.pose_history])
+        if self._pose_count:
+            poses = self._pose_history_array()
+            all_x.extend(poses[:, 0].tolist())
+            all_y.extend(poses[:, 1].tolist())
+            all_z.extend(poses[:, 2].tolist())
         
         if all_x and all_y:
             margin = 2.0  # 2 meter margin
@@ -552,63 +638,92 @@ Toolbar:
                 self.ax.set_xlim(bounds[0], bounds[1])
                 self.ax.set_ylim(bounds[2], bounds[3])
     
+    @staticmethod
+    def _raster_key(xlim, ylim):
+        """Round the view to a zoom bucket and an outward-aligned bbox so small pans reuse a raster."""
+        span = max(xlim[1] - xlim[0], ylim[1] - ylim[0], 1e-3)
+        zoom_bucket = int(math.floor(math.log2(span) * 4))
+        step = 2.0 ** (zoom_bucket / 4.0) / 4.0
+        bbox = (math.floor(xlim[0] / step) * step - step, math.ceil(xlim[1] / step) * step + step,
+                math.floor(ylim[0] / step) * step - step, math.ceil(ylim[1] / step) * step + step)
+        return tuple(round(v, 6) for v in bbox), zoom_bucket
+    
+    def _render_map_rgba_uncached(self, bbox, zoom_bucket, map_version):
+        """Rasterize the map points inside bbox into an RGBA (uint8[H, W, 4]) image."""
+        x0, x1, y0, y1 = bbox
+        step = 2.0 ** (zoom_bucket / 4.0) / 4.0
+        bins_x = max(1, int(round((x1 - x0) / step * RASTER_PIXELS_PER_STEP)))
+        bins_y = max(1, int(round((y1 - y0) / step * RASTER_PIXELS_PER_STEP)))
+        hist, _, _ = np.histogram2d(self._map_xy[:, 1], self._map_xy[:, 0], bins=(bins_y, bins_x),
+                                    range=((y0, y1), (x0, x1)))
+        rgba = np.zeros((bins_y, bins_x, 4), dtype=np.uint8)
+        rgba[hist > 0] = MAP_POINT_RGBA
+        return rgba
+    
+    def _update_map_raster(self):
+        """Show the (cached) map point raster covering the current view."""
+        if self.map_image is None:
+            return
+        if self._map_xy is None or len(self._map_xy) == 0:
+            self.map_image.set_visible(False)
+            return
+        bbox, zoom_bucket = self._raster_key(self.ax.get_xlim(), self.ax.get_ylim())
+        self.map_image.set_data(self._render_map_rgba(bbox, zoom_bucket, self._map_version))
+        self.map_image.set_extent(bbox)
+        self.map_image.set_visible(True)
+    
+    # Per-mode drawing primitives, bound once in __init__ according to enable_3d
+    def _draw_points_2d(self):
+        if self._map_xy_version != self._map_version:
+            self._map_xy = np.array([[p['position'][0], p['position'][1]] for p in self.map_points])
+            self._map_xy_version = self._map_version
+            # Rasters of older map versions can never be hit again
+            self._render_map_rgba.cache_clear()
+    
+    def _draw_points_3d(self):
+        self.scatter_points._offsets3d = (
+            [p['position'][0] for p in self.map_points],
+            [p['position'][1] for p in self.map_points],
+            [p['position'][2] for p in self.map_points]
+        )
+    
+    def _draw_trajectory_2d(self, positions):
+        self.trajectory_line.set_data([p[0] for p in positions], [p[1] for p in positions])
+    
+    def _draw_trajectory_3d(self, positions):
+        self.trajectory_line.set_data_3d([p[0] for p in positions], [p[1] for p in positions],
+                                         [p[2] for p in positions])
+    
+    def _draw_pose_history_2d(self, poses):
+        self.pose_history_line.set_data(poses[:, 0], poses[:, 1])
+    
+    def _draw_pose_history_3d(self, poses):
+        self.pose_history_line.set_data_3d(poses[:, 0], poses[:, 1], poses[:, 2])
+    
+    def _draw_pose_marker_2d(self, pose):
+        self.current_pose_marker.set_data([pose[0]], [pose[1]])
+    
+    def _draw_pose_marker_3d(self, pose):
+        self.current_pose_marker.set_data_3d([pose[0]], [pose[1]], [pose[2]])
+    
     def animate_frame(self, frame):
         """Animation frame update function."""
         with self.data_lock:
             # Update map points
             if self.map_points:
-                if self.enable_3d:
-                    self.scatter_points._offsets3d = (
-                        [p['position'][0] for p in self.map_points],
-                        [p['position'][1] for p in self.map_points],
-                        [p['position'][2] for p in self.map_points]
-                    )
-                else:
-                    if len(self.map_points) > 0:
-                        points = np.array([[p['position'][0], p['position'][1]] for p in self.map_points])
-                        self.scatter_points.set_offsets(points)
+                self._draw_points()
             
             # Update keyframe trajectory
             if self.keyframes and len(self.keyframes) > 1:
-                if self.enable_3d:
-                    self.trajectory_line.set_data_3d(
-                        [k['position'][0] for k in self.keyframes],
-                        [k['position'][1] for k in self.keyframes],
-                        [k['position'][2] for k in self.keyframes]
-                    )
-                else:
-                    self.trajectory_line.set_data(
-                        [k['position'][0] for k in self.keyframes],
-                        [k['position'][1] for k in self.keyframes]
-                    )
+                self._draw_trajectory([k['position'] for k in self.keyframes])
             
             # Update pose history
-            if self.pose_history and len(self.pose_history) > 1:
-                if self.enable_3d:
-                    self.pose_history_line.set_data_3d(
-                        [p[0] for p in self.pose_history],
-                        [p[1] for p in self.pose_history],
-                        [p[2] for p in self.pose_history]
-                    )
-                else:
-                    self.pose_history_line.set_data(
-                        [p[0] for p in self.pose_history],
-                        [p[1] for p in self.pose_history]
-                    )
+            if self._pose_count > 1:
+                self._draw_pose_history(self._pose_history_array())
             
             # Update current pose marker
             if self.current_pose:
-                if self.enable_3d:
-                    self.current_pose_marker.set_data_3d(
-                        [self.current_pose[0]],
-                        [self.current_pose[1]],
-                        [self.current_pose[2]]
-                    )
-                else:
-                    self.current_pose_marker.set_data(
-                        [self.current_pose[0]],
-                        [self.current_pose[1]]
-                    )
+                self._draw_pose_marker(self.current_pose)
             
             # Update statistics text
             auto_scale_status = "ON" if self.auto_scale else "OFF"
@@ -621,7 +736,7 @@ Toolbar:
                          "Press 'h' for help").format(
                              len(self.map_points),
                              len(self.keyframes),
-                             len(self.pose_history),
+                             self._pose_count,
                              self.stats['trajectory_length'],
                              auto_scale_status,
                              time.strftime('%H:%M:%S', time.localtime(self.last_update_time))
@@ -631,10 +746,16 @@ Toolbar:
             # Auto-adjust view bounds periodically (only if auto-scale is enabled)
             if self.auto_scale and frame % 30 == 0:  # Every 30 frames (~1 second at 30fps)
                 self._update_view_bounds()
+                # Limits changed: the blitted background (ticks, grid) needs a full redraw
+                self.fig.canvas.draw_idle()
+            
+            self._refresh_map_raster()
         
         # Return all artists that were modified
         artists = [self.scatter_points, self.trajectory_line, self.pose_history_line, 
                   self.current_pose_marker, self.stats_text]
+        if self.map_image is not None:
+            artists.append(self.map_image)
         return artists
     
     def data_acquisition_thread(self, connection_string):
@@ -700,7 +821,7 @@ Toolbar:
                         current_pose = None
                     
                     # Get map data periodically
-                    map_points, keyframes = None, None
+                    map_points, keyframes, loop_closures = None, None, None
                     if current_time - last_map_refresh > 2.0:
                         try:
                             map_data = self.sdk.get_map_data()
@@ -737,7 +858,7 @@ Toolbar:
                 except:
                     pass
     
-    def run(self, connection_string=None):
+    def run(self, connection_string=None, animated=False):
         """Run the vector map renderer."""
         if not MATPLOTLIB_AVAILABLE:
             print("Error: matplotlib is required for this demo.")
@@ -773,8 +894,30 @@ Toolbar:
         print("  • Loop Closure Detection: Special color for loop connections")
         print("  • Smart trajectory visualization with loop highlighting")
         print("=======================================\n")
+        if animated:
+            return self._run_animated(connection_string)
         return self._run_interactive_simple(connection_string)
     
+    def _run_animated(self, connection_string=None):
+        """Run interactive mode with FuncAnimation, redrawing only the changed artists (blitting)."""
+        acquisition_thread = threading.Thread(target=self.data_acquisition_thread,
+                                              args=(connection_string,), daemon=True)
+        acquisition_thread.start()
+        
+        try:
+            self.setup_matplotlib()
+            # Blitting is only reliable for 2D axes; 3D axes need a full redraw to reproject
+            self.ani = animation.FuncAnimation(self.fig, self.animate_frame, interval=33,
+                                               blit=not self.enable_3d, cache_frame_data=False)
+            plt.show()
+        except KeyboardInterrupt:
+            print("\nCtrl+C pressed, exiting...")
+        finally:
+            self.running = False
+            acquisition_thread.join(timeout=5.0)
+        
+        return 0
+    
     def _run_interactive_simple(self, connection_string=None):
         """Run interactive mode with slow refresh - safer approach."""
         sdk = None
@@ -1015,12 +1158,24 @@ Toolbar:
             fig.canvas.mpl_connect('motion_notify_event', on_mouse_move)
             fig.canvas.mpl_connect('scroll_event', on_scroll)
             
-            # Initialize plots (will be updated in loop)
-            map_points_plot = None
-            keyframe_line = None
-            keyframe_points = None
-            current_pose_plot = None
-            stats_text = None
+            # Create the plot artists once and update them in place on every refresh,
+            # instead of clearing the axes and re-creating every artist and text element
+            ax.set_title('Aurora VSLAM Map - Live Interactive Visualization')
+            empty_offsets = np.empty((0, 2))
+            map_points_plot = ax.scatter([], [], s=2, c='green', alpha=0.6, rasterized=True, zorder=1)
+            keyframe_line, = ax.plot([], [], 'r-', linewidth=2)
+            keyframe_points = ax.scatter([], [], c='red', s=20, zorder=5)
+            loop_closure_lines = LineCollection([], colors=loop_closure_color, linewidths=3, alpha=0.7,
+                                                linestyles='--', zorder=6)
+            ax.add_collection(loop_closure_lines)
+            loop_closure_points = ax.scatter([], [], c=loop_closure_color, s=50, marker='o',
+                                             edgecolors='black', linewidth=1, zorder=7)
+            current_pose_plot = ax.scatter([], [], c='blue', s=100, marker='o', zorder=10)
+            stats_text = ax.text(0.02, 0.98, '', transform=ax.transAxes,
+                                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+            # View limits are managed explicitly below
+            ax.set_autoscale_on(False)
+            legend_labels = None
             
             last_update_time = 0
             
@@ -1047,58 +1202,39 @@ Toolbar:
                         except DataNotReadyError:
                             current_pose = None
                         
-                        # Clear the axes
-                        ax.clear()
-                        ax.set_title('Aurora VSLAM Map - Live Interactive Visualization')
-                        ax.set_xlabel('X (meters)')
-                        ax.set_ylabel('Y (meters)')
-                        ax.grid(True, alpha=0.3)
-                        ax.set_aspect('equal')
+                        legend_entries = []
                         
                         # Plot map points
                         if map_points:
-                            x_coords = [p['position'][0] for p in map_points]
-                            y_coords = [p['position'][1] for p in map_points]
-                            ax.scatter(x_coords, y_coords, s=2, c='green', alpha=0.6, 
-                                     label='Map Points ({})'.format(len(map_points)))
+                            map_points_plot.set_offsets(
+                                np.array([[p['position'][0], p['position'][1]] for p in map_points]))
+                            legend_entries.append((map_points_plot, 'Map Points ({})'.format(len(map_points))))
+                        else:
+                            map_points_plot.set_offsets(empty_offsets)
                         
                         # Plot keyframe trajectory
-                        loop_count = 0
+                        actual_connections_drawn = 0
+                        loop_segments = []
                         if keyframes and len(keyframes) > 1:
                             x_coords = [k['position'][0] for k in keyframes]
                             y_coords = [k['position'][1] for k in keyframes]
-                            ax.plot(x_coords, y_coords, 'r-', linewidth=2, 
-                                   label='Keyframe Trajectory ({})'.format(len(keyframes)))
-                            ax.scatter(x_coords, y_coords, c='red', s=20, zorder=5)
+                            keyframe_line.set_data(x_coords, y_coords)
+                            keyframe_points.set_offsets(np.column_stack((x_coords, y_coords)))
+                            legend_entries.append((keyframe_line, 'Keyframe Trajectory ({})'.format(len(keyframes))))
                             
                             # Plot loop closures using real loop closure data from SDK
                             if show_loop_closures and loop_closures:
-                                loop_count = len(loop_closures)
-                                
                                 # Create a mapping from keyframe ID to keyframe position
                                 kf_id_to_pos = {}
-                                for i, kf in enumerate(keyframes):
+                                for kf in keyframes:
                                     # Keyframe dict format with id, position, etc.
                                     kf_id_to_pos[kf['id']] = (kf['position'][0], kf['position'][1])  # Map ID to (x, y)
                                 
-                                # Draw loop closure connections using real loop closure data
-                                actual_connections_drawn = 0
+                                # Collect loop closure connections using real loop closure data
                                 missing_keyframes = []
                                 for from_kf_id, to_kf_id in loop_closures:
                                     if from_kf_id in kf_id_to_pos and to_kf_id in kf_id_to_pos:
-                                        pos1 = kf_id_to_pos[from_kf_id]
-                                        pos2 = kf_id_to_pos[to_kf_id]
-                                        
-                                        # Draw loop closure connection
-                                        ax.plot([pos1[0], pos2[0]], [pos1[1], pos2[1]], 
-                                               color=loop_closure_color, linewidth=3, alpha=0.7, 
-                                               zorder=6, linestyle='--')
-                                        
-                                        # Add small markers at loop closure points
-                                        ax.scatter([pos1[0], pos2[0]], [pos1[1], pos2[1]], 
-                                                 c=loop_closure_color, s=50, marker='o', 
-                                                 edgecolors='black', linewidth=1, zorder=7)
-                                        actual_connections_drawn += 1
+                                        loop_segments.append((kf_id_to_pos[from_kf_id], kf_id_to_pos[to_kf_id]))
                                     else:
                                         # Track missing keyframes for debugging
                                         if from_kf_id not in kf_id_to_pos:
@@ -1111,17 +1247,34 @@ Toolbar:
                                     print(f"Warning: Loop closures reference missing keyframes: {set(missing_keyframes)}")
                                     print(f"Available keyframe IDs: {sorted(list(kf_id_to_pos.keys())[:10])}...")  # Show first 10
                                 
-                                # Add loop closures to legend if any found
-                                if actual_connections_drawn > 0:
-                                    ax.plot([], [], color=loop_closure_color, linewidth=3, 
-                                           linestyle='--', alpha=0.7, label='Loop Closures ({})'.format(actual_connections_drawn))
+                                actual_connections_drawn = len(loop_segments)
+                        else:
+                            keyframe_line.set_data([], [])
+                            keyframe_points.set_offsets(empty_offsets)
+                        
+                        # Draw loop closure connections with small markers at both ends
+                        loop_closure_lines.set_segments(loop_segments)
+                        if loop_segments:
+                            loop_closure_points.set_offsets(np.array(loop_segments).reshape(-1, 2))
+                            legend_entries.append((loop_closure_lines, 'Loop Closures ({})'.format(actual_connections_drawn)))
+                        else:
+                            loop_closure_points.set_offsets(empty_offsets)
                         
                         # Plot current pose
                         if current_pose:
-                            ax.scatter([current_pose[0]], [current_pose[1]], c='blue', s=100, 
-                                     marker='o', zorder=10, label='Current Pose')
+                            current_pose_plot.set_offsets([[current_pose[0], current_pose[1]]])
+                            legend_entries.append((current_pose_plot, 'Current Pose'))
+                        else:
+                            current_pose_plot.set_offsets(empty_offsets)
                         
-                        ax.legend()
+                        # Only rebuild the legend when its labels actually change
+                        labels = tuple(label for _, label in legend_entries)
+                        if labels != legend_labels:
+                            if legend_entries:
+                                ax.legend([handle for handle, _ in legend_entries], list(labels))
+                            elif ax.get_legend() is not None:
+                                ax.get_legend().remove()
+                            legend_labels = labels
                         
                         # Restore view state or auto-adjust view
                         if view_manually_set and saved_xlim is not None and saved_ylim is not None:
@@ -1150,7 +1303,7 @@ Toolbar:
                                     saved_xlim = new_xlim
                                     saved_ylim = new_ylim
                         
-                        # Add statistics text
+                        # Update statistics text
                         auto_scale_status = "ON" if auto_scale else "OFF"
                         view_status = "Manual" if view_manually_set else "Auto"
                         loop_status = "ON" if show_loop_closures else "OFF"
@@ -1159,8 +1312,7 @@ Toolbar:
                         actual_loop_count = len(loop_closures) if loop_closures else 0
                         if actual_loop_count > 0:
                             # Show both total and successfully drawn connections
-                            drawn_count = actual_connections_drawn if 'actual_connections_drawn' in locals() else 0
-                            stats_info += "\nLoop Closures: {} (drawn: {})".format(actual_loop_count, drawn_count)
+                            stats_info += "\nLoop Closures: {} (drawn: {})".format(actual_loop_count, actual_connections_drawn)
                         if current_pose:
                             stats_info += "\nCurrent Pose: ({:.2f}, {:.2f}, {:.2f})".format(current_pose[0], current_pose[1], current_pose[2])
                         stats_info += "\nAuto-scale: {}".format(auto_scale_status)
@@ -1169,8 +1321,7 @@ Toolbar:
                         stats_info += "\nLast Update: {}".format(time.strftime('%H:%M:%S'))
                         stats_info += "\nPress 'h' for help"
                         
-                        ax.text(0.02, 0.98, stats_info, transform=ax.transAxes, 
-                               verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+                        stats_text.set_text(stats_info)
                         
                         # Refresh the display
                         plt.draw()
@@ -1287,7 +1438,7 @@ Toolbar:
                         
                         timestamp = time.strftime("%Y%m%d_%H%M%S")
                         filename = "aurora_map_headless_{:03d}_{}.png".format(save_counter, timestamp)
-                        self.fig.savefig(filename, dpi=150, bbox_inches='tight')
+                        self._savefig(filename, dpi=150, bbox_inches='tight')
                         print("Saved: {} ({} points, {} keyframes)".format(filename, len(self.map_points), len(self.keyframes)))
                         save_counter += 1
                         last_save_time = current_time
@@ -1312,7 +1463,7 @@ Toolbar:
                     self.animate_frame(0)
                     timestamp = time.strftime("%Y%m%d_%H%M%S")
                     filename = "aurora_map_final_{}.png".format(timestamp)
-                    self.fig.savefig(filename, dpi=150, bbox_inches='tight')
+                    self._savefig(filename, dpi=150, bbox_inches='tight')
                     print("Final image saved: {}".format(filename))
                     plt.close(self.fig)
                 except Exception as e:
@@ -1340,6 +1491,7 @@ Examples:
     python vector_map_render.py                    # Auto-discover and connect
     python vector_map_render.py 192.168.1.212     # Connect to specific IP
     python vector_map_render.py --3d               # Enable 3D visualization
+    python vector_map_render.py --animate          # Blitted real-time animation
 
 Features:
     - Interactive matplotlib interface with pan/zoom
@@ -1363,18 +1515,24 @@ This demo visualizes VSLAM map data with:
         help='Aurora device connection string (e.g., 192.168.1.212)'
     )
     parser.add_argument(
-        '--3d', action='store_true',
+        '--3d', dest='three_d', action='store_true',
         help='Enable 3D visualization mode'
     )
+    parser.add_argument(
+        '--animate', action='store_true',
+        help='Use a 30 fps blitted animation instead of the periodic full redraw'
+    )
     parser.add_argument(
         '--max-history', type=int, default=1000,
         help='Maximum number of pose history points to keep (default: 1000)'
     )
     
     args = parser.parse_args()
+    if args.max_history < 1:
+        parser.error("--max-history must be at least 1")
     
-    renderer = VectorMapRenderer(enable_3d=args.__dict__['3d'], max_history=args.max_history)
-    return renderer.run(args.connection_string)
+    renderer = VectorMapRenderer(enable_3d=args.three_d, max_history=args.max_history)
+    return renderer.run(args.connection_string, animated=args.animate)
 
 
 if __name__ == "__main__":
@@ -19,8 +19,8 @@ Requirements:
 
 import sys
 import os
-import time
 import signal
+import asyncio
 import argparse
 from datetime import datetime
 
@@ -47,14 +47,20 @@ def setup_sdk_import():
 # Setup SDK import
 AuroraSDK, AuroraSDKError = setup_sdk_import()
 
-# Global flag for Ctrl+C handling
-is_ctrl_c = False
+# Set on Ctrl+C; created by main() inside the running event loop
+ctrl_c_event = None
 
-def signal_handler(sig, frame):
-    """Handle Ctrl+C signal."""
-    global is_ctrl_c
-    print("\\nCtrl-C pressed, aborting operation...")
-    is_ctrl_c = True
+def install_ctrl_c_handler(loop, event):
+    """Route Ctrl+C to an asyncio event so pending waits wake up immediately."""
+    def on_ctrl_c():
+        print("\nCtrl-C pressed, aborting operation...")
+        event.set()
+    
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_ctrl_c)
+    except (NotImplementedError, RuntimeError):
+        # Event loops on Windows do not support add_signal_handler
+        signal.signal(signal.SIGINT, lambda sig, frame: loop.call_soon_threadsafe(on_ctrl_c))
 
 def discover_and_select_device(sdk):
     """Discover and select Aurora device."""
@@ -79,45 +85,78 @@ def discover_and_select_device(sdk):
     
     return selected_device
 
+# Static prefix of the progress line, pre-encoded once; the line buffer is reused across polls
+_STATUS_PREFIX = b"\rProgress: "
+_progress_line = bytearray(_STATUS_PREFIX)
+
+# Last progress line written; polls that would not change the 0.1% display are skipped
+_last_progress = None
+
 def progress_callback(status):
     """Progress callback for map storage operations."""
-    print(f"\rProgress: {status.progress:.1f}% [{status.get_status_string()}]", end="", flush=True)
+    global _last_progress
+    progress_key = (round(status.progress, 1), status.get_status_string())
+    if progress_key == _last_progress:
+        return
+    _last_progress = progress_key
+    line = f"{progress_key[0]:5.1f}% [{progress_key[1]}]"
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        # stdout replaced by a text-only stream (e.g. an IDE console)
+        print(f"\rProgress: {line}", end="", flush=True)
+        return
+    sys.stdout.flush()
+    _progress_line[len(_STATUS_PREFIX):] = line.encode('ascii', 'replace')
+    out.write(_progress_line)
+    out.flush()
 
-def download_vslam_map(sdk, map_file):
-    """Download VSLAM map from Aurora device."""
-    print(f"Downloading VSLAM map to {map_file}")
+async def _run_map_session(map_manager, map_file, start_fn, verb):
+    """Run a map storage session started by start_fn and monitor it until completion.
     
-    # Use MapManager for async map download
-    map_manager = sdk.map_manager
+    Args:
+        map_manager: MapManager of the connected SDK
+        map_file: Local map file path
+        start_fn: map_manager.start_download_session or map_manager.start_upload_session
+        verb: 'download' or 'upload', used in log messages
+    """
+    global _last_progress
+    
+    # SDK calls block, run them in the default executor to keep the event loop responsive
+    loop = asyncio.get_event_loop()
+    _last_progress = None
     
     try:
-        # Start download session
-        if not map_manager.start_download_session(map_file):
-            print("Failed to start download session")
+        # Start session
+        if not await loop.run_in_executor(None, start_fn, map_file):
+            print(f"Failed to start {verb} session")
             return False
         
         # Monitor progress until completion
-        while map_manager.is_session_active():
-            if is_ctrl_c:
-                print("\nAborting download session...")
+        while await loop.run_in_executor(None, map_manager.is_session_active):
+            if ctrl_c_event.is_set():
+                print(f"\nAborting {verb} session...")
                 map_manager.abort_session()
                 return False
             
             # Get and display progress
             try:
-                status = map_manager.query_session_status()
+                status = await loop.run_in_executor(None, map_manager.query_session_status)
                 progress_callback(status)
             except Exception as e:
                 print(f"\nFailed to query session status: {e}")
                 return False
             
-            time.sleep(1)
+            # Wait for the next poll, waking up at once on Ctrl+C
+            try:
+                await asyncio.wait_for(ctrl_c_event.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
         
         # Session is no longer active, determine final result
         try:
-            final_status = map_manager.query_session_status()
+            final_status = await loop.run_in_executor(None, map_manager.query_session_status)
             result = final_status.is_finished()
-            print(f"\nDownloading VSLAM map {'succeeded' if result else 'failed'}")
+            print(f"\n{verb.capitalize()}ing VSLAM map {'succeeded' if result else 'failed'}")
             
             # If failed, show more info
             if not result:
@@ -129,64 +168,33 @@ def download_vslam_map(sdk, map_file):
         return result
         
     except Exception as e:
-        print(f"\nDownload failed: {e}")
+        print(f"\n{verb.capitalize()} failed: {e}")
         import traceback
         traceback.print_exc()
         return False
 
-def upload_vslam_map(sdk, map_file):
+async def download_vslam_map(sdk, map_file):
+    """Download VSLAM map from Aurora device."""
+    print(f"Downloading VSLAM map to {map_file}")
+    
+    # Use MapManager for async map download
+    map_manager = sdk.map_manager
+    return await _run_map_session(map_manager, map_file, map_manager.start_download_session, 'download')
+
+async def upload_vslam_map(sdk, map_file):
     """Upload VSLAM map to Aurora device."""
     print(f"Uploading VSLAM map from {map_file}")
     
-    # Check if file exists
-    if not os.path.exists(map_file):
+    # Check if file exists (single stat call)
+    try:
+        os.stat(map_file)
+    except FileNotFoundError:
         print(f"Error: Map file '{map_file}' does not exist")
         return False
     
     # Use MapManager for async map upload
     map_manager = sdk.map_manager
-    
-    try:
-        # Start upload session
-        if not map_manager.start_upload_session(map_file):
-            print("Failed to start upload session")
-            return False
-        
-        # Monitor progress until completion
-        while map_manager.is_session_active():
-            if is_ctrl_c:
-                print("\nAborting upload session...")
-                map_manager.abort_session()
-                return False
-            
-            # Get and display progress
-            try:
-                status = map_manager.query_session_status()
-                progress_callback(status)
-            except Exception as e:
-                print(f"\nFailed to query session status: {e}")
-                return False
-            
-            time.sleep(1)
-        
-        # Session is no longer active, determine final result
-        try:
-            final_status = map_manager.query_session_status()
-            result = final_status.is_finished()
-            print(f"\nUploading VSLAM map {'succeeded' if result else 'failed'}")
-            
-            # If failed, show more info
-            if not result:
-                print(f"Final status: {final_status.get_status_string()}, progress: {final_status.progress}%")
-        except Exception as e:
-            print(f"\nFailed to determine final result: {e}")
-            result = False
-        
-        return result
-        
-    except Exception as e:
-        print(f"\nUpload failed: {e}")
-        return False
+    return await _run_map_session(map_manager, map_file, map_manager.start_upload_session, 'upload')
 
 def show_help():
     """Show usage help."""
@@ -255,12 +263,14 @@ Examples:
     
     return args
 
-def main():
+async def main():
     """Main function."""
-    global is_ctrl_c
+    global ctrl_c_event
     
     # Set up signal handler for Ctrl+C
-    signal.signal(signal.SIGINT, signal_handler)
+    loop = asyncio.get_event_loop()
+    ctrl_c_event = asyncio.Event()
+    install_ctrl_c_handler(loop, ctrl_c_event)
     
     # Parse command line arguments
     args = parse_arguments()
@@ -286,34 +296,38 @@ def main():
         if args.server:
             # Connect to specific device
             print(f"Connecting to device at {args.server}...")
-            sdk.connect(connection_string=args.server)
+            await loop.run_in_executor(None, lambda: sdk.connect(connection_string=args.server))
             print("Connected successfully!")
         else:
             # Discover and connect to first available device
-            device_info = discover_and_select_device(sdk)
+            device_info = await loop.run_in_executor(None, discover_and_select_device, sdk)
             if not device_info:
                 print("No Aurora devices found. Please ensure device is powered on and network accessible.")
                 return 1
             
             print("Connecting to discovered device...")
-            sdk.connect(device_info=device_info)
+            await loop.run_in_executor(None, lambda: sdk.connect(device_info=device_info))
             print("Connected successfully!")
         
         # Perform requested operation
         success = False
         if args.download:
-            success = download_vslam_map(sdk, args.map_file)
+            success = await download_vslam_map(sdk, args.map_file)
         elif args.upload:
-            success = upload_vslam_map(sdk, args.map_file)
+            success = await upload_vslam_map(sdk, args.map_file)
         
         # Display results
         print("\n" + "=" * 60)
         if success:
             operation = "Download" if args.download else "Upload"
             print(f"{operation} completed successfully!")
-            if args.download and os.path.exists(args.map_file):
-                file_size = os.path.getsize(args.map_file)
-                print(f"Map file size: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
+            if args.download:
+                try:
+                    file_size = os.stat(args.map_file).st_size
+                except FileNotFoundError:
+                    file_size = None
+                if file_size is not None:
+                    print(f"Map file size: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
         else:
             print("Operation failed!")
         print("=" * 60)
@@ -340,4 +354,4 @@ def main():
             pass
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
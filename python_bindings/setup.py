@@ -8,8 +8,10 @@ the native Aurora SDK dynamic libraries for specific platforms.
 
 import os
 import sys
+import itertools
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from setuptools import setup, find_packages
 
@@ -19,10 +21,10 @@ def get_version():
     version_file = Path(__file__).parent.parent / "cpp_sdk" / "aurora_remote_public" / "version.txt"
     if version_file.exists():
         with open(version_file, 'r') as f:
-            lines = f.readlines()
-            # Version is on the 4th line
-            if len(lines) >= 4:
-                version_line = lines[3].strip()
+            # Version is on the 4th line, read only up to it
+            version_line = next(itertools.islice(f, 3, 4), None)
+            if version_line is not None:
+                version_line = version_line.strip()
                 # Extract version number and convert to PEP 440 format
                 # "2.0.0-alpha" -> "2.0.0a0"
                 # "2.0.0-beta" -> "2.0.0b0"
@@ -63,6 +65,10 @@ AUTHOR_EMAIL = "support@slamtec.com"
 URL = "https://github.com/SLAMTEC/Aurora-Remote-Python-SDK"
 
 
+# Native library file patterns shipped in the package lib/ directory
+NATIVE_LIBRARY_PATTERNS = ("*.so", "*.dll", "*.dylib")
+
+
 def get_platform_info():
     """Get platform and architecture information."""
     system = platform.system().lower()
@@ -117,25 +123,69 @@ def check_native_library():
     return True
 
 
+def _copy_native_library(src_file, dst_file):
+    """Copy a native library, using in-kernel copy_file_range() where available."""
+    copied_all = False
+    if hasattr(os, "copy_file_range"):
+        remaining = os.stat(src_file).st_size
+        src_fd = os.open(src_file, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                copied_all = remaining == 0
+            except OSError:
+                # Unsupported by the kernel or filesystem pair (e.g. EXDEV, ENOSYS)
+                pass
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    if not copied_all:
+        shutil.copyfile(src_file, dst_file)
+    shutil.copystat(src_file, dst_file)
+
+
+def _library_fingerprint(path):
+    """Return a (size, mtime) fingerprint of a file, or None if it does not exist.
+    
+    The copy preserves mtime (copystat), so an unchanged destination matches its source.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, int(st.st_mtime)
+
+
 def copy_native_libraries(target_platform=None):
     """Copy native libraries to the package directory.
     
     Args:
-        target_platform: Specific platform to build for (e.g., 'linux_x86_64', 'linux_aarch64', 'win64')
+        target_platform: Specific platform to build for (e.g., 'linux_x86_64', 'linux_aarch64', 'win64'),
+                        or a list of platforms for a multi-platform package, in which case each library
+                        is copied to lib/<platform>/ and the copies run in parallel.
                         If None, builds for current platform.
+    
+    Returns:
+        List of copied library paths, relative to the package directory.
     """
     # Determine target directory within the package
     package_dir = Path(__file__).parent / "slamtec_aurora_sdk"
     lib_dir = package_dir / "lib"
     
-    # Clean and create lib directory
-    if lib_dir.exists():
-        shutil.rmtree(lib_dir)
+    # Create lib directory; existing contents are reconciled below instead of being wiped
     lib_dir.mkdir(exist_ok=True)
     
     # Create __init__.py to make this a proper Python package (silences setuptools warnings)
     init_file = lib_dir / "__init__.py"
-    init_file.write_text('"""\nNative library package for Aurora SDK.\nThis package contains platform-specific native libraries.\n"""\n')
+    init_text = '"""\nNative library package for Aurora SDK.\nThis package contains platform-specific native libraries.\n"""\n'
+    if not init_file.exists() or init_file.read_text() != init_text:
+        init_file.write_text(init_text)
     
     # Source directory for native libraries
     cpp_lib_dir = Path(__file__).parent.parent / "cpp_sdk" / "aurora_remote_public" / "lib"
@@ -149,21 +199,14 @@ def copy_native_libraries(target_platform=None):
         "macos_x86_64": "libslamtec_aurora_remote_sdk.dylib"
     }
     
-    if target_platform:
+    if isinstance(target_platform, (list, tuple)):
+        # Build for several target platforms, one lib/<platform>/ directory each
+        target_platforms = list(target_platform)
+        per_platform_dirs = True
+    elif target_platform:
         # Build for specific target platform
-        if target_platform not in platform_lib_mapping:
-            raise ValueError(f"Unsupported target platform: {target_platform}")
-        
-        lib_name = platform_lib_mapping[target_platform]
-        src_dir = cpp_lib_dir / target_platform
-        src_file = src_dir / lib_name
-        dst_file = lib_dir / lib_name
-        
-        if src_file.exists():
-            shutil.copy2(src_file, dst_file)
-            print(f"Copied {src_file} -> {dst_file}")
-        else:
-            raise FileNotFoundError(f"Native library not found for {target_platform} at {src_file}")
+        target_platforms = [target_platform]
+        per_platform_dirs = False
     else:
         # Build for current platform
         system, arch = get_platform_info()
@@ -177,16 +220,51 @@ def copy_native_libraries(target_platform=None):
         else:
             raise RuntimeError(f"Unsupported current platform: {system}")
         
-        lib_name = platform_lib_mapping[current_platform]
-        src_dir = cpp_lib_dir / current_platform
-        src_file = src_dir / lib_name
-        dst_file = lib_dir / lib_name
+        target_platforms = [current_platform]
+        per_platform_dirs = False
+    
+    copy_jobs = []
+    for platform_name in target_platforms:
+        if platform_name not in platform_lib_mapping:
+            raise ValueError(f"Unsupported target platform: {platform_name}")
         
-        if src_file.exists():
-            shutil.copy2(src_file, dst_file)
-            print(f"Copied {src_file} -> {dst_file}")
-        else:
-            raise FileNotFoundError(f"Native library not found for current platform {current_platform} at {src_file}")
+        lib_name = platform_lib_mapping[platform_name]
+        src_file = cpp_lib_dir / platform_name / lib_name
+        dst_file = (lib_dir / platform_name if per_platform_dirs else lib_dir) / lib_name
+        
+        if not src_file.exists():
+            raise FileNotFoundError(f"Native library not found for {platform_name} at {src_file}")
+        copy_jobs.append((src_file, dst_file))
+    
+    # Remove stale libraries left over from a previous build for other platforms
+    expected_files = {dst_file for _, dst_file in copy_jobs}
+    for pattern in NATIVE_LIBRARY_PATTERNS:
+        for stale_file in list(lib_dir.glob(pattern)) + list(lib_dir.glob("*/" + pattern)):
+            if stale_file not in expected_files:
+                stale_file.unlink()
+                print(f"Removed stale {stale_file}")
+    for platform_dir in lib_dir.iterdir():
+        if platform_dir.is_dir() and platform_dir.name != "__pycache__" and not any(platform_dir.iterdir()):
+            platform_dir.rmdir()
+    
+    def copy_one(job):
+        src_file, dst_file = job
+        dst_file.parent.mkdir(exist_ok=True)
+        if _library_fingerprint(dst_file) == _library_fingerprint(src_file):
+            return f"Up to date {dst_file}"
+        _copy_native_library(src_file, dst_file)
+        return f"Copied {src_file} -> {dst_file}"
+    
+    if len(copy_jobs) > 1:
+        # Copies are I/O bound; run them in parallel
+        with ThreadPoolExecutor(max_workers=len(copy_jobs)) as executor:
+            messages = list(executor.map(copy_one, copy_jobs))
+    else:
+        messages = [copy_one(job) for job in copy_jobs]
+    for message in messages:
+        print(message)
+    
+    return [dst_file.relative_to(package_dir).as_posix() for _, dst_file in copy_jobs]
 
 
 def get_supported_platforms():
@@ -238,18 +316,28 @@ if __name__ == "__main__":
     if not target_platform:
         target_platform = os.environ.get("AURORA_TARGET_PLATFORM", None)
     
+    # A comma-separated list builds one package bundling several platforms
+    if target_platform and "," in target_platform:
+        target_platform = [name.strip() for name in target_platform.split(",") if name.strip()]
+    
     # Determine package name and platform info
     if target_platform:
-        # Building for specific target platform
-        package_name = f"{PACKAGE_NAME}-{target_platform.replace('_', '-')}"
-        print(f"Building platform-specific package for target: {target_platform}")
+        if isinstance(target_platform, list):
+            # Building for several target platforms
+            package_name = f"{PACKAGE_NAME}-multiplatform"
+            print(f"Building multi-platform package for targets: {', '.join(target_platform)}")
+        else:
+            # Building for specific target platform
+            package_name = f"{PACKAGE_NAME}-{target_platform.replace('_', '-')}"
+            print(f"Building platform-specific package for target: {target_platform}")
         
-        # Validate target platform exists
+        # Validate target platforms exist
         cpp_lib_dir = Path(__file__).parent.parent / "cpp_sdk" / "aurora_remote_public" / "lib"
-        if not (cpp_lib_dir / target_platform).exists():
-            print(f"Error: Target platform {target_platform} not found in {cpp_lib_dir}")
-            print(f"Available platforms: {get_supported_platforms()}")
-            sys.exit(1)
+        for platform_name in (target_platform if isinstance(target_platform, list) else [target_platform]):
+            if not (cpp_lib_dir / platform_name).exists():
+                print(f"Error: Target platform {platform_name} not found in {cpp_lib_dir}")
+                print(f"Available platforms: {get_supported_platforms()}")
+                sys.exit(1)
     else:
         # Building for current platform
         system, arch = get_platform_info()
@@ -265,7 +353,7 @@ if __name__ == "__main__":
             sys.exit(1)
     
     # Copy native libraries to package
-    copy_native_libraries(target_platform=target_platform)
+    native_libraries = copy_native_libraries(target_platform=target_platform)
     
     # Read package requirements
     install_requires = read_requirements()
@@ -288,13 +376,9 @@ if __name__ == "__main__":
         packages=find_packages(where="."),
         package_dir={},
         
-        # Include package data (native libraries)
+        # Include package data (exactly the native libraries copied for the target platform(s))
         package_data={
-            "slamtec_aurora_sdk": [
-                "lib/*.so",        # Include .so files directly in lib/
-                "lib/*.dll",       # Include .dll files directly in lib/
-                "lib/*.dylib",     # Include .dylib files directly in lib/
-            ],
+            "slamtec_aurora_sdk": native_libraries,
         },
         # Exclude files we don't want in the package
         exclude_package_data={
@@ -347,7 +431,9 @@ if __name__ == "__main__":
     print("SLAMTEC Aurora Python SDK Build Complete!")
     print("="*60)
     print(f"Package: {package_name} v{VERSION}")
-    if target_platform:
+    if isinstance(target_platform, list):
+        print(f"Target Platforms: {', '.join(target_platform)}")
+    elif target_platform:
         print(f"Target Platform: {target_platform}")
     else:
         print(f"Platform: {system} {arch}")
@@ -13,6 +13,8 @@ Architecture:
 - LIDAR2DMapBuilder: CoMap (2D LIDAR mapping) operations
 """
 
+import importlib
+
 # Component-based SDK with convenience methods
 from .aurora_sdk import AuroraSDK
 
@@ -25,7 +27,14 @@ from .enhanced_imaging import EnhancedImaging
 from .data_recorder import DataRecorder
 
 # Data types and exceptions
-from .data_types import *
+from . import data_types
+from .data_types import (
+    Pose, PoseSE3, DeviceInfo, DeviceBasicInfo, ImageFrame, ImageFrameView, TrackingFrame,
+    ScanData, GlobalMappingInfo,
+    CameraCalibrationInfo, TransformCalibrationInfo,
+    ENHANCED_IMAGE_TYPE_DEPTH, ENHANCED_IMAGE_TYPE_SEMANTIC_SEGMENTATION,
+    DEPTHCAM_FRAME_TYPE_DEPTH_MAP, DEPTHCAM_FRAME_TYPE_POINT3D,
+)
 from .exceptions import *
 
 __version__ = "2.0.0"
@@ -53,11 +62,12 @@ __all__ = [
     'PoseSE3', 
     'DeviceInfo',
     'ImageFrame',
+    'ImageFrameView',
     'TrackingFrame',
     'ScanData',
+    'GlobalMappingInfo',
     
     # Enhanced Imaging data types (SDK 2.0)
-    'SemanticSegmentationFrame',
     'CameraCalibrationInfo',
     'TransformCalibrationInfo',
     
@@ -71,4 +81,18 @@ __all__ = [
     
     # Device capability checking (SDK 2.0)
     'DeviceBasicInfo'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve names lazily (PEP 562).
+
+    The optional helpers in ``utils`` (NumPy/OpenCV based) are only imported
+    when accessed, and the remaining public names of ``data_types`` are still
+    reachable as package attributes.
+    """
+    if name == 'utils':
+        return importlib.import_module('.utils', __name__)
+    if not name.startswith('_') and hasattr(data_types, name):
+        return getattr(data_types, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
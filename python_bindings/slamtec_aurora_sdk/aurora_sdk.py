@@ -4,6 +4,11 @@ Aurora SDK v2 - Component-based architecture.
 This is the new component-based implementation following C++ SDK patterns.
 """
 
+import os
+import shutil
+import threading
+import weakref
+
 from .controller import Controller
 from .data_provider import DataProvider
 from .map_manager import MapManager
@@ -11,7 +16,9 @@ from .lidar_2d_map_builder import LIDAR2DMapBuilder
 from .floor_detector import FloorDetector
 from .enhanced_imaging import EnhancedImaging
 from .data_recorder import DataRecorder
-from .exceptions import AuroraSDKError
+from .exceptions import AuroraSDKError, InvalidArgumentError
+from .data_types import np, NUMPY_AVAILABLE, DATARECORDER_TYPE_RAW_DATASET
+from .c_bindings import READINESS_FLAG_NAMES
 
 
 class AuroraSDK:
@@ -47,22 +54,40 @@ class AuroraSDK:
         # Create core controller
         self._controller = Controller()
         
+        # Disconnect and release the session when the SDK object is collected
+        self._finalizer = weakref.finalize(self, AuroraSDK._finalize_controller, self._controller)
+        
         # Create session automatically - one session per SDK object
         try:
             self._controller.create_session()
         except Exception as e:
             raise AuroraSDKError("Failed to initialize Aurora SDK session: {}".format(e))
         
-        # Create components that depend on controller
-        self._data_provider = DataProvider(self._controller)
-        self._map_manager = MapManager(self._controller)
-        self._lidar_2d_map_builder = LIDAR2DMapBuilder(self._controller)
-        self._enhanced_imaging = EnhancedImaging(self._controller)
-        self._floor_detector = FloorDetector(self._controller)
-        self._data_recorder = DataRecorder(self._controller)
+        # Resolved once by the controller and shared with every component
+        self._c_bindings = self._controller._c_bindings
+        
+        # Components that depend on controller are created on first access
+        self._data_provider = None
+        self._map_manager = None
+        self._lidar_2d_map_builder = None
+        self._enhanced_imaging = None
+        self._floor_detector = None
+        self._data_recorder = None
 
-        # Set cross-component references
-        self._enhanced_imaging._set_data_provider(self._data_provider)
+        # Bound quaternion conversion, resolved on first use
+        self._cvt_q2e = None
+        
+        # SDK version is immutable for the lifetime of the process
+        self._cached_version = None
+        
+        # Timestamp of the last frame handed out by get_camera_preview_latest()
+        self._last_preview_ts = None
+        
+        # Reused pose buffer for get_current_pose(as_numpy=True)
+        self._pose_buf = None
+        
+        # (thread, stop_event, finalizer) of the running frame callback dispatcher
+        self._frame_dispatch = None
     
     @property
     def controller(self):
@@ -95,6 +120,8 @@ class AuroraSDK:
         Returns:
             DataProvider: DataProvider component instance
         """
+        if self._data_provider is None:
+            self._data_provider = DataProvider(self._controller, self._c_bindings)
         return self._data_provider
     
     @property
@@ -111,6 +138,8 @@ class AuroraSDK:
         Returns:
             MapManager: MapManager component instance
         """
+        if self._map_manager is None:
+            self._map_manager = MapManager(self._controller, self._c_bindings)
         return self._map_manager
     
     @property
@@ -127,6 +156,8 @@ class AuroraSDK:
         Returns:
             LIDAR2DMapBuilder: LIDAR2DMapBuilder component instance
         """
+        if self._lidar_2d_map_builder is None:
+            self._lidar_2d_map_builder = LIDAR2DMapBuilder(self._controller, self._c_bindings)
         return self._lidar_2d_map_builder
     
     @property
@@ -142,6 +173,8 @@ class AuroraSDK:
         Returns:
             FloorDetector: FloorDetector component instance
         """
+        if self._floor_detector is None:
+            self._floor_detector = FloorDetector(self._controller, self._c_bindings)
         return self._floor_detector
     
     @property
@@ -160,6 +193,12 @@ class AuroraSDK:
         Returns:
             EnhancedImaging: EnhancedImaging component instance
         """
+        if self._enhanced_imaging is None:
+            enhanced_imaging = EnhancedImaging(self._controller, self._c_bindings)
+            # Set cross-component references before publishing, so a failure
+            # here never leaves a half-wired component behind
+            enhanced_imaging._set_data_provider(self.data_provider)
+            self._enhanced_imaging = enhanced_imaging
         return self._enhanced_imaging
 
     @property
@@ -176,6 +215,8 @@ class AuroraSDK:
         Returns:
             DataRecorder: DataRecorder component instance
         """
+        if self._data_recorder is None:
+            self._data_recorder = DataRecorder(self._controller, self._c_bindings)
         return self._data_recorder
 
     def __enter__(self):
@@ -186,21 +227,26 @@ class AuroraSDK:
         """Context manager exit with automatic cleanup."""
         self._cleanup()
     
-    def __del__(self):
-        """Destructor to ensure proper cleanup when object is garbage collected."""
-        self._cleanup()
-    
-    def _cleanup(self):
-        """Internal cleanup method called by both __exit__ and __del__."""
+    @staticmethod
+    def _finalize_controller(controller):
+        """Disconnect and release the session of a controller; run by the finalizer."""
         try:
-            if hasattr(self, '_controller') and self._controller:
-                if self._controller.is_connected():
-                    self._controller.disconnect()
-                self._controller.release_session()
+            if controller.is_connected():
+                controller.disconnect()
+            controller.release_session()
         except Exception:
             # Suppress exceptions during cleanup to avoid issues during garbage collection
             pass
     
+    def _cleanup(self):
+        """Internal cleanup method called by __exit__ and release()."""
+        self.unregister_frame_callback()
+        if self._enhanced_imaging is not None:
+            self._enhanced_imaging.release()
+        # Not routed through the finalizer so a session re-created afterwards
+        # is still released when the SDK object is collected
+        AuroraSDK._finalize_controller(self._controller)
+    
     # Convenience helper methods for ease of use
     def create_session(self):
         """
@@ -231,8 +277,10 @@ class AuroraSDK:
         return self.controller.connect(device_info, connection_string)
     
     def disconnect(self):
-        """Convenience helper: Disconnect from current device."""
-        return self.controller.disconnect()
+        """Convenience helper: Disconnect from current device (no-op if not connected)."""
+        if not self._controller.is_connected():
+            return
+        return self._controller.disconnect()
     
     def is_connected(self):
         """
@@ -241,7 +289,8 @@ class AuroraSDK:
         Returns:
             bool: True if connected, False otherwise
         """
-        return self.controller.is_connected()
+        # Answered from the controller's connection state; no native call
+        return self._controller.is_connected()
     
     def discover_devices(self, timeout=10.0):
         """
@@ -264,13 +313,18 @@ class AuroraSDK:
         """
         return self.controller.get_version_info()
     
-    def connect_and_start(self, connection_string=None, auto_discover=True):
+    def connect_and_start(self, connection_string=None, auto_discover=True, devices=None):
         """
         Convenience method to create session and connect to device.
         
+        On failure only the device connection is dropped; the session and
+        components stay alive so the call can simply be retried.
+        
         Args:
             connection_string: Optional specific device to connect to
             auto_discover: If True, discover devices if connection_string not provided
+            devices: Optional device list from a previous discover_devices() call,
+                     used instead of running discovery again
             
         Returns:
             bool: True if successfully connected
@@ -284,9 +338,10 @@ class AuroraSDK:
             if connection_string:
                 # Try to connect to specific device
                 self.connect(connection_string=connection_string)
-            elif auto_discover:
+            elif devices or auto_discover:
                 # Discover and connect to first available device
-                devices = self.discover_devices(timeout=5.0)
+                if not devices:
+                    devices = self.controller.discover_devices_until_first(5.0)
                 if not devices:
                     raise AuroraSDKError("No Aurora devices found")
                 
@@ -298,8 +353,11 @@ class AuroraSDK:
             return True
             
         except Exception as e:
-            # Cleanup on failure
-            self._cleanup()
+            # Drop the connection only; keep the session for a retry
+            try:
+                self._controller.disconnect()
+            except Exception:
+                pass
             raise AuroraSDKError("Failed to connect and start: {}".format(e))
     
     def get_device_status(self):
@@ -309,21 +367,45 @@ class AuroraSDK:
         Returns:
             dict: Device status including connection state, device info, etc.
         """
+        if self._cached_version is None:
+            self._cached_version = self.get_version_info()
+        
+        controller = self._controller
         status = {
-            'connected': self.is_connected(),
-            'session_active': self.controller.session_handle is not None,
+            'connected': controller.is_connected(),
+            'session_active': controller.session_handle is not None,
             'device_info': None,
-            'sdk_version': self.get_version_info()
+            'sdk_version': dict(self._cached_version)
         }
         
         if status['connected']:
             try:
-                status['device_info'] = self.controller.get_device_info()
-            except:
+                status['device_info'] = controller.get_device_info()
+            except AuroraSDKError:
                 status['device_info'] = None
         
         return status
     
+    def get_readiness_flags(self):
+        """
+        Get the connection, subscription and enhanced imaging readiness flags at once.
+        
+        Intended for UI and state-machine loops that would otherwise poll
+        is_device_connection_alive, is_raw_data_subscribed,
+        is_enhanced_imaging_subscribed and the depth camera / semantic
+        segmentation readiness checks one by one.
+        
+        Returns:
+            dict: Booleans keyed by 'connection_alive', 'raw_data_subscribed',
+                  'depth_camera_subscribed', 'semantic_segmentation_subscribed',
+                  'depth_camera_ready' and 'semantic_segmentation_ready';
+                  all False when not connected
+        """
+        controller = self._controller
+        if not controller.is_connected():
+            return dict.fromkeys(READINESS_FLAG_NAMES, False)
+        return self._c_bindings.get_readiness_flags(controller.session_handle)
+    
     def quick_start_preview(self, connection_string=None):
         """
         Quick start method for camera preview applications.
@@ -334,11 +416,18 @@ class AuroraSDK:
         Returns:
             bool: True if successfully started
         """
+        # A failed connect leaves the controller disconnected and the session
+        # valid, so there is nothing to clean up here
         try:
-            self.connect_and_start(connection_string)
-            return True
-        except Exception:
-            return False
+            if connection_string:
+                self._controller.connect(connection_string=connection_string)
+            else:
+                devices = self._controller.discover_devices_until_first(5.0)
+                if devices:
+                    self._controller.connect(device_info=devices[0])
+        except AuroraSDKError:
+            pass
+        return self._controller.is_connected()
     
     def release(self):
         """
@@ -346,7 +435,10 @@ class AuroraSDK:
         
         This method provides a simple way to cleanup the SDK session,
         disconnecting from the device if connected and releasing the session.
+        Calling it again after the session is released does nothing.
         """
+        if self._controller.session_handle is None and self._frame_dispatch is None:
+            return
         self._cleanup()
     
     def get_device_info(self):
@@ -358,13 +450,16 @@ class AuroraSDK:
         """
         return self.controller.get_device_info()
     
-    def get_current_pose(self, use_se3=False):
+    def get_current_pose(self, use_se3=False, as_numpy=False):
         """
         Convenience helper: Get current device pose with timestamp.
         
         Args:
             use_se3: If True, return pose in SE3 format (position + quaternion)
                     If False, return pose in Euler format (position + roll/pitch/yaw)
+            as_numpy: If True, return position and rotation as float64 NumPy views
+                    of a buffer the SDK writes into directly. The buffer is reused,
+                    so the views are overwritten by the next as_numpy call.
                     
         Returns:
             tuple: (position, rotation, timestamp_ns) where:
@@ -373,25 +468,67 @@ class AuroraSDK:
                            (roll, pitch, yaw) Euler angles if use_se3=False
                 - timestamp_ns: timestamp in nanoseconds
         """
-        return self.data_provider.get_current_pose(use_se3)
+        if not as_numpy:
+            return self.data_provider.get_current_pose(use_se3)
+        
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy pose retrieval")
+        
+        pose_buf = self._pose_buf
+        if pose_buf is None:
+            pose_buf = self._pose_buf = np.zeros(7, dtype=np.float64)
+        timestamp_ns = self.data_provider.get_current_pose_into(pose_buf, use_se3)
+        return pose_buf[:3], pose_buf[3:7] if use_se3 else pose_buf[3:6], timestamp_ns
     
-    def get_tracking_frame(self):
+    def get_tracking_frame(self, copy=True, keypoints_as_numpy=False):
         """
         Convenience helper: Get tracking frame with images and keypoints.
         
+        Args:
+            copy (bool): If False, return ImageFrameView objects whose data is a
+                memoryview over a buffer owned by the frame instead of
+                ImageFrame objects holding bytes
+            keypoints_as_numpy (bool): If True, return the keypoints as NumPy
+                record arrays (fields x, y, flags) instead of Keypoint lists
+        
         Returns:
             TrackingFrame object with left/right images and keypoints
         """
-        return self.data_provider.get_tracking_frame()
+        return self.data_provider.get_tracking_frame(copy=copy, keypoints_as_numpy=keypoints_as_numpy)
     
-    def get_camera_preview(self):
+    def get_camera_preview(self, copy=True):
         """
         Convenience helper: Get camera preview images.
         
+        Args:
+            copy (bool): If False, return ImageFrameView objects whose data is a
+                memoryview over a buffer owned by the frame instead of bytes
+        
         Returns:
-            tuple: (left_image, right_image) as ImageFrame objects
+            tuple: (left_image, right_image) as ImageFrame (or ImageFrameView) objects
         """
-        return self.data_provider.get_camera_preview()
+        return self.data_provider.get_camera_preview(copy=copy)
+    
+    def get_camera_preview_latest(self, copy=True):
+        """
+        Convenience helper: Get the newest camera preview, skipping stale frames.
+        
+        The SDK keeps only its most recent preview rather than a queue, so the
+        newest frame is requested directly. If it is the same frame this
+        method returned last time, None is returned instead of a duplicate.
+        
+        Args:
+            copy (bool): If False, return ImageFrameView objects whose data is a
+                memoryview over a buffer owned by the frame instead of bytes
+        
+        Returns:
+            tuple: (left_image, right_image), or None if no newer frame has arrived
+        """
+        left, right = self.data_provider.get_camera_preview(timestamp_ns=0, copy=copy)
+        if left.timestamp_ns == self._last_preview_ts:
+            return None
+        self._last_preview_ts = left.timestamp_ns
+        return left, right
     
     def get_map_info(self):
         """
@@ -402,17 +539,142 @@ class AuroraSDK:
         """
         return self.data_provider.get_global_mapping_info()
     
-    def get_recent_lidar_scan(self, max_points=8192):
+    def get_recent_lidar_scan(self, max_points=8192, out=None):
         """
         Convenience helper: Get recent LiDAR scan data.
         
         Args:
             max_points: Maximum number of scan points to retrieve
+            out: Optional C-contiguous NumPy array with the LidarScanPoint dtype
+                (np.dtype(LidarScanPoint)) to reuse across calls. The scan's
+                points are then a view of it and are overwritten by the next
+                call that passes the same array.
+        
+        Returns:
+            LidarScanData object with scan points and metadata
+        """
+        return self.data_provider.get_recent_lidar_scan(max_points, out=out)
+    
+    def get_recent_lidar_scan_latest(self, max_points=8192, out=None):
+        """
+        Convenience helper: Get the newest LiDAR scan the SDK has received.
+        
+        Same as get_recent_lidar_scan(), but asks the SDK for its latest scan
+        instead of the most recently published one.
+        
+        Args:
+            max_points: Maximum number of scan points to retrieve
+            out: Optional reusable LidarScanPoint array, as for get_recent_lidar_scan()
         
         Returns:
             LidarScanData object with scan points and metadata
         """
-        return self.data_provider.get_recent_lidar_scan(max_points)
+        return self.data_provider.get_recent_lidar_scan(max_points, out=out, force_latest=True)
+    
+    FRAME_TYPES = ('pose', 'image', 'lidar')
+    
+    def register_frame_callback(self, cb, frame_types=('pose', 'image'), poll_interval=0.005):
+        """
+        Convenience helper: Deliver new frames to a callback from a background thread.
+        
+        The SDK exposes no push notifications or blocking waits for pose, camera
+        preview or LiDAR data (only the enhanced imaging streams have
+        wait_*_next_frame), so a dispatcher thread polls the latest data every
+        poll_interval seconds and calls cb only when a frame with a new
+        timestamp arrives. Each poll is a cheap peek of the most recent frame,
+        so the default 5 ms interval keeps latency low at negligible cost:
+        - cb('pose', (position, quaternion, timestamp_ns))
+        - cb('image', (left_image, right_image)) with ImageFrameView objects
+        - cb('lidar', LidarScanData)
+        
+        Registering again replaces the previous callback. Exceptions raised by
+        cb are reported and do not stop the dispatcher.
+        
+        Args:
+            cb: Callable taking (frame_type, data)
+            frame_types: Subset of AuroraSDK.FRAME_TYPES to deliver
+            poll_interval: Delay between polls in seconds
+            
+        Raises:
+            InvalidArgumentError: If an unknown frame type is requested
+        """
+        frame_types = frozenset(frame_types)
+        unknown = frame_types.difference(self.FRAME_TYPES)
+        if unknown:
+            raise InvalidArgumentError("Unknown frame types: {}".format(sorted(unknown)))
+        
+        self.unregister_frame_callback()
+        
+        stop_event = threading.Event()
+        # The thread only holds the data provider, so the SDK object can still be
+        # collected; stop the thread when that happens
+        finalizer = weakref.finalize(self, stop_event.set)
+        thread = threading.Thread(
+            target=AuroraSDK._dispatch_frames,
+            args=(self.data_provider, cb, frame_types, poll_interval, stop_event),
+            name="AuroraFrameDispatcher",
+            daemon=True
+        )
+        self._frame_dispatch = (thread, stop_event, finalizer)
+        thread.start()
+    
+    def unregister_frame_callback(self):
+        """Convenience helper: Stop delivering frames to the registered callback."""
+        if self._frame_dispatch is None:
+            return
+        thread, stop_event, finalizer = self._frame_dispatch
+        self._frame_dispatch = None
+        finalizer.detach()
+        stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join()
+    
+    @staticmethod
+    def _deliver_frame(cb, frame_type, data):
+        """Call cb, reporting instead of propagating its errors."""
+        try:
+            cb(frame_type, data)
+        except Exception as e:
+            print("Warning: Frame callback failed for '{}' frame: {}".format(frame_type, e))
+    
+    @staticmethod
+    def _dispatch_frames(data_provider, cb, frame_types, poll_interval, stop_event):
+        """Poll for new frames and hand them to cb until stop_event is set."""
+        want_pose = 'pose' in frame_types
+        want_image = 'image' in frame_types
+        want_lidar = 'lidar' in frame_types
+        last_pose_ts = last_image_ts = last_scan_ts = None
+        
+        while not stop_event.is_set():
+            if data_provider._controller.is_connected():
+                if want_pose:
+                    try:
+                        pose = data_provider.get_current_pose(use_se3=True)
+                    except AuroraSDKError:
+                        pose = None
+                    if pose is not None and pose[2] != last_pose_ts:
+                        last_pose_ts = pose[2]
+                        AuroraSDK._deliver_frame(cb, 'pose', pose)
+                
+                if want_image:
+                    try:
+                        frames = data_provider.get_camera_preview(copy=False)
+                    except AuroraSDKError:
+                        frames = None
+                    if frames is not None and frames[0].timestamp_ns != last_image_ts:
+                        last_image_ts = frames[0].timestamp_ns
+                        AuroraSDK._deliver_frame(cb, 'image', frames)
+                
+                if want_lidar:
+                    try:
+                        scan = data_provider.get_recent_lidar_scan()
+                    except AuroraSDKError:
+                        scan = None
+                    if scan is not None and scan.timestamp_ns != last_scan_ts:
+                        last_scan_ts = scan.timestamp_ns
+                        AuroraSDK._deliver_frame(cb, 'lidar', scan)
+            
+            stop_event.wait(poll_interval)
     
     def start_lidar_2d_map_preview(self, resolution=0.05):
         """
@@ -438,8 +700,41 @@ class AuroraSDK:
         """
         return self.controller.enable_map_data_syncing(enable)
     
+    def start_recording(self, target_folder, recorder_type=DATARECORDER_TYPE_RAW_DATASET, min_free_gb=0):
+        """
+        Convenience helper: Start recording sensor data into a folder.
+        
+        Creates the folder if needed and, when min_free_gb is given, checks up
+        front that the target file system has that much free space instead of
+        letting a long recording fail part way through.
+        
+        Args:
+            target_folder: Folder where the recorder writes its files
+            recorder_type: DATARECORDER_TYPE_RAW_DATASET (default) or DATARECORDER_TYPE_COLMAP_DATASET
+            min_free_gb: Free space in GiB required on the target file system
+            
+        Raises:
+            AuroraSDKError: If there is not enough free space or recording fails to start
+        """
+        os.makedirs(target_folder, exist_ok=True)
+        if min_free_gb > 0:
+            free = shutil.disk_usage(target_folder).free
+            if free < min_free_gb * 1024 ** 3:
+                raise AuroraSDKError("Not enough free space for recording in {}: {:.1f} GiB available, {} GiB required".format(
+                    target_folder, free / 1024 ** 3, min_free_gb))
+        return self.data_recorder.start_recording(recorder_type, target_folder)
+    
+    def stop_recording(self, recorder_type=DATARECORDER_TYPE_RAW_DATASET):
+        """
+        Convenience helper: Stop an active recording.
+        
+        Args:
+            recorder_type: Type of recorder to stop
+        """
+        return self.data_recorder.stop_recording(recorder_type)
+    
     def get_map_data(self, map_ids=None, fetch_kf=True, fetch_mp=True, fetch_mapinfo=False,
-                     kf_fetch_flags=None, mp_fetch_flags=None):
+                     kf_fetch_flags=None, mp_fetch_flags=None, out=None):
         """
         Convenience helper: Get visual map data (map points and keyframes).
         
@@ -453,6 +748,8 @@ class AuroraSDK:
             fetch_mapinfo: Whether to fetch map info (default: False)
             kf_fetch_flags: Keyframe fetch flags (default: None, uses FETCH_ALL)
             mp_fetch_flags: Map point fetch flags (default: None, uses FETCH_ALL)
+            out: Optional dict of preallocated NumPy arrays ('positions', 'ids',
+                 'map_ids', 'timestamps') to write map points into
         
         Returns:
             dict: Dictionary containing 'map_points', 'keyframes', 'loop_closures', and 'map_info'
@@ -463,7 +760,8 @@ class AuroraSDK:
             fetch_mp=fetch_mp,
             fetch_mapinfo=fetch_mapinfo,
             kf_fetch_flags=kf_fetch_flags,
-            mp_fetch_flags=mp_fetch_flags
+            mp_fetch_flags=mp_fetch_flags,
+            out=out
         )
     
     def require_mapping_mode(self, timeout_ms=10000):
@@ -493,11 +791,34 @@ class AuroraSDK:
             
         Returns:
             tuple: (roll, pitch, yaw) in radians
+        """
+        cvt_q2e = self._cvt_q2e
+        if cvt_q2e is None:
+            cvt_q2e = self._cvt_q2e = self._c_bindings.convert_quaternion_to_euler
+        return cvt_q2e(qx, qy, qz, qw)
+    
+    def convert_quaternions_to_euler(self, q):
+        """
+        Convert a batch of quaternions to Euler angles using NumPy.
+        
+        Args:
+            q: Array-like of shape (N, 4) with rows (qx, qy, qz, qw)
+            
+        Returns:
+            numpy.ndarray: Array of shape (N, 3) with rows (roll, pitch, yaw) in radians
             
         Raises:
-            AuroraSDKError: If conversion fails
+            ImportError: If NumPy is not available
+            InvalidArgumentError: If q does not have shape (N, 4)
         """
-        # Use controller's c_bindings since we don't store our own
-        self.controller._ensure_c_bindings()
-        return self.controller._c_bindings.convert_quaternion_to_euler(qx, qy, qz, qw)
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for batched quaternion conversion")
+        
+        q = np.asarray(q)
+        if q.dtype.kind != 'f':
+            q = q.astype(np.float64)
+        if q.ndim != 2 or q.shape[1] != 4:
+            raise InvalidArgumentError("Expected quaternion array of shape (N, 4), got {}".format(q.shape))
+        
+        return self._c_bindings.convert_quaternion_to_euler_batch(q)
     
@@ -3,18 +3,57 @@ Low-level C bindings for Aurora SDK using ctypes.
 """
 
 import ctypes
+import functools
+import math
 import os
 import platform
+import threading
+import time
 # typing module not available in Python 2.7
 from .data_types import *
-from .exceptions import AuroraSDKError
+from .exceptions import AuroraSDKError, InvalidArgumentError
+
+
+# Pointer types used by the signatures and the hot call paths, built once
+_P_U8 = ctypes.POINTER(ctypes.c_uint8)
+_P_U32 = ctypes.POINTER(ctypes.c_uint32)
+_P_U64 = ctypes.POINTER(ctypes.c_uint64)
+_P_I64 = ctypes.POINTER(ctypes.c_int64)
+_P_INT = ctypes.POINTER(ctypes.c_int)
+_P_SZ = ctypes.POINTER(ctypes.c_size_t)
+_P_F32 = ctypes.POINTER(ctypes.c_float)
+_P_F64 = ctypes.POINTER(ctypes.c_double)
+_P_PoseSE3 = ctypes.POINTER(PoseSE3)
+_P_Pose = ctypes.POINTER(Pose)
+_P_Keypoint = ctypes.POINTER(Keypoint)
+_P_LidarScanPoint = ctypes.POINTER(LidarScanPoint)
+_P_IMUData = ctypes.POINTER(IMUData)
+_P_MapDesc = ctypes.POINTER(MapDesc)
+_P_ImageDesc = ctypes.POINTER(ImageDesc)
+_P_Rect = ctypes.POINTER(Rect)
+_P_ServerConnectionInfo = ctypes.POINTER(ServerConnectionInfo)
+_P_EnhancedImagingFrameDesc = ctypes.POINTER(EnhancedImagingFrameDesc)
+_P_EnhancedImagingFrameBuffer = ctypes.POINTER(EnhancedImagingFrameBuffer)
+_P_GridMapGenerationOptions = ctypes.POINTER(GridMapGenerationOptions)
+_P_FloorDetectionDesc = ctypes.POINTER(FloorDetectionDesc)
+
+
+# Host platform, queried once at import
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
 
 
 def load_aurora_sdk_library():
-    """Load the Aurora SDK dynamic library based on platform."""
-    
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    """Load the Aurora SDK dynamic library based on platform.
+
+    The library is opened once per process; later calls return the same handle.
+    """
+    return _load_aurora_sdk_library(_SYSTEM, _MACHINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_aurora_sdk_library(system, machine):
+    """Locate and open the Aurora SDK library for the given platform."""
     
     # Determine library path based on platform
     if system == "linux":
@@ -36,729 +75,858 @@ def load_aurora_sdk_library():
     # When installed via pip/setup.py, the library should be in the package data
     package_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Try multiple possible locations for the library
-    possible_paths = [
-        # Development setup - library in sibling cpp_sdk directory
-        os.path.join(os.path.dirname(os.path.dirname(package_dir)), lib_path),
-        # Installed package - platform-specific library bundled with package (current platform only build)
-        os.path.join(package_dir, "lib", os.path.basename(lib_path)),
-        # Installed package - universal library bundled with package (all platforms build)
-        os.path.join(package_dir, "lib", lib_path.replace("cpp_sdk/aurora_remote_public/lib/", "")),
-        # Alternative package layout
-        os.path.join(os.path.dirname(package_dir), lib_path),
-        # Windows-specific fallback paths
-        os.path.join(package_dir, "lib", "slamtec_aurora_remote_sdk.dll") if system == "windows" else None,
-        # Linux-specific fallback paths  
-        os.path.join(package_dir, "lib", "libslamtec_aurora_remote_sdk.so") if system == "linux" else None,
-        # macOS-specific fallback paths
-        os.path.join(package_dir, "lib", "libslamtec_aurora_remote_sdk.dylib") if system == "darwin" else None,
-    ]
-    
-    # Remove None entries
-    possible_paths = [p for p in possible_paths if p is not None]
+    # List the bundled lib directory once and check the bundled candidates
+    # against it; only the remaining paths need their own stat
+    bundled_dir = os.path.join(package_dir, "lib")
+    try:
+        with os.scandir(bundled_dir) as it:
+            bundled_names = {entry.name for entry in it}
+    except OSError:
+        bundled_names = set()
     
     full_lib_path = None
-    for path in possible_paths:
+    for path in _candidate_library_paths(package_dir, lib_path):
+        if path.startswith(bundled_dir + os.sep):
+            first_part = os.path.relpath(path, bundled_dir).split(os.sep, 1)[0]
+            if first_part not in bundled_names:
+                continue
+            if first_part == os.path.basename(path):
+                full_lib_path = path
+                break
         if os.path.exists(path):
             full_lib_path = path
             break
     
     if full_lib_path is None:
-        searched_paths = "\n".join("  - {}".format(path) for path in possible_paths)
+        searched_paths = "\n".join("  - {}".format(path) for path in _candidate_library_paths(package_dir, lib_path))
         raise AuroraSDKError("Aurora SDK library not found. Searched paths:\n{}".format(searched_paths))
     
     try:
         # Aurora SDK DLL uses __cdecl calling convention on all platforms
         # Use CDLL for consistent __cdecl convention across Windows and Linux
-        return ctypes.CDLL(full_lib_path)
+        # The SDK reports failures through its return codes, never errno or
+        # GetLastError, so ctypes must not save/restore them around each call
+        return _AuroraSDKLibrary(full_lib_path, use_errno=False, use_last_error=False)
     except OSError as e:
         raise AuroraSDKError("Failed to load Aurora SDK library: {}".format(e))
 
 
+def _candidate_library_paths(package_dir, lib_path):
+    """Yield the possible locations of the SDK library, most likely first.
+
+    The bundled copies come first so an installed package finds its library
+    without probing development paths that do not exist there; the caller
+    stops at the first hit, so later paths are never built.
+    """
+    # Installed package - platform-specific library bundled with package (current platform only build)
+    yield os.path.join(package_dir, "lib", os.path.basename(lib_path))
+    # Installed package - universal library bundled with package (all platforms build)
+    yield os.path.join(package_dir, "lib", lib_path.replace("cpp_sdk/aurora_remote_public/lib/", ""))
+    # Development setup - library in sibling cpp_sdk directory
+    yield os.path.join(os.path.dirname(os.path.dirname(package_dir)), lib_path)
+    # Alternative package layout
+    yield os.path.join(os.path.dirname(package_dir), lib_path)
+
+
+class _AuroraSDKLibrary(ctypes.CDLL):
+    """CDLL that applies the signature from _SIGS when a function is first looked up.
+
+    CDLL caches each function as an attribute after the first lookup, so the
+    signature is assigned exactly once per symbol and only for symbols in use.
+    """
+
+    def __getattr__(self, name):
+        func = super().__getattr__(name)
+        sig = _SIGS.get(name)
+        if sig is not None:
+            func.argtypes, func.restype = sig
+        return func
+
+
+# argtypes/restype of the C API functions, applied lazily by _AuroraSDKLibrary
+_SIGS = {
+    # Session management
+    "slamtec_aurora_sdk_get_version_info": ([ctypes.POINTER(VersionInfo)], ctypes.c_int),
+
+    "slamtec_aurora_sdk_convert_quaternion_to_euler": ([
+        ctypes.POINTER(Quaternion),    # const quaternion*
+        ctypes.POINTER(EulerAngle)     # euler_out*
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_create_session": ([
+        ctypes.c_void_p,  # config
+        ctypes.c_size_t,  # config_size
+        ctypes.c_void_p,  # listener
+        _P_INT  # error_code
+    ], ctypes.c_void_p),
+
+    "slamtec_aurora_sdk_release_session": ([ctypes.c_void_p], None),
+
+    # Controller operations
+    "slamtec_aurora_sdk_controller_get_discovered_servers": ([
+        ctypes.c_void_p,  # handle
+        _P_ServerConnectionInfo,  # servers
+        ctypes.c_size_t  # max_server_count
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_connect": ([
+        ctypes.c_void_p,  # handle
+        _P_ServerConnectionInfo  # server_conn_info
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_disconnect": ([ctypes.c_void_p], None),
+
+    # is_connected and the preview is_background_updating probe are polled at
+    # high rate; declaring them c_bool lets ctypes hand back a Python bool directly
+    "slamtec_aurora_sdk_controller_is_connected": ([ctypes.c_void_p], ctypes.c_bool),
+
+    "slamtec_aurora_sdk_controller_set_map_data_syncing": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int  # enable
+    ], None),
+
+    "slamtec_aurora_sdk_controller_set_raw_data_subscription": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int  # enable
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_resync_map_data": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int  # invalidate_cache
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_require_mapping_mode": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64  # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_require_local_relocalization": ([
+        ctypes.c_void_p,  # handle
+        _P_PoseSE3,  # center_pose
+        ctypes.c_float,  # search_radius
+        ctypes.c_uint64  # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_require_local_map_merge": ([
+        ctypes.c_void_p,  # handle
+        _P_PoseSE3,  # center_pose
+        ctypes.c_float,  # search_radius
+        ctypes.c_uint64  # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_get_last_relocalization_status": ([
+        ctypes.c_void_p,  # handle
+        _P_U32,  # status_out (device_relocalization_status_t)
+        ctypes.c_uint64  # timeout_ms
+    ], ctypes.c_int),
+
+    # Data provider operations (using new timestamp-enabled functions)
+    "slamtec_aurora_sdk_dataprovider_get_current_pose_se3_with_timestamp": ([
+        ctypes.c_void_p,  # handle
+        _P_PoseSE3,  # pose_out
+        _P_U64  # timestamp_ns_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_current_pose_with_timestamp": ([
+        ctypes.c_void_p,  # handle
+        _P_Pose,  # pose_out
+        _P_U64  # timestamp_ns_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_last_device_basic_info": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(DeviceBasicInfo),  # info_out
+        _P_U64  # timestamp_ns_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_peek_camera_preview_image": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64,  # timestamp_ns
+        ctypes.POINTER(StereoImagePairDesc),  # desc_out
+        ctypes.c_void_p,  # provided_buffer_info
+        ctypes.c_int  # allow_nearest_frame
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_peek_recent_lidar_scan_singlelayer": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(LidarSinglelayerScanDataInfo),  # header_out
+        _P_LidarScanPoint,  # scan_points_out
+        ctypes.c_size_t,  # buffer_count
+        _P_PoseSE3,  # scanpose
+        ctypes.c_int  # forceLatest
+    ], ctypes.c_int),
+
+    # Camera/tracking data operations
+    "slamtec_aurora_sdk_dataprovider_peek_tracking_data": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_void_p,  # tracking_data_out
+        ctypes.c_void_p   # provided_buffer_info
+    ], ctypes.c_int),
+
+    # Map data access operations
+
+    "slamtec_aurora_sdk_dataprovider_get_global_mapping_info": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(GlobalMapDesc)  # global_desc_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_access_map_data": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(MapDataVisitor),  # visitor
+        _P_U32,  # map_ids
+        ctypes.c_size_t  # map_id_count
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_last_device_status": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(DeviceStatus),  # status_out
+        _P_U64  # timestamp_ns_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_relocalization_status": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(RelocalizationStatus)  # status_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_mapping_flags": ([
+        ctypes.c_void_p,  # handle
+        _P_U32  # flags_out
+    ], ctypes.c_int),
+
+    # CRITICAL MISSING FUNCTIONS that supervisor overlooked
+
+    # slamtec_aurora_sdk_dataprovider_get_imu_info (Line 620 in C API)
+    "slamtec_aurora_sdk_dataprovider_get_imu_info": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(IMUInfo)  # info_out
+    ], ctypes.c_int),
+
+    # slamtec_aurora_sdk_dataprovider_get_all_map_info (Line 645 in C API)
+    "slamtec_aurora_sdk_dataprovider_get_all_map_info": ([
+        ctypes.c_void_p,  # handle
+        _P_MapDesc,  # desc_buffer
+        ctypes.c_size_t,  # buffer_count
+        _P_SZ  # actual_count_out
+    ], ctypes.c_int),
+
+    # slamtec_aurora_sdk_dataprovider_peek_history_pose (Line 492 in C API)
+    "slamtec_aurora_sdk_dataprovider_peek_history_pose": ([
+        ctypes.c_void_p,  # handle
+        _P_PoseSE3,  # pose_out
+        ctypes.c_uint64,  # timestamp_ns
+        ctypes.c_int,     # allow_interpolation
+        ctypes.c_uint64   # max_time_diff_ns
+    ], ctypes.c_int),
+
+    # slamtec_aurora_sdk_dataprovider_peek_imu_data (Line 608 in C API)
+    "slamtec_aurora_sdk_dataprovider_peek_imu_data": ([
+        ctypes.c_void_p,  # handle
+        _P_IMUData,  # imu_data_out
+        ctypes.c_size_t,  # buffer_count
+        _P_SZ  # actual_count_out
+    ], ctypes.c_int),
+
+    # 2D Grid Map operations
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_start_background_update": ([
+        ctypes.c_void_p,  # handle
+        _P_GridMapGenerationOptions  # build_options
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_stop_background_update": ([
+        ctypes.c_void_p  # handle
+    ], None),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_is_background_updating": ([
+        ctypes.c_void_p  # handle
+    ], ctypes.c_bool),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_get_generation_options": ([
+        ctypes.c_void_p,  # handle
+        _P_GridMapGenerationOptions  # options_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_require_redraw": ([
+        ctypes.c_void_p  # handle
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_get_and_reset_update_dirty_rect": ([
+        ctypes.c_void_p,  # handle
+        _P_Rect,  # dirty_rect_out
+        _P_INT  # map_big_change
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_set_auto_floor_detection": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int  # enable
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_is_auto_floor_detection": ([
+        ctypes.c_void_p  # handle
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_previewmap_get_gridmap_handle": ([
+        ctypes.c_void_p  # handle
+    ], ctypes.c_void_p),
+
+    "slamtec_aurora_sdk_lidar2dmap_gridmap_get_dimension": ([
+        ctypes.c_void_p,  # gridmap_handle
+        ctypes.POINTER(GridMap2DDimension),  # dimension_out
+        ctypes.c_int  # get_max_capacity
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_gridmap_read_cell_data": ([
+        ctypes.c_void_p,  # gridmap_handle
+        _P_Rect,  # fetch_rect
+        ctypes.POINTER(GridMap2DFetchInfo),  # info_out
+        _P_U8,  # cell_buffer
+        ctypes.c_size_t,  # cell_buffer_size
+        ctypes.c_int  # l2p_mapping
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_gridmap_release": ([ctypes.c_void_p], None),
+
+    "slamtec_aurora_sdk_lidar2dmap_gridmap_get_resolution": ([
+        ctypes.c_void_p,  # gridmap_handle
+        _P_F32  # resolution_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_get_supported_grid_resultion_range": ([
+        ctypes.c_void_p,  # handle
+        _P_F32,  # min_resolution_out
+        _P_F32   # max_resolution_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_lidar2dmap_get_supported_max_grid_cell_count": ([
+        ctypes.c_void_p,  # handle
+        _P_SZ  # max_cell_count_out
+    ], ctypes.c_int),
+
+    # Blocks for up to timeout_ms; like every CDLL call it runs with the GIL released
+    "slamtec_aurora_sdk_lidar2dmap_generate_fullmap": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(ctypes.c_void_p),  # gridmap_handle_out
+        _P_GridMapGenerationOptions,  # build_options
+        ctypes.c_int,  # wait_for_data_sync
+        ctypes.c_uint64  # timeout_ms
+    ], ctypes.c_int),
+
+    # Auto floor detection operations
+
+    "slamtec_aurora_sdk_autofloordetection_get_detection_histogram": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(FloorDetectionHistogramInfo),  # header_out
+        _P_F32,  # histogram_buffer
+        ctypes.c_size_t   # buffer_count
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_autofloordetection_get_all_detection_info": ([
+        ctypes.c_void_p,  # handle
+        _P_FloorDetectionDesc,  # desc_buffer
+        ctypes.c_size_t,  # buffer_count
+        _P_SZ,  # actual_count_out
+        _P_INT  # current_floor_id
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_autofloordetection_get_current_detection_desc": ([
+        ctypes.c_void_p,  # handle
+        _P_FloorDetectionDesc  # desc_out
+    ], ctypes.c_int),
+
+    # Enhanced Imaging API operations (SDK 2.0)
+
+    # Camera calibration operations
+    "slamtec_aurora_sdk_dataprovider_get_camera_calibration": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(CameraCalibrationInfo)  # calibration_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_get_transform_calibration": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(TransformCalibrationInfo)  # transform_out
+    ], ctypes.c_int),
+
+    # SUPERVISOR FIX: Missing Enhanced Imaging readiness functions
+    "slamtec_aurora_sdk_dataprovider_depthcam_is_ready": ([ctypes.c_void_p], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_depthcam_get_config_info": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(DepthcamConfigInfo)  # config_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_depthcam_wait_next_frame": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    # void slamtec_aurora_sdk_dataprovider_depthcam_set_postfiltering(handle, int enable, uint64_t flags)
+    "slamtec_aurora_sdk_dataprovider_depthcam_set_postfiltering": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int,     # enable
+        ctypes.c_uint64   # flags
+    ], None),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_ready": ([ctypes.c_void_p], ctypes.c_int),
+
+    # Enhanced imaging depth camera operations (correct C API signature)
+    "slamtec_aurora_sdk_dataprovider_depthcam_peek_frame": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int,     # frame_type
+        _P_EnhancedImagingFrameDesc,  # frame_desc_out
+        _P_EnhancedImagingFrameBuffer  # frame_buffer
+    ], ctypes.c_int),
+
+    # Depth camera related rectified image operations
+    "slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64,  # timestamp
+        _P_EnhancedImagingFrameDesc,  # frame_desc_out
+        _P_EnhancedImagingFrameBuffer  # frame_buffer
+    ], ctypes.c_int),
+
+    # Enhanced imaging semantic segmentation operations
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_config_info": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(SemanticSegmentationConfig)  # config_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_labels": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(SemanticSegmentationLabelInfo)  # label_info_out
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_label_set_name": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_char_p,  # label_set_name_buffer
+        ctypes.c_size_t   # buffer_size
+    ], ctypes.c_size_t),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame": ([
+        ctypes.c_void_p,  # handle
+        _P_EnhancedImagingFrameDesc,  # frame_desc_out
+        _P_EnhancedImagingFrameBuffer  # frame_buffer
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_wait_next_frame": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_using_alternative_model": ([
+        ctypes.c_void_p   # handle
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_dataprovider_depthcam_calc_aligned_segmentation_map": ([
+        ctypes.c_void_p,  # handle
+        _P_ImageDesc,  # desc_in (input image descriptor)
+        ctypes.c_void_p,  # raw_segment_data
+        _P_ImageDesc,  # desc_out (output image descriptor)
+        ctypes.c_void_p   # aligned_segment_data (enhanced imaging frame buffer)
+    ], ctypes.c_int),
+
+    # Controller Enhanced Imaging subscription operations
+    "slamtec_aurora_sdk_controller_set_enhanced_imaging_subscription": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int,     # enhanced_image_type
+        ctypes.c_int      # enable
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_is_enhanced_imaging_subscribed": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int      # enhanced_image_type
+    ], ctypes.c_int),
+
+    # Controller semantic segmentation model operations
+    "slamtec_aurora_sdk_controller_require_semantic_segmentation_alternative_model": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int,     # use_alternative_model
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    # DataRecorder operations
+    "slamtec_aurora_sdk_datarecorder_start_recording": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type (datarecorder_type_t)
+        ctypes.c_char_p   # target_folder
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_stop_recording": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32   # type
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_is_recording": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32   # type
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_set_option_string": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        ctypes.c_char_p   # value
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_set_option_int32": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        ctypes.c_int32    # value
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_set_option_float64": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        ctypes.c_double   # value
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_set_option_bool": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        ctypes.c_int      # value
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_set_option_reset": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32   # type
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_query_status_int64": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        _P_I64,  # value_out
+        ctypes.c_int      # use_cached_value
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_datarecorder_query_status_float64": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint32,  # type
+        ctypes.c_char_p,  # key
+        _P_F64,  # value_out
+        ctypes.c_int      # use_cached_value
+    ], ctypes.c_int),
+
+    # Map manager operations
+
+    "slamtec_aurora_sdk_mapmanager_start_storage_session": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_char_p,  # map_file_name
+        ctypes.c_int,     # session_type
+        MapStorageSessionResultCallback,  # callback
+        ctypes.c_void_p   # user_data
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_mapmanager_abort_session": ([ctypes.c_void_p], None),
+
+    "slamtec_aurora_sdk_mapmanager_is_storage_session_active": ([ctypes.c_void_p], ctypes.c_int),
+
+    "slamtec_aurora_sdk_mapmanager_query_storage_status": ([
+        ctypes.c_void_p,  # handle
+        ctypes.POINTER(MapStorageSessionStatus)  # progress_out
+    ], ctypes.c_int),
+
+    # Relocalization operations
+    "slamtec_aurora_sdk_controller_require_relocalization": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_cancel_relocalization": ([ctypes.c_void_p], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_require_map_reset": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_require_pure_localization_mode": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_is_device_connection_alive": ([ctypes.c_void_p], ctypes.c_int),
+
+    "slamtec_aurora_sdk_controller_is_raw_data_subscribed": ([ctypes.c_void_p], ctypes.c_int),
+
+    # CORRECTED: Fixed function signatures to match C API exactly
+    # void slamtec_aurora_sdk_controller_set_low_rate_mode(handle, int enable)
+    "slamtec_aurora_sdk_controller_set_low_rate_mode": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int      # enable
+    ], None),  # FIXED: void return
+
+    # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_set_loop_closure(handle, int enable, uint64_t timeout_ms)
+    "slamtec_aurora_sdk_controller_set_loop_closure": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_int,     # enable
+        ctypes.c_uint64   # timeout_ms - FIXED: Added missing parameter
+    ], ctypes.c_int),
+
+    # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_force_map_global_optimization(handle, uint64_t timeout_ms)
+    "slamtec_aurora_sdk_controller_force_map_global_optimization": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # timeout_ms
+    ], ctypes.c_int),
+
+    # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_send_custom_command(
+    #   handle, uint64_t timeout_ms, uint64_t cmd, const void* data, size_t data_size,
+    #   void* response, size_t response_buffer_size, size_t* response_retrieved_size)
+    "slamtec_aurora_sdk_controller_send_custom_command": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64,  # timeout_ms - FIXED: Added missing parameter
+        ctypes.c_uint64,  # cmd - FIXED: Changed from char_p to uint64
+        ctypes.c_void_p,  # data
+        ctypes.c_size_t,  # data_size
+        ctypes.c_void_p,  # response
+        ctypes.c_size_t,  # response_buffer_size
+        _P_SZ  # response_retrieved_size
+    ], ctypes.c_int),
+
+    # void slamtec_aurora_sdk_controller_set_keyframe_fetch_flags(handle, uint64_t flags)
+    "slamtec_aurora_sdk_controller_set_keyframe_fetch_flags": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # flags
+    ], None),
+
+    # uint64_t slamtec_aurora_sdk_controller_get_keyframe_fetch_flags(handle)
+    "slamtec_aurora_sdk_controller_get_keyframe_fetch_flags": ([
+        ctypes.c_void_p   # handle
+    ], ctypes.c_uint64),
+
+    # void slamtec_aurora_sdk_controller_set_map_point_fetch_flags(handle, uint64_t flags)
+    "slamtec_aurora_sdk_controller_set_map_point_fetch_flags": ([
+        ctypes.c_void_p,  # handle
+        ctypes.c_uint64   # flags
+    ], None),
+
+    # uint64_t slamtec_aurora_sdk_controller_get_map_point_fetch_flags(handle)
+    "slamtec_aurora_sdk_controller_get_map_point_fetch_flags": ([
+        ctypes.c_void_p   # handle
+    ], ctypes.c_uint64),
+}
+
+
+# Frequently called C API functions bound directly on CBindings instances, so each
+# call skips the attribute lookup through the library object
+_BOUND_FUNCTIONS = {
+    "_fn_get_current_pose_se3": "slamtec_aurora_sdk_dataprovider_get_current_pose_se3_with_timestamp",
+    "_fn_get_current_pose": "slamtec_aurora_sdk_dataprovider_get_current_pose_with_timestamp",
+    "_fn_peek_camera_preview_image": "slamtec_aurora_sdk_dataprovider_peek_camera_preview_image",
+    "_fn_peek_tracking_data": "slamtec_aurora_sdk_dataprovider_peek_tracking_data",
+    "_fn_peek_recent_lidar_scan": "slamtec_aurora_sdk_dataprovider_peek_recent_lidar_scan_singlelayer",
+    "_fn_peek_imu_data": "slamtec_aurora_sdk_dataprovider_peek_imu_data",
+    "_fn_connect": "slamtec_aurora_sdk_controller_connect",
+    "_fn_disconnect": "slamtec_aurora_sdk_controller_disconnect",
+    "_fn_is_connected": "slamtec_aurora_sdk_controller_is_connected",
+    "_fn_set_map_data_syncing": "slamtec_aurora_sdk_controller_set_map_data_syncing",
+    "_fn_set_raw_data_subscription": "slamtec_aurora_sdk_controller_set_raw_data_subscription",
+    "_fn_get_global_mapping_info": "slamtec_aurora_sdk_dataprovider_get_global_mapping_info",
+    "_fn_get_last_device_status": "slamtec_aurora_sdk_dataprovider_get_last_device_status",
+    "_fn_get_relocalization_status": "slamtec_aurora_sdk_dataprovider_get_relocalization_status",
+    "_fn_peek_history_pose": "slamtec_aurora_sdk_dataprovider_peek_history_pose",
+    "_fn_is_device_connection_alive": "slamtec_aurora_sdk_controller_is_device_connection_alive",
+    "_fn_is_raw_data_subscribed": "slamtec_aurora_sdk_controller_is_raw_data_subscribed",
+    "_fn_is_enhanced_imaging_subscribed": "slamtec_aurora_sdk_controller_is_enhanced_imaging_subscribed",
+    "_fn_previewmap_is_background_updating": "slamtec_aurora_sdk_lidar2dmap_previewmap_is_background_updating",
+    "_fn_previewmap_get_dirty_rect": "slamtec_aurora_sdk_lidar2dmap_previewmap_get_and_reset_update_dirty_rect",
+    "_fn_gridmap_get_dimension": "slamtec_aurora_sdk_lidar2dmap_gridmap_get_dimension",
+    "_fn_gridmap_read_cell_data": "slamtec_aurora_sdk_lidar2dmap_gridmap_read_cell_data",
+    "_fn_depthcam_is_ready": "slamtec_aurora_sdk_dataprovider_depthcam_is_ready",
+    "_fn_depthcam_wait_next_frame": "slamtec_aurora_sdk_dataprovider_depthcam_wait_next_frame",
+    "_fn_depthcam_peek_frame": "slamtec_aurora_sdk_dataprovider_depthcam_peek_frame",
+    "_fn_depthcam_peek_related_rectified_image": "slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image",
+    "_fn_semantic_segmentation_is_ready": "slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_ready",
+    "_fn_semantic_segmentation_wait_next_frame": "slamtec_aurora_sdk_dataprovider_semantic_segmentation_wait_next_frame",
+    "_fn_semantic_segmentation_peek_frame": "slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame",
+}
+
+
+def _check(error_code, message):
+    """Raise AuroraSDKError for a failed SDK call; ERRORCODE_OK is 0, so any other code is a failure."""
+    if error_code:
+        raise AuroraSDKError("{}, error code: {}".format(message, error_code))
+
+
+def _check_out_array(out, struct_type, what, row_shape=()):
+    """Raise InvalidArgumentError unless the SDK can safely write len(out) struct_type records into out.
+
+    struct_type may also be a NumPy dtype name or a tuple of accepted ones, and
+    row_shape the shape of each record for multi-dimensional arrays.
+    """
+    dtypes = struct_type if isinstance(struct_type, tuple) else (struct_type,)
+    if (not NUMPY_AVAILABLE or not isinstance(out, np.ndarray) or out.shape[1:] != row_shape
+            or out.ndim != 1 + len(row_shape)
+            or out.dtype not in [np.dtype(t) for t in dtypes]
+            or not out.flags.c_contiguous or not out.flags.writeable):
+        raise InvalidArgumentError(
+            "{} must be a writable, C-contiguous NumPy array of shape (N{}) with the {} dtype".format(
+                what, ''.join(', {}'.format(n) for n in row_shape) or ',',
+                ' or '.join(getattr(t, '__name__', t) for t in dtypes)))
+
+
+# Accepted dtypes and row shape of each access_map_data mp_out array
+_MAP_POINT_OUT_COLUMNS = {
+    'positions': (('float32', 'float64'), (3,)),
+    'ids': ('uint64', ()),
+    'map_ids': ('uint32', ()),
+    'timestamps': ('float64', ()),
+}
+
+
+def _check_map_point_out(mp_out):
+    """Validate the mp_out arrays of access_map_data and return their common length."""
+    if not isinstance(mp_out, dict):
+        raise InvalidArgumentError("Map point output arrays must be given as a dict")
+    unknown = set(mp_out).difference(_MAP_POINT_OUT_COLUMNS)
+    if unknown:
+        raise InvalidArgumentError("Unsupported map point output arrays: {}".format(sorted(unknown)))
+    for key, arr in mp_out.items():
+        dtypes, row_shape = _MAP_POINT_OUT_COLUMNS[key]
+        _check_out_array(arr, dtypes, "Map point '{}' array".format(key), row_shape)
+    lengths = set(len(arr) for arr in mp_out.values())
+    if len(lengths) > 1:
+        raise InvalidArgumentError("Map point output arrays must all have the same length")
+    return lengths.pop() if lengths else 0
+
+
+# Capacity of the tracking data receive buffers
+_TRACKING_MAX_KEYPOINTS = 1000  # Should be enough for most cases
+_TRACKING_MAX_IMAGE_SIZE = 1920 * 1080 * 4  # Assume max 1920x1080 RGBA
+
+
+class _TrackingBuffers:
+    """Image and keypoint receive buffers for peek_tracking_data, wired into a TrackingDataBuffer."""
+
+    def __init__(self):
+        self.left_image = (ctypes.c_uint8 * _TRACKING_MAX_IMAGE_SIZE)()
+        self.right_image = (ctypes.c_uint8 * _TRACKING_MAX_IMAGE_SIZE)()
+        self.left_keypoints = (Keypoint * _TRACKING_MAX_KEYPOINTS)()
+        self.right_keypoints = (Keypoint * _TRACKING_MAX_KEYPOINTS)()
+        
+        self.buffer = TrackingDataBuffer()
+        self.buffer.imgdata_left = ctypes.addressof(self.left_image)
+        self.buffer.imgdata_right = ctypes.addressof(self.right_image)
+        self.buffer.keypoints_left = self.left_keypoints
+        self.buffer.keypoints_right = self.right_keypoints
+        self.buffer_ref = ctypes.byref(self.buffer)
+    
+    def reset(self):
+        """Restore the capacity fields before handing the buffer to the SDK."""
+        self.buffer.imgdata_left_size = _TRACKING_MAX_IMAGE_SIZE
+        self.buffer.imgdata_right_size = _TRACKING_MAX_IMAGE_SIZE
+        self.buffer.keypoints_left_buffer_count = _TRACKING_MAX_KEYPOINTS
+        self.buffer.keypoints_right_buffer_count = _TRACKING_MAX_KEYPOINTS
+        return self.buffer_ref
+
+
+# Keys of the dict returned by CBindings.get_readiness_flags, in query order
+READINESS_FLAG_NAMES = (
+    'connection_alive',
+    'raw_data_subscribed',
+    'depth_camera_subscribed',
+    'semantic_segmentation_subscribed',
+    'depth_camera_ready',
+    'semantic_segmentation_ready',
+)
+
+
+class _AlignmentBuffers:
+    """Descriptor structures for calc_depth_aligned_segmentation_map, with their byrefs built once."""
+
+    def __init__(self):
+        self.desc_in = ImageDesc()
+        self.desc_in.format = 0  # Segmentation maps are single-channel grayscale
+        self.desc_out = ImageDesc()
+        self.frame_buffer = EnhancedImagingFrameBuffer()
+        self.desc_in_ref = ctypes.byref(self.desc_in)
+        self.desc_out_ref = ctypes.byref(self.desc_out)
+        self.frame_buffer_ref = ctypes.byref(self.frame_buffer)
+
+
+# Receive buffers larger than this are allocated per call rather than kept
+_RECV_BUFFER_RETAIN_LIMIT = 64 * 1024 * 1024
+
+
+class _CallScratch(threading.local):
+    """Per-thread output structures reused across high-rate C calls."""
+
+    def __init__(self):
+        self.ts = ctypes.c_uint64(0)
+        self.ts_ref = ctypes.byref(self.ts)
+        self.pose = (ctypes.c_double * 7)()
+        self.pose_ptr = ctypes.cast(self.pose, _P_PoseSE3)
+        self.pose_euler_ptr = ctypes.cast(self.pose, _P_Pose)
+        self.rect = Rect()
+        self.rect_ref = ctypes.byref(self.rect)
+        self.flag = ctypes.c_int(0)
+        self.flag_ref = ctypes.byref(self.flag)
+        self.count = ctypes.c_size_t(0)
+        self.count_ref = ctypes.byref(self.count)
+        self.u32 = ctypes.c_uint32(0)
+        self.u32_ref = ctypes.byref(self.u32)
+        self.f32 = ctypes.c_float(0)
+        self.f32_ref = ctypes.byref(self.f32)
+        self.tracking = None  # _TrackingBuffers, allocated on first tracking peek
+        self.alignment = None  # _AlignmentBuffers, allocated on first segmentation alignment
+        self.recv = None  # uint8 receive buffer, see receive_buffer()
+        self.arrays = {}  # Structure type -> reusable array, see struct_array()
+    
+    def receive_buffer(self, nbytes):
+        """Return a uint8 buffer of at least ``nbytes`` for data that is copied out after the call.
+
+        The buffer is kept and grown in power-of-two steps, so steady-state
+        frame streams stop paying for a fresh allocation every call. The first
+        ``nbytes`` are zeroed on reuse, so bytes the SDK skips read as 0 rather
+        than as data from a previous call.
+        """
+        buf = self.recv
+        if buf is not None and len(buf) >= nbytes:
+            ctypes.memset(buf, 0, nbytes)
+            return buf
+        capacity = 1 << max(nbytes - 1, 0).bit_length()
+        if capacity > _RECV_BUFFER_RETAIN_LIMIT:
+            return (ctypes.c_uint8 * nbytes)()
+        buf = self.recv = (ctypes.c_uint8 * capacity)()
+        return buf
+    
+    def struct_array(self, struct_type, count):
+        """Return a reusable array of at least ``count`` ``struct_type`` records.
+
+        Only for results that are copied out before returning; the array is
+        handed to the next call on this thread.
+        """
+        buf = self.arrays.get(struct_type)
+        if buf is None or len(buf) < count:
+            buf = self.arrays[struct_type] = (struct_type * count)()
+        return buf
+
+
 class CBindings:
     """Low-level C bindings for Aurora SDK."""
     
     def __init__(self):
         self.lib = load_aurora_sdk_library()
-        self._setup_function_signatures()
-    
-    def _setup_function_signatures(self):
-        """Setup function signatures for all C API functions."""
-        
-        # Session management
-        self.lib.slamtec_aurora_sdk_get_version_info.argtypes = [ctypes.POINTER(VersionInfo)]
-        self.lib.slamtec_aurora_sdk_get_version_info.restype = ctypes.c_int
-        
-        from .data_types import Quaternion, EulerAngle
-        
-        self.lib.slamtec_aurora_sdk_convert_quaternion_to_euler.argtypes = [
-            ctypes.POINTER(Quaternion),    # const quaternion*
-            ctypes.POINTER(EulerAngle)     # euler_out*
-        ]
-        self.lib.slamtec_aurora_sdk_convert_quaternion_to_euler.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_create_session.argtypes = [
-            ctypes.c_void_p,  # config
-            ctypes.c_size_t,  # config_size
-            ctypes.c_void_p,  # listener
-            ctypes.POINTER(ctypes.c_int)  # error_code
-        ]
-        self.lib.slamtec_aurora_sdk_create_session.restype = ctypes.c_void_p
-        
-        self.lib.slamtec_aurora_sdk_release_session.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_release_session.restype = None
-        
-        # Controller operations
-        self.lib.slamtec_aurora_sdk_controller_get_discovered_servers.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ServerConnectionInfo),  # servers
-            ctypes.c_size_t  # max_server_count
-        ]
-        self.lib.slamtec_aurora_sdk_controller_get_discovered_servers.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_connect.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ServerConnectionInfo)  # server_conn_info
-        ]
-        self.lib.slamtec_aurora_sdk_controller_connect.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_disconnect.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_controller_disconnect.restype = None
-        
-        self.lib.slamtec_aurora_sdk_controller_is_connected.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_controller_is_connected.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_set_map_data_syncing.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int  # enable
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_map_data_syncing.restype = None
-        
-        self.lib.slamtec_aurora_sdk_controller_set_raw_data_subscription.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int  # enable
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_raw_data_subscription.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_resync_map_data.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int  # invalidate_cache
-        ]
-        self.lib.slamtec_aurora_sdk_controller_resync_map_data.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_require_mapping_mode.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64  # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_mapping_mode.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_controller_require_local_relocalization.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(PoseSE3),  # center_pose
-            ctypes.c_float,  # search_radius
-            ctypes.c_uint64  # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_local_relocalization.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_controller_require_local_map_merge.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(PoseSE3),  # center_pose
-            ctypes.c_float,  # search_radius
-            ctypes.c_uint64  # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_local_map_merge.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_controller_get_last_relocalization_status.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ctypes.c_uint32),  # status_out (device_relocalization_status_t)
-            ctypes.c_uint64  # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_get_last_relocalization_status.restype = ctypes.c_int
-
-        # Data provider operations (using new timestamp-enabled functions)
-        self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_se3_with_timestamp.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(PoseSE3),  # pose_out
-            ctypes.POINTER(ctypes.c_uint64)  # timestamp_ns_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_se3_with_timestamp.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_with_timestamp.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(Pose),  # pose_out
-            ctypes.POINTER(ctypes.c_uint64)  # timestamp_ns_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_with_timestamp.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_basic_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(DeviceBasicInfo),  # info_out
-            ctypes.POINTER(ctypes.c_uint64)  # timestamp_ns_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_basic_info.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_camera_preview_image.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64,  # timestamp_ns
-            ctypes.POINTER(StereoImagePairDesc),  # desc_out
-            ctypes.c_void_p,  # provided_buffer_info
-            ctypes.c_int  # allow_nearest_frame
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_camera_preview_image.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_recent_lidar_scan_singlelayer.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(LidarSinglelayerScanDataInfo),  # header_out
-            ctypes.POINTER(LidarScanPoint),  # scan_points_out
-            ctypes.c_size_t,  # buffer_count
-            ctypes.POINTER(PoseSE3),  # scanpose
-            ctypes.c_int  # forceLatest
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_recent_lidar_scan_singlelayer.restype = ctypes.c_int
-        
-        # Camera/tracking data operations
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_tracking_data.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_void_p,  # tracking_data_out
-            ctypes.c_void_p   # provided_buffer_info
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_tracking_data.restype = ctypes.c_int
-        
-        # Map data access operations
-        from .data_types import MapDataVisitor, GlobalMapDesc
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_global_mapping_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(GlobalMapDesc)  # global_desc_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_global_mapping_info.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_access_map_data.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(MapDataVisitor),  # visitor
-            ctypes.POINTER(ctypes.c_uint32),  # map_ids
-            ctypes.c_size_t  # map_id_count
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_access_map_data.restype = ctypes.c_int
-        
-        from .data_types import DeviceStatus, RelocalizationStatus
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_status.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(DeviceStatus),  # status_out
-            ctypes.POINTER(ctypes.c_uint64)  # timestamp_ns_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_status.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_relocalization_status.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(RelocalizationStatus)  # status_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_relocalization_status.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_mapping_flags.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ctypes.c_uint32)  # flags_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_mapping_flags.restype = ctypes.c_int
-        
-        # CRITICAL MISSING FUNCTIONS that supervisor overlooked
-        from .data_types import IMUInfo, IMUData, MapDesc
-        
-        # slamtec_aurora_sdk_dataprovider_get_imu_info (Line 620 in C API)
-        self.lib.slamtec_aurora_sdk_dataprovider_get_imu_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(IMUInfo)  # info_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_imu_info.restype = ctypes.c_int
-        
-        # slamtec_aurora_sdk_dataprovider_get_all_map_info (Line 645 in C API)
-        self.lib.slamtec_aurora_sdk_dataprovider_get_all_map_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(MapDesc),  # desc_buffer
-            ctypes.c_size_t,  # buffer_count
-            ctypes.POINTER(ctypes.c_size_t)  # actual_count_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_all_map_info.restype = ctypes.c_int
-        
-        # slamtec_aurora_sdk_dataprovider_peek_history_pose (Line 492 in C API)
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_history_pose.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(PoseSE3),  # pose_out
-            ctypes.c_uint64,  # timestamp_ns
-            ctypes.c_int,     # allow_interpolation
-            ctypes.c_uint64   # max_time_diff_ns
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_history_pose.restype = ctypes.c_int
-        
-        # slamtec_aurora_sdk_dataprovider_peek_imu_data (Line 608 in C API)
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(IMUData),  # imu_data_out
-            ctypes.c_size_t,  # buffer_count
-            ctypes.POINTER(ctypes.c_size_t)  # actual_count_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data.restype = ctypes.c_int
-        
-        # 2D Grid Map operations
-        from .data_types import GridMapGenerationOptions, GridMap2DDimension, Rect, GridMap2DFetchInfo
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_start_background_update.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(GridMapGenerationOptions)  # build_options
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_start_background_update.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_stop_background_update.argtypes = [
-            ctypes.c_void_p  # handle
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_stop_background_update.restype = None
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_is_background_updating.argtypes = [
-            ctypes.c_void_p  # handle
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_is_background_updating.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_generation_options.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(GridMapGenerationOptions)  # options_out
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_generation_options.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_require_redraw.argtypes = [
-            ctypes.c_void_p  # handle
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_require_redraw.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_and_reset_update_dirty_rect.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(Rect),  # dirty_rect_out
-            ctypes.POINTER(ctypes.c_int)  # map_big_change
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_and_reset_update_dirty_rect.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_set_auto_floor_detection.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int  # enable
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_set_auto_floor_detection.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_is_auto_floor_detection.argtypes = [
-            ctypes.c_void_p  # handle
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_is_auto_floor_detection.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_gridmap_handle.argtypes = [
-            ctypes.c_void_p  # handle
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_gridmap_handle.restype = ctypes.c_void_p
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_dimension.argtypes = [
-            ctypes.c_void_p,  # gridmap_handle
-            ctypes.POINTER(GridMap2DDimension),  # dimension_out
-            ctypes.c_int  # get_max_capacity
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_dimension.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_read_cell_data.argtypes = [
-            ctypes.c_void_p,  # gridmap_handle
-            ctypes.POINTER(Rect),  # fetch_rect
-            ctypes.POINTER(GridMap2DFetchInfo),  # info_out
-            ctypes.POINTER(ctypes.c_uint8),  # cell_buffer
-            ctypes.c_size_t,  # cell_buffer_size
-            ctypes.c_int  # l2p_mapping
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_read_cell_data.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_release.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_release.restype = None
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_resolution.argtypes = [
-            ctypes.c_void_p,  # gridmap_handle
-            ctypes.POINTER(ctypes.c_float)  # resolution_out
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_resolution.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_grid_resultion_range.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ctypes.c_float),  # min_resolution_out
-            ctypes.POINTER(ctypes.c_float)   # max_resolution_out
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_grid_resultion_range.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_max_grid_cell_count.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ctypes.c_size_t)  # max_cell_count_out
-        ]
-        self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_max_grid_cell_count.restype = ctypes.c_int
-        
-        # Auto floor detection operations
-        from .data_types import FloorDetectionDesc, FloorDetectionHistogramInfo
-        
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_detection_histogram.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(FloorDetectionHistogramInfo),  # header_out
-            ctypes.POINTER(ctypes.c_float),  # histogram_buffer
-            ctypes.c_size_t   # buffer_count
-        ]
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_detection_histogram.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_all_detection_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(FloorDetectionDesc),  # desc_buffer
-            ctypes.c_size_t,  # buffer_count
-            ctypes.POINTER(ctypes.c_size_t),  # actual_count_out
-            ctypes.POINTER(ctypes.c_int)  # current_floor_id
-        ]
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_all_detection_info.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_current_detection_desc.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(FloorDetectionDesc)  # desc_out
-        ]
-        self.lib.slamtec_aurora_sdk_autofloordetection_get_current_detection_desc.restype = ctypes.c_int
-        
-        # Enhanced Imaging API operations (SDK 2.0)
-        from .data_types import (CameraCalibrationInfo, TransformCalibrationInfo, 
-                                SemanticSegmentationConfig, SemanticSegmentationLabelInfo,
-                                EnhancedImagingFrameDesc)
-        
-        # Camera calibration operations
-        self.lib.slamtec_aurora_sdk_dataprovider_get_camera_calibration.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(CameraCalibrationInfo)  # calibration_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_camera_calibration.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_get_transform_calibration.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(TransformCalibrationInfo)  # transform_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_get_transform_calibration.restype = ctypes.c_int
-        
-        # SUPERVISOR FIX: Missing Enhanced Imaging readiness functions
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_is_ready.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_is_ready.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_get_config_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(DepthcamConfigInfo)  # config_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_get_config_info.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_wait_next_frame.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_wait_next_frame.restype = ctypes.c_int
-        
-        # void slamtec_aurora_sdk_dataprovider_depthcam_set_postfiltering(handle, int enable, uint64_t flags)
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_set_postfiltering.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int,     # enable
-            ctypes.c_uint64   # flags
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_set_postfiltering.restype = None
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_ready.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_ready.restype = ctypes.c_int
-        
-        # Enhanced imaging depth camera operations (correct C API signature)
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_frame.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int,     # frame_type
-            ctypes.POINTER(EnhancedImagingFrameDesc),  # frame_desc_out
-            ctypes.POINTER(EnhancedImagingFrameBuffer)  # frame_buffer
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_frame.restype = ctypes.c_int
-        
-        # Depth camera related rectified image operations
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64,  # timestamp
-            ctypes.POINTER(EnhancedImagingFrameDesc),  # frame_desc_out
-            ctypes.POINTER(EnhancedImagingFrameBuffer)  # frame_buffer
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image.restype = ctypes.c_int
-        
-        # Enhanced imaging semantic segmentation operations
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_config_info.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(SemanticSegmentationConfig)  # config_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_config_info.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_labels.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(SemanticSegmentationLabelInfo)  # label_info_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_labels.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_label_set_name.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_char_p,  # label_set_name_buffer
-            ctypes.c_size_t   # buffer_size
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_label_set_name.restype = ctypes.c_size_t
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(EnhancedImagingFrameDesc),  # frame_desc_out
-            ctypes.POINTER(EnhancedImagingFrameBuffer)  # frame_buffer
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_wait_next_frame.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_wait_next_frame.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_using_alternative_model.argtypes = [
-            ctypes.c_void_p   # handle
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_using_alternative_model.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_calc_aligned_segmentation_map.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(ImageDesc),  # desc_in (input image descriptor)
-            ctypes.c_void_p,  # raw_segment_data
-            ctypes.POINTER(ImageDesc),  # desc_out (output image descriptor)
-            ctypes.c_void_p   # aligned_segment_data (enhanced imaging frame buffer)
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_depthcam_calc_aligned_segmentation_map.restype = ctypes.c_int
-        
-        # Controller Enhanced Imaging subscription operations
-        self.lib.slamtec_aurora_sdk_controller_set_enhanced_imaging_subscription.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int,     # enhanced_image_type
-            ctypes.c_int      # enable
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_enhanced_imaging_subscription.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_is_enhanced_imaging_subscribed.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int      # enhanced_image_type
-        ]
-        self.lib.slamtec_aurora_sdk_controller_is_enhanced_imaging_subscribed.restype = ctypes.c_int
-        
-        # Controller semantic segmentation model operations
-        self.lib.slamtec_aurora_sdk_controller_require_semantic_segmentation_alternative_model.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int,     # use_alternative_model
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_semantic_segmentation_alternative_model.restype = ctypes.c_int
-        
-        # DataRecorder operations
-        self.lib.slamtec_aurora_sdk_datarecorder_start_recording.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type (datarecorder_type_t)
-            ctypes.c_char_p   # target_folder
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_start_recording.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_stop_recording.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32   # type
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_stop_recording.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_is_recording.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32   # type
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_is_recording.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_string.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.c_char_p   # value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_string.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_int32.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.c_int32    # value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_int32.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_float64.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.c_double   # value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_float64.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_bool.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.c_int      # value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_bool.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_reset.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32   # type
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_set_option_reset.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_query_status_int64.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.POINTER(ctypes.c_int64),  # value_out
-            ctypes.c_int      # use_cached_value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_query_status_int64.restype = ctypes.c_int
-
-        self.lib.slamtec_aurora_sdk_datarecorder_query_status_float64.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint32,  # type
-            ctypes.c_char_p,  # key
-            ctypes.POINTER(ctypes.c_double),  # value_out
-            ctypes.c_int      # use_cached_value
-        ]
-        self.lib.slamtec_aurora_sdk_datarecorder_query_status_float64.restype = ctypes.c_int
-
-        # Map manager operations
-        from .data_types import MapStorageSessionResultCallback, MapStorageSessionStatus
-
-        self.lib.slamtec_aurora_sdk_mapmanager_start_storage_session.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_char_p,  # map_file_name
-            ctypes.c_int,     # session_type
-            MapStorageSessionResultCallback,  # callback
-            ctypes.c_void_p   # user_data
-        ]
-        self.lib.slamtec_aurora_sdk_mapmanager_start_storage_session.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_mapmanager_abort_session.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_mapmanager_abort_session.restype = None
-        
-        self.lib.slamtec_aurora_sdk_mapmanager_is_storage_session_active.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_mapmanager_is_storage_session_active.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_mapmanager_query_storage_status.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(MapStorageSessionStatus)  # progress_out
-        ]
-        self.lib.slamtec_aurora_sdk_mapmanager_query_storage_status.restype = ctypes.c_int
-        
-        # IMU data operations
-        from .data_types import IMUData
-        
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.POINTER(IMUData),  # imu_data_out
-            ctypes.c_size_t,  # max_count
-            ctypes.POINTER(ctypes.c_size_t)  # actual_count_out
-        ]
-        self.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data.restype = ctypes.c_int
-        
-        # Relocalization operations
-        self.lib.slamtec_aurora_sdk_controller_require_relocalization.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_relocalization.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_cancel_relocalization.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_controller_cancel_relocalization.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_require_map_reset.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_map_reset.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_require_pure_localization_mode.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_require_pure_localization_mode.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_is_device_connection_alive.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_controller_is_device_connection_alive.restype = ctypes.c_int
-        
-        self.lib.slamtec_aurora_sdk_controller_is_raw_data_subscribed.argtypes = [ctypes.c_void_p]
-        self.lib.slamtec_aurora_sdk_controller_is_raw_data_subscribed.restype = ctypes.c_int
-        
-        # CORRECTED: Fixed function signatures to match C API exactly
-        # void slamtec_aurora_sdk_controller_set_low_rate_mode(handle, int enable)
-        self.lib.slamtec_aurora_sdk_controller_set_low_rate_mode.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int      # enable
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_low_rate_mode.restype = None  # FIXED: void return
-        
-        # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_set_loop_closure(handle, int enable, uint64_t timeout_ms)
-        self.lib.slamtec_aurora_sdk_controller_set_loop_closure.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_int,     # enable
-            ctypes.c_uint64   # timeout_ms - FIXED: Added missing parameter
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_loop_closure.restype = ctypes.c_int
-        
-        # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_force_map_global_optimization(handle, uint64_t timeout_ms)
-        self.lib.slamtec_aurora_sdk_controller_force_map_global_optimization.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # timeout_ms
-        ]
-        self.lib.slamtec_aurora_sdk_controller_force_map_global_optimization.restype = ctypes.c_int
-        
-        # slamtec_aurora_sdk_errorcode_t slamtec_aurora_sdk_controller_send_custom_command(
-        #   handle, uint64_t timeout_ms, uint64_t cmd, const void* data, size_t data_size, 
-        #   void* response, size_t response_buffer_size, size_t* response_retrieved_size)
-        self.lib.slamtec_aurora_sdk_controller_send_custom_command.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64,  # timeout_ms - FIXED: Added missing parameter
-            ctypes.c_uint64,  # cmd - FIXED: Changed from char_p to uint64
-            ctypes.c_void_p,  # data
-            ctypes.c_size_t,  # data_size
-            ctypes.c_void_p,  # response
-            ctypes.c_size_t,  # response_buffer_size
-            ctypes.POINTER(ctypes.c_size_t)  # response_retrieved_size
-        ]
-        self.lib.slamtec_aurora_sdk_controller_send_custom_command.restype = ctypes.c_int
-        
-        # void slamtec_aurora_sdk_controller_set_keyframe_fetch_flags(handle, uint64_t flags)
-        self.lib.slamtec_aurora_sdk_controller_set_keyframe_fetch_flags.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # flags
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_keyframe_fetch_flags.restype = None
-        
-        # uint64_t slamtec_aurora_sdk_controller_get_keyframe_fetch_flags(handle)
-        self.lib.slamtec_aurora_sdk_controller_get_keyframe_fetch_flags.argtypes = [
-            ctypes.c_void_p   # handle
-        ]
-        self.lib.slamtec_aurora_sdk_controller_get_keyframe_fetch_flags.restype = ctypes.c_uint64
-        
-        # void slamtec_aurora_sdk_controller_set_map_point_fetch_flags(handle, uint64_t flags)
-        self.lib.slamtec_aurora_sdk_controller_set_map_point_fetch_flags.argtypes = [
-            ctypes.c_void_p,  # handle
-            ctypes.c_uint64   # flags
-        ]
-        self.lib.slamtec_aurora_sdk_controller_set_map_point_fetch_flags.restype = None
-        
-        # uint64_t slamtec_aurora_sdk_controller_get_map_point_fetch_flags(handle)
-        self.lib.slamtec_aurora_sdk_controller_get_map_point_fetch_flags.argtypes = [
-            ctypes.c_void_p   # handle
-        ]
-        self.lib.slamtec_aurora_sdk_controller_get_map_point_fetch_flags.restype = ctypes.c_uint64
+        for attr, name in _BOUND_FUNCTIONS.items():
+            func = getattr(self.lib, name, None)
+            if func is not None:  # Older SDK builds may lack some symbols
+                setattr(self, attr, func)
+        # Reusable output storage for the high-rate calls, one set per thread
+        # since the bindings instance is shared process-wide
+        self._scratch = _CallScratch()
+        # (left, right) preview image sizes of the current stream, once known
+        self._preview_sizes = None
+        # Frame data size of each enhanced imaging stream, once known
+        self._enhanced_frame_sizes = {}
+        # (left, right) tracking image sizes for copy=False tracking peeks, once known
+        self._tracking_sizes = None
     
     def get_version_info(self):
         """Get SDK version information."""
         version_info = VersionInfo()
         error_code = self.lib.slamtec_aurora_sdk_get_version_info(ctypes.byref(version_info))
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get version info, error code: {}".format(error_code))
+        _check(error_code, "Failed to get version info")
         return version_info
     
     def create_session(self):
@@ -769,7 +937,9 @@ class CBindings:
         )
         if error_code.value != ERRORCODE_OK or not handle:
             raise AuroraSDKError("Failed to create session, error code: {}".format(error_code.value))
-        return handle
+        # Hand the handle out as a c_void_p so every later call passes it to
+        # ctypes as-is instead of converting a Python int each time
+        return ctypes.c_void_p(handle)
     
     def release_session(self, handle):
         """Release SDK session."""
@@ -785,16 +955,45 @@ class CBindings:
             raise AuroraSDKError("Failed to get discovered servers, error code: {}".format(count))
         return list(servers[:count])
     
-    def discover_devices(self, handle, timeout=10.0):
-        """Discover Aurora devices on the network."""
-        import time
-        
-        # The C SDK performs passive discovery - we need to wait for it to discover devices
-        # Based on the pure C demo, we wait for the discovery timeout period
-        time.sleep(min(timeout, 10.0))  # Cap at 10 seconds max
-        
-        # Now get the discovered servers and convert to Python-friendly format
-        servers = self.get_discovered_servers(handle)
+    def discover_devices(self, handle, timeout=10.0, poll_interval=0.1, stable_polls=2):
+        """Discover Aurora devices on the network.
+
+        Returns once at least one device has been found and the discovered list
+        has not grown for ``stable_polls`` consecutive polls, or at the timeout.
+        """
+        # The C SDK performs passive discovery - poll its discovered list rather
+        # than sleeping out the whole timeout (capped at 10 seconds max)
+        deadline = time.monotonic() + min(timeout, 10.0)
+        servers = []
+        unchanged = 0
+        while True:
+            current = self.get_discovered_servers(handle)
+            if current and len(current) == len(servers):
+                unchanged += 1
+            else:
+                unchanged = 0
+            servers = current
+            if unchanged >= stable_polls:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll_interval, remaining))
+        
+        # Convert the discovered servers to Python-friendly format
+        return self._convert_servers_to_dict(servers)
+    
+    def discover_devices_until_first(self, handle, timeout=5.0, poll_interval=0.05):
+        """Discover Aurora devices, returning as soon as at least one has been found."""
+        deadline = time.monotonic() + min(timeout, 10.0)
+        while True:
+            servers = self.get_discovered_servers(handle)
+            if servers:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll_interval, remaining))
         return self._convert_servers_to_dict(servers)
     
     def _convert_servers_to_dict(self, servers):
@@ -806,8 +1005,9 @@ class CBindings:
             for j in range(server.connection_count):
                 conn_info = server.connection_info[j]
                 options.append({
-                    'protocol': conn_info.protocol_type.decode('utf-8', errors='ignore').rstrip('\x00'),
-                    'address': conn_info.address.decode('utf-8', errors='ignore').rstrip('\x00'),
+                    # c_char array fields already read only up to the first NUL
+                    'protocol': conn_info.protocol_type.decode('utf-8', errors='ignore'),
+                    'address': conn_info.address.decode('utf-8', errors='ignore'),
                     'port': conn_info.port
                 })
             
@@ -833,7 +1033,7 @@ class CBindings:
             # Assume it's already a ServerConnectionInfo structure
             server_info = device_info
             
-        error_code = self.lib.slamtec_aurora_sdk_controller_connect(
+        error_code = self._fn_connect(
             handle, ctypes.byref(server_info)
         )
         if error_code != ERRORCODE_OK:
@@ -842,8 +1042,6 @@ class CBindings:
     
     def connect_string(self, handle, connection_string):
         """Connect to Aurora device using connection string."""
-        from .data_types import ServerConnectionInfo, ConnectionInfo
-        
         # Create ServerConnectionInfo from connection string
         server_info = ServerConnectionInfo()
         server_info.connection_count = 1
@@ -854,7 +1052,7 @@ class CBindings:
         conn_info.address = connection_string.encode('utf-8')
         conn_info.port = 7447  # SLAMTEC_AURORA_SDK_REMOTE_SERVER_DEFAULT_PORT
         
-        error_code = self.lib.slamtec_aurora_sdk_controller_connect(
+        error_code = self._fn_connect(
             handle, ctypes.byref(server_info)
         )
         if error_code != ERRORCODE_OK:
@@ -863,7 +1061,7 @@ class CBindings:
     
     def connect(self, handle, server_info):
         """Connect to Aurora server (legacy method)."""
-        error_code = self.lib.slamtec_aurora_sdk_controller_connect(
+        error_code = self._fn_connect(
             handle, ctypes.byref(server_info)
         )
         if error_code != ERRORCODE_OK:
@@ -871,181 +1069,257 @@ class CBindings:
     
     def disconnect(self, handle):
         """Disconnect from Aurora server."""
-        self.lib.slamtec_aurora_sdk_controller_disconnect(handle)
+        self._fn_disconnect(handle)
     
     def is_connected(self, handle):
         """Check if connected to Aurora server."""
-        return bool(self.lib.slamtec_aurora_sdk_controller_is_connected(handle))
+        return self._fn_is_connected(handle)
     
     def set_map_data_syncing(self, handle, enable):
         """Enable/disable map data syncing."""
-        self.lib.slamtec_aurora_sdk_controller_set_map_data_syncing(handle, int(enable))
+        self._fn_set_map_data_syncing(handle, int(enable))
     
     def set_raw_data_subscription(self, handle, enable):
         """Enable/disable raw data subscription."""
-        error_code = self.lib.slamtec_aurora_sdk_controller_set_raw_data_subscription(
+        error_code = self._fn_set_raw_data_subscription(
             handle, int(enable)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to set raw data subscription, error code: {}".format(error_code))
+        _check(error_code, "Failed to set raw data subscription")
     
     def get_current_pose_se3(self, handle):
         """Get current pose in SE3 format with timestamp."""
         pose = PoseSE3()
-        timestamp_ns = ctypes.c_uint64()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_se3_with_timestamp(
-            handle, ctypes.byref(pose), ctypes.byref(timestamp_ns)
+        scratch = self._scratch
+        error_code = self._fn_get_current_pose_se3(
+            handle, ctypes.byref(pose), scratch.ts_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get current pose SE3, error code: {}".format(error_code))
-        return pose, timestamp_ns.value
+        _check(error_code, "Failed to get current pose SE3")
+        return pose, scratch.ts.value
     
     def get_current_pose(self, handle):
         """Get current pose in Euler angle format with timestamp."""
         pose = Pose()
-        timestamp_ns = ctypes.c_uint64()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_current_pose_with_timestamp(
-            handle, ctypes.byref(pose), ctypes.byref(timestamp_ns)
+        scratch = self._scratch
+        error_code = self._fn_get_current_pose(
+            handle, ctypes.byref(pose), scratch.ts_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get current pose, error code: {}".format(error_code))
-        return pose, timestamp_ns.value
+        _check(error_code, "Failed to get current pose")
+        return pose, scratch.ts.value
+    
+    def get_current_pose_se3_fast(self, handle):
+        """Get current SE3 pose as ((x, y, z), (qx, qy, qz, qw), timestamp_ns) using reused output storage."""
+        scratch = self._scratch
+        error_code = self._fn_get_current_pose_se3(handle, scratch.pose_ptr, scratch.ts_ref)
+        _check(error_code, "Failed to get current pose SE3")
+        v = scratch.pose[:]
+        return (v[0], v[1], v[2]), (v[3], v[4], v[5], v[6]), scratch.ts.value
+    
+    def get_current_pose_fast(self, handle):
+        """Get current Euler pose as ((x, y, z), (roll, pitch, yaw), timestamp_ns) using reused output storage."""
+        scratch = self._scratch
+        error_code = self._fn_get_current_pose(handle, scratch.pose_euler_ptr, scratch.ts_ref)
+        _check(error_code, "Failed to get current pose")
+        v = scratch.pose[:6]
+        return (v[0], v[1], v[2]), (v[3], v[4], v[5]), scratch.ts.value
+    
+    def get_current_pose_into(self, handle, pose_ptr, use_se3=True):
+        """Get current pose written through pose_ptr (POINTER(PoseSE3) or POINTER(Pose)); returns the timestamp."""
+        scratch = self._scratch
+        if use_se3:
+            error_code = self._fn_get_current_pose_se3(handle, pose_ptr, scratch.ts_ref)
+        else:
+            error_code = self._fn_get_current_pose(handle, pose_ptr, scratch.ts_ref)
+        _check(error_code, "Failed to get current pose")
+        return scratch.ts.value
     
     def get_device_basic_info(self, handle):
         """Get device basic information."""
         info = DeviceBasicInfo()
-        timestamp = ctypes.c_uint64()
+        scratch = self._scratch
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_basic_info(
-            handle, ctypes.byref(info), ctypes.byref(timestamp)
+            handle, ctypes.byref(info), scratch.ts_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get device basic info, error code: {}".format(error_code))
-        return info, timestamp.value
+        _check(error_code, "Failed to get device basic info")
+        return info, scratch.ts.value
     
     
-    def peek_camera_preview_image(self, handle, timestamp_ns=0, allow_nearest_frame=True):
-        """Get camera preview image with actual pixel data."""
+    def peek_camera_preview_image(self, handle, timestamp_ns=0, allow_nearest_frame=True, copy=True,
+                                  want_pixels=True):
+        """Get camera preview image with actual pixel data.
+
+        With ``copy=False`` the image data is returned as memoryviews over the
+        freshly allocated ctypes buffers instead of being copied into bytes.
+        The image sizes are remembered after the first frame, so later frames
+        are fetched with a single call instead of a size probe plus a fetch.
+        With ``want_pixels=False`` only the descriptor is fetched and
+        ``(desc, None, None)`` is returned without allocating image buffers.
+        """
         desc = StereoImagePairDesc()
-        
-        # First call to get image dimensions
         buffer_info = StereoImagePairBuffer()
-        buffer_info.imgdata_left = None
-        buffer_info.imgdata_right = None
-        buffer_info.imgdata_left_size = 0
-        buffer_info.imgdata_right_size = 0
-        
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_camera_preview_image(
-            handle, timestamp_ns, ctypes.byref(desc), ctypes.byref(buffer_info), 1 if allow_nearest_frame else 0
-        )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get camera preview image, error code: {}".format(error_code))
+        nearest = 1 if allow_nearest_frame else 0
+        
+        def image_sizes(desc):
+            left = desc.left_image_desc
+            right = desc.right_image_desc
+            return (left.data_size if left.width > 0 else 0,
+                    right.data_size if right.width > 0 else 0)
+        
+        sizes = self._preview_sizes
+        probed = sizes is None or not want_pixels
+        if probed:
+            # First call to get image dimensions
+            buffer_info.imgdata_left = None
+            buffer_info.imgdata_right = None
+            buffer_info.imgdata_left_size = 0
+            buffer_info.imgdata_right_size = 0
+            
+            error_code = self._fn_peek_camera_preview_image(
+                handle, timestamp_ns, ctypes.byref(desc), ctypes.byref(buffer_info), nearest
+            )
+            _check(error_code, "Failed to get camera preview image")
+            if not want_pixels:
+                return desc, None, None
+            sizes = image_sizes(desc)
         
         # Now allocate buffers and get actual image data
         left_data = None
         right_data = None
+        left_buffer = None
+        right_buffer = None
         
-        if desc.left_image_desc.width > 0 and desc.left_image_desc.data_size > 0:
+        if sizes[0] > 0:
             # Allocate buffer for left image
-            left_buffer = (ctypes.c_uint8 * desc.left_image_desc.data_size)()
-            buffer_info.imgdata_left = ctypes.cast(left_buffer, ctypes.c_void_p)
-            buffer_info.imgdata_left_size = desc.left_image_desc.data_size
+            left_buffer = (ctypes.c_uint8 * sizes[0])()
+            buffer_info.imgdata_left = ctypes.addressof(left_buffer)
+            buffer_info.imgdata_left_size = sizes[0]
         
-        if desc.right_image_desc.width > 0 and desc.right_image_desc.data_size > 0:
+        if sizes[1] > 0:
             # Allocate buffer for right image
-            right_buffer = (ctypes.c_uint8 * desc.right_image_desc.data_size)()
-            buffer_info.imgdata_right = ctypes.cast(right_buffer, ctypes.c_void_p)
-            buffer_info.imgdata_right_size = desc.right_image_desc.data_size
-        
-        # Second call to actually get the image data
-        if buffer_info.imgdata_left or buffer_info.imgdata_right:
-            error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_camera_preview_image(
-                handle, timestamp_ns, ctypes.byref(desc), ctypes.byref(buffer_info), 1 if allow_nearest_frame else 0
+            right_buffer = (ctypes.c_uint8 * sizes[1])()
+            buffer_info.imgdata_right = ctypes.addressof(right_buffer)
+            buffer_info.imgdata_right_size = sizes[1]
+        
+        # Call to actually get the image data
+        if left_buffer is not None or right_buffer is not None:
+            error_code = self._fn_peek_camera_preview_image(
+                handle, timestamp_ns, ctypes.byref(desc), ctypes.byref(buffer_info), nearest
             )
-            if error_code != ERRORCODE_OK:
-                raise AuroraSDKError("Failed to get camera preview image data, error code: {}".format(error_code))
+            if not probed and (error_code or image_sizes(desc) != sizes):
+                # The cached sizes no longer match the stream - probe again
+                self._preview_sizes = None
+                return self.peek_camera_preview_image(handle, timestamp_ns, allow_nearest_frame, copy)
+            _check(error_code, "Failed to get camera preview image data")
+            self._preview_sizes = sizes
             
             # Extract image data from buffers
-            if buffer_info.imgdata_left and desc.left_image_desc.data_size > 0:
-                left_data = bytes(left_buffer)
+            if left_buffer is not None and desc.left_image_desc.data_size > 0:
+                left_data = ctypes.string_at(ctypes.addressof(left_buffer), sizes[0]) if copy else memoryview(left_buffer).cast('B')
                 
-            if buffer_info.imgdata_right and desc.right_image_desc.data_size > 0:
-                right_data = bytes(right_buffer)
+            if right_buffer is not None and desc.right_image_desc.data_size > 0:
+                right_data = ctypes.string_at(ctypes.addressof(right_buffer), sizes[1]) if copy else memoryview(right_buffer).cast('B')
         
         return desc, left_data, right_data
     
-    def peek_tracking_data(self, handle):
-        """Get tracking frame data with keypoints."""
+    def peek_tracking_data(self, handle, copy=True, keypoints_as_numpy=False):
+        """Get tracking frame data with keypoints.
+
+        The SDK fills per-thread receive buffers that are reused across calls,
+        and each frame is copied out of them at its actual size. With
+        ``copy=False`` the image data is returned as memoryviews over freshly
+        allocated ctypes buffers the SDK writes into directly. Their sizes are
+        remembered from the previous frame, so only the first frame (and one
+        after a resolution change) is copied out of the receive buffers.
+        With ``keypoints_as_numpy=True`` the keypoints come back as NumPy record
+        arrays with the Keypoint dtype (``kps.x``, ``kps.y``, ``kps['flags']``;
+        ``kps.flags`` is the ndarray attribute) instead of lists of Keypoint structures.
+        """
         tracking_info = TrackingInfo()
+        max_keypoints = _TRACKING_MAX_KEYPOINTS
+        max_image_size = _TRACKING_MAX_IMAGE_SIZE
+        
+        def image_size(image_desc):
+            # Expected image size from the descriptor, 0 if there is no image
+            if image_desc.width <= 0 or image_desc.height <= 0:
+                return 0
+            size = image_desc.width * image_desc.height
+            if image_desc.format == 1:  # RGB
+                size *= 3
+            elif image_desc.format == 2:  # RGBA
+                size *= 4
+            return size
+        
+        # Keypoints are always copied out, so this thread's receive buffers are reused
+        buffers = self._scratch.tracking
+        if buffers is None:
+            buffers = self._scratch.tracking = _TrackingBuffers()
+        
+        sizes = None if copy else self._tracking_sizes
+        if sizes is not None:
+            # Receive the images straight into per-call buffers of the last frame's size
+            left_buffer = (ctypes.c_uint8 * sizes[0])() if sizes[0] > 0 else None
+            right_buffer = (ctypes.c_uint8 * sizes[1])() if sizes[1] > 0 else None
+            buffer_info = TrackingDataBuffer()
+            if left_buffer is not None:
+                buffer_info.imgdata_left = ctypes.addressof(left_buffer)
+                buffer_info.imgdata_left_size = sizes[0]
+            if right_buffer is not None:
+                buffer_info.imgdata_right = ctypes.addressof(right_buffer)
+                buffer_info.imgdata_right_size = sizes[1]
+            buffer_info.keypoints_left = buffers.left_keypoints
+            buffer_info.keypoints_left_buffer_count = max_keypoints
+            buffer_info.keypoints_right = buffers.right_keypoints
+            buffer_info.keypoints_right_buffer_count = max_keypoints
+            
+            error_code = self._fn_peek_tracking_data(
+                handle, ctypes.byref(tracking_info), ctypes.byref(buffer_info)
+            )
+            if error_code or (image_size(tracking_info.left_image_desc),
+                              image_size(tracking_info.right_image_desc)) != sizes:
+                # The cached sizes no longer match the stream - fetch into the receive buffers
+                self._tracking_sizes = None
+                return self.peek_tracking_data(handle, copy, keypoints_as_numpy)
+        else:
+            # Call the tracking data function
+            error_code = self._fn_peek_tracking_data(
+                handle, ctypes.byref(tracking_info), buffers.reset()
+            )
+            _check(error_code, "Failed to get tracking data")
+        
+        # Extract keypoints - return actual Keypoint objects with .x, .y, .flags attributes
+        left_count = max(0, min(tracking_info.keypoints_left_count, max_keypoints))
+        right_count = max(0, min(tracking_info.keypoints_right_count, max_keypoints))
+        if keypoints_as_numpy:
+            keypoint_dtype = np.dtype(Keypoint)
+            left_keypoints = np.frombuffer(
+                buffers.left_keypoints, dtype=keypoint_dtype, count=left_count).copy().view(np.recarray)
+            right_keypoints = np.frombuffer(
+                buffers.right_keypoints, dtype=keypoint_dtype, count=right_count).copy().view(np.recarray)
+        else:
+            # Copy out of the reused buffers in one block so later peeks cannot alter them
+            left_keypoints = list((Keypoint * left_count).from_buffer_copy(buffers.left_keypoints))
+            right_keypoints = list((Keypoint * right_count).from_buffer_copy(buffers.right_keypoints))
         
-        # Allocate reasonable buffer sizes upfront (typical approach for tracking data)
-        max_keypoints = 1000  # Should be enough for most cases
-        max_image_size = 1920 * 1080 * 4  # Assume max 1920x1080 RGBA
-        
-        # Allocate image buffers
-        left_image_buffer = (ctypes.c_uint8 * max_image_size)()
-        right_image_buffer = (ctypes.c_uint8 * max_image_size)()
-        
-        # Allocate keypoint buffers
-        left_keypoints_buffer = (Keypoint * max_keypoints)()
-        right_keypoints_buffer = (Keypoint * max_keypoints)()
-        
-        # Create tracking data buffer with allocated buffers
-        tracking_buffer = TrackingDataBuffer()
-        tracking_buffer.imgdata_left = ctypes.cast(left_image_buffer, ctypes.c_void_p)
-        tracking_buffer.imgdata_left_size = max_image_size
-        tracking_buffer.imgdata_right = ctypes.cast(right_image_buffer, ctypes.c_void_p)
-        tracking_buffer.imgdata_right_size = max_image_size
-        tracking_buffer.keypoints_left = ctypes.cast(left_keypoints_buffer, ctypes.POINTER(Keypoint))
-        tracking_buffer.keypoints_left_buffer_count = max_keypoints
-        tracking_buffer.keypoints_right = ctypes.cast(right_keypoints_buffer, ctypes.POINTER(Keypoint))
-        tracking_buffer.keypoints_right_buffer_count = max_keypoints
-        
-        # Call the tracking data function
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_tracking_data(
-            handle, ctypes.byref(tracking_info), ctypes.byref(tracking_buffer)
-        )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get tracking data, error code: {}".format(error_code))
-        
-        # Extract keypoints - return actual Keypoint objects
-        left_keypoints = []
-        if tracking_info.keypoints_left_count > 0:
-            for i in range(min(tracking_info.keypoints_left_count, max_keypoints)):
-                kp = left_keypoints_buffer[i]
-                left_keypoints.append(kp)  # Keep as Keypoint object with .x, .y, .flags attributes
-        
-        right_keypoints = []
-        if tracking_info.keypoints_right_count > 0:
-            for i in range(min(tracking_info.keypoints_right_count, max_keypoints)):
-                kp = right_keypoints_buffer[i]
-                right_keypoints.append(kp)  # Keep as Keypoint object with .x, .y, .flags attributes
         # Extract image data if available
+        if sizes is not None:
+            left_image_data = memoryview(left_buffer).cast('B') if left_buffer is not None else None
+            right_image_data = memoryview(right_buffer).cast('B') if right_buffer is not None else None
+            return tracking_info, left_keypoints, right_keypoints, left_image_data, right_image_data
+        
         left_image_data = None
         right_image_data = None
+        left_size = image_size(tracking_info.left_image_desc)
+        right_size = image_size(tracking_info.right_image_desc)
         
-        if tracking_info.left_image_desc.width > 0 and tracking_info.left_image_desc.height > 0:
-            # Calculate expected image size
-            expected_size = tracking_info.left_image_desc.width * tracking_info.left_image_desc.height
-            if tracking_info.left_image_desc.format == 1:  # RGB
-                expected_size *= 3
-            elif tracking_info.left_image_desc.format == 2:  # RGBA
-                expected_size *= 4
-            
-            # Extract image data from buffer
-            if expected_size <= max_image_size:
-                left_image_data = bytes(left_image_buffer[:expected_size])
-        
-        if tracking_info.right_image_desc.width > 0 and tracking_info.right_image_desc.height > 0:
-            # Calculate expected image size
-            expected_size = tracking_info.right_image_desc.width * tracking_info.right_image_desc.height
-            if tracking_info.right_image_desc.format == 1:  # RGB
-                expected_size *= 3
-            elif tracking_info.right_image_desc.format == 2:  # RGBA
-                expected_size *= 4
-            
-            # Extract image data from buffer
-            if expected_size <= max_image_size:
-                right_image_data = bytes(right_image_buffer[:expected_size])
+        if 0 < left_size <= max_image_size:
+            left_image_data = (ctypes.string_at(ctypes.addressof(buffers.left_image), left_size) if copy
+                               else memoryview(bytearray(memoryview(buffers.left_image).cast('B')[:left_size])))
+        
+        if 0 < right_size <= max_image_size:
+            right_image_data = (ctypes.string_at(ctypes.addressof(buffers.right_image), right_size) if copy
+                                else memoryview(bytearray(memoryview(buffers.right_image).cast('B')[:right_size])))
+        
+        if not copy and left_size <= max_image_size and right_size <= max_image_size:
+            self._tracking_sizes = (left_size, right_size)
         
         return tracking_info, left_keypoints, right_keypoints, left_image_data, right_image_data
     
@@ -1053,14 +1327,12 @@ class CBindings:
     def require_mapping_mode(self, handle, timeout_ms=10000):
         """Require the device to enter mapping mode."""
         error_code = self.lib.slamtec_aurora_sdk_controller_require_mapping_mode(handle, timeout_ms)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to enter mapping mode, error code: {}".format(error_code))
+        _check(error_code, "Failed to enter mapping mode")
     
     def resync_map_data(self, handle, invalidate_cache=True):
         """Force resync of map data."""
         error_code = self.lib.slamtec_aurora_sdk_controller_resync_map_data(handle, int(invalidate_cache))
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to resync map data, error code: {}".format(error_code))
+        _check(error_code, "Failed to resync map data")
     
     def get_global_mapping_info_legacy(self, handle):
         """Get global mapping information (legacy)."""
@@ -1082,8 +1354,6 @@ class CBindings:
     
     def start_lidar2d_preview_map(self, handle, resolution=0.05):
         """Start LIDAR 2D map preview generation."""
-        from .data_types import GridMapGenerationOptions
-        
         # Create generation options
         options = GridMapGenerationOptions()
         options.resolution = resolution
@@ -1098,8 +1368,7 @@ class CBindings:
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_start_background_update(
             handle, ctypes.byref(options)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to start LIDAR 2D map preview, error code: {}".format(error_code))
+        _check(error_code, "Failed to start LIDAR 2D map preview")
     
     def stop_lidar2d_preview_map(self, handle):
         """Stop LIDAR 2D map preview generation."""
@@ -1120,46 +1389,16 @@ class CBindings:
     
     def get_global_mapping_info(self, handle):
         """Get global mapping information."""
-        from .data_types import GlobalMapDesc
-        
         global_desc = GlobalMapDesc()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_global_mapping_info(
+        error_code = self._fn_get_global_mapping_info(
             handle, ctypes.byref(global_desc)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get global mapping info, error code: {}".format(error_code))
+        _check(error_code, "Failed to get global mapping info")
         
-        # Return complete GlobalMapDesc structure with all fields accessible
-        return {
-            # Fetching/retrieval counts
-            'lastMPCountToFetch': global_desc.lastMPCountToFetch,
-            'lastKFCountToFetch': global_desc.lastKFCountToFetch,
-            'lastMapCountToFetch': global_desc.lastMapCountToFetch,
-            'lastMPRetrieved': global_desc.lastMPRetrieved,
-            'lastKFRetrieved': global_desc.lastKFRetrieved,
-            
-            # Total counts
-            'totalMPCount': global_desc.totalMPCount,
-            'total_kf_count': global_desc.totalKFCount,  # Key field for sync status
-            'totalMapCount': global_desc.totalMapCount,
-            
-            # Fetched counts (for sync status calculation)
-            'totalMPCountFetched': global_desc.totalMPCountFetched,
-            'total_kf_count_fetched': global_desc.totalKFCountFetched,  # Key field for sync status
-            'totalMapCountFetched': global_desc.totalMapCountFetched,
-            
-            # Current active counts
-            'currentActiveMPCount': global_desc.currentActiveMPCount,
-            'currentActiveKFCount': global_desc.currentActiveKFCount,
-            
-            # Map and state information
-            'active_map_id': global_desc.activeMapID,
-            'mappingFlags': global_desc.mappingFlags,
-            'slidingWindowStartKFId': global_desc.slidingWindowStartKFId
-        }
+        return GlobalMappingInfo(global_desc)
     
     def access_map_data(self, handle, map_ids=None, fetch_kf=True, fetch_mp=True, fetch_mapinfo=False, 
-                        kf_fetch_flags=None, mp_fetch_flags=None):
+                        kf_fetch_flags=None, mp_fetch_flags=None, mp_out=None):
         """
         Access visual map data (map points and keyframes).
         
@@ -1172,20 +1411,64 @@ class CBindings:
             fetch_mapinfo: Whether to fetch map info (default: False)
             kf_fetch_flags: Keyframe fetch flags (default: None, uses FETCH_ALL)
             mp_fetch_flags: Map point fetch flags (default: None, uses FETCH_ALL)
+            mp_out: Optional dict of preallocated arrays ('positions', 'ids', 'map_ids',
+                    'timestamps') that map points are written into instead of dicts
+        
+        Raises:
+            InvalidArgumentError: If an mp_out array has the wrong shape, dtype or length
         
         Returns:
-            Dict containing 'map_points', 'keyframes', and 'loop_closures' lists with full metadata
+            Dict containing 'map_points', 'keyframes', and 'loop_closures' lists with full metadata.
+            With mp_out, 'map_points' holds views of the filled rows of each array and
+            'map_point_count' the number of map points reported by the SDK.
         """
-        from .data_types import MapDataVisitor, MapPointCallback, KeyframeCallback, MapDescCallback
-        
         # Storage for collected data - use lists that persist outside callback scope
         # Use set for loop closures to automatically handle duplicates
         collected_data = {'map_points': [], 'keyframes': [], 'loop_closures': set(), 'map_info': {}}
+        mp_count = [0]
+        
+        if mp_out is not None:
+            # Validated before the fetch, so bad arrays fail without a wasted SDK call
+            mp_capacity = _check_map_point_out(mp_out)
+            mp_positions = mp_out.get('positions')
+            mp_ids = mp_out.get('ids')
+            mp_map_ids = mp_out.get('map_ids')
+            mp_timestamps = mp_out.get('timestamps')
+            # The callback only copies each raw MapPointDesc into this staging
+            # array; the columns are filled from it in one vectorised pass
+            mp_stage = (MapPointDesc * mp_capacity)()
+            mp_stage_addr = ctypes.addressof(mp_stage)
+            mp_size = ctypes.sizeof(MapPointDesc)
+            
+            def finish_mp_out(data):
+                filled = min(mp_count[0], mp_capacity)
+                if filled:
+                    staged = np.frombuffer(mp_stage, dtype=np.dtype(MapPointDesc), count=filled)
+                    if mp_positions is not None:
+                        pos = staged['position']
+                        mp_positions[:filled, 0] = pos['x']
+                        mp_positions[:filled, 1] = pos['y']
+                        mp_positions[:filled, 2] = pos['z']
+                    if mp_ids is not None:
+                        mp_ids[:filled] = staged['id']
+                    if mp_map_ids is not None:
+                        mp_map_ids[:filled] = staged['map_id']
+                    if mp_timestamps is not None:
+                        mp_timestamps[:filled] = staged['timestamp']
+                data['map_points'] = {key: arr[:filled] for key, arr in mp_out.items()}
+                data['map_point_count'] = mp_count[0]
+                return data
+        else:
+            def finish_mp_out(data):
+                return data
+        
+        # Callbacks are only registered when the corresponding fetch flag is
+        # set, so they don't re-check it per invocation
         
         # Callback to collect map points - make more robust
         def map_point_callback(user_data, map_point_ptr):
             try:
-                if map_point_ptr and fetch_mp:
+                if map_point_ptr:
                     mp = map_point_ptr.contents
                     # Include all metadata: position, id, map_id, timestamp
                     map_point_data = {
@@ -1198,17 +1481,26 @@ class CBindings:
             except Exception as e:
                 pass  # Ignore errors in callback to prevent crashes
         
+        # Callback staging map points for the caller's arrays. The capacity
+        # check is the only bounds check needed, so there is nothing to guard
+        # with a try block here.
+        def map_point_out_callback(user_data, map_point_ptr):
+            if map_point_ptr:
+                i = mp_count[0]
+                mp_count[0] = i + 1
+                if i < mp_capacity:
+                    ctypes.memmove(mp_stage_addr + i * mp_size, map_point_ptr, mp_size)
+        
         # Callback to collect keyframes - make more robust
         def keyframe_callback(user_data, keyframe_ptr, looped_ids, connected_ids, related_mp_ids):
             try:
-                if keyframe_ptr and fetch_kf:
+                if keyframe_ptr:
                     kf = keyframe_ptr.contents
                     # Use SE3 pose for position and rotation
                     pos = kf.pose_se3.translation
                     rot = kf.pose_se3.quaternion
                     
                     # Check if keyframe is fixed
-                    from .data_types import SLAMTEC_AURORA_SDK_KEYFRAME_FLAG_FIXED
                     is_fixed = bool(kf.flags & SLAMTEC_AURORA_SDK_KEYFRAME_FLAG_FIXED)
                     
                     # Store keyframe with all metadata
@@ -1224,35 +1516,28 @@ class CBindings:
                     # Process related map points if available (SDK 2.0.1)
                     if related_mp_ids and kf.related_mp_count > 0:
                         try:
-                            related_mp_list = []
-                            for i in range(kf.related_mp_count):
-                                mp_id = related_mp_ids[i]
-                                if mp_id > 0:  # Valid map point ID
-                                    related_mp_list.append(int(mp_id))
+                            # Slicing the pointer converts all IDs in one call
+                            related_mp_list = [mp_id for mp_id in related_mp_ids[:kf.related_mp_count]
+                                               if mp_id > 0]  # Valid map point IDs
                             if related_mp_list:
                                 keyframe_data['related_map_points'] = related_mp_list
                         except Exception:
-                            pass  # Ignore errors in processing related map points
+                            pass  # Keep the keyframe even if its related map points are unreadable
                     
                     collected_data['keyframes'].append(keyframe_data)
                     
                     # Process loop closure connections
                     if looped_ids and kf.looped_frame_count > 0:
                         # Use the actual count from the keyframe structure
-                        try:
-                            for i in range(kf.looped_frame_count):
-                                looped_frame_id = looped_ids[i]
-                                if looped_frame_id > 0:  # Valid frame ID
-                                    # Store loop closure connection: (from_keyframe_id, to_keyframe_id)
-                                    # Use consistent ordering to avoid duplicates: always put smaller ID first
-                                    kf_id = int(kf.id)
-                                    looped_id = int(looped_frame_id)
-                                    loop_closure = (min(kf_id, looped_id), max(kf_id, looped_id))
-                                    
-                                    # Use set to automatically handle duplicates
-                                    collected_data['loop_closures'].add(loop_closure)
-                        except Exception:
-                            pass  # Ignore errors in loop processing
+                        kf_id = kf.id
+                        # Store loop closure connections as (from_keyframe_id, to_keyframe_id)
+                        # Use consistent ordering to avoid duplicates: always put smaller ID first
+                        # Use set to automatically handle duplicates
+                        collected_data['loop_closures'].update(
+                            (kf_id, looped_id) if kf_id <= looped_id else (looped_id, kf_id)
+                            for looped_id in looped_ids[:kf.looped_frame_count]
+                            if looped_id > 0  # Valid frame ID
+                        )
                             
             except Exception:
                 pass  # Ignore errors in callback to prevent crashes
@@ -1260,10 +1545,9 @@ class CBindings:
         # Callback for map description
         def map_desc_callback(user_data, map_desc_ptr):
             try:
-                if map_desc_ptr and fetch_mapinfo:
+                if map_desc_ptr:
                     # Cast c_void_p to MapDesc pointer
-                    from .data_types import MapDesc
-                    map_desc = ctypes.cast(map_desc_ptr, ctypes.POINTER(MapDesc)).contents
+                    map_desc = ctypes.cast(map_desc_ptr, _P_MapDesc).contents
                     map_info = {
                         'id': int(map_desc.map_id),
                         'point_count': int(map_desc.map_point_count),
@@ -1279,7 +1563,10 @@ class CBindings:
                 pass  # Ignore errors in callback
         
         # Keep references to prevent garbage collection - only create needed callbacks
-        map_point_cb = MapPointCallback(map_point_callback) if fetch_mp else None
+        if fetch_mp:
+            map_point_cb = MapPointCallback(map_point_callback if mp_out is None else map_point_out_callback)
+        else:
+            map_point_cb = None
         keyframe_cb = KeyframeCallback(keyframe_callback) if fetch_kf else None
         map_desc_cb = MapDescCallback(map_desc_callback) if fetch_mapinfo else None
         
@@ -1315,32 +1602,46 @@ class CBindings:
             
             if error_code != ERRORCODE_OK:
                 # Don't raise exception, just return empty data
-                return {'map_points': [], 'keyframes': [], 'loop_closures': [], 'map_info': {}}
+                mp_count[0] = 0
+                return finish_mp_out({'map_points': [], 'keyframes': [], 'loop_closures': [], 'map_info': {}})
                 
         except Exception as e:
             # If there's an error, return empty data but don't fail completely
-            return {'map_points': [], 'keyframes': [], 'loop_closures': [], 'map_info': {}}
+            mp_count[0] = 0
+            return finish_mp_out({'map_points': [], 'keyframes': [], 'loop_closures': [], 'map_info': {}})
         
         # Convert loop closures set back to list for consistency
         collected_data['loop_closures'] = list(collected_data['loop_closures'])
-        return collected_data
+        return finish_mp_out(collected_data)
     
     # LiDAR scan data functions
-    def peek_recent_lidar_scan(self, handle, max_points=8192, force_latest=0):
-        """Get the most recent LiDAR scan data."""
-        from .data_types import LidarSinglelayerScanDataInfo, LidarScanPoint, PoseSE3
-        
+    def peek_recent_lidar_scan(self, handle, max_points=8192, force_latest=0, out=None, as_numpy=False):
+        """Get the most recent LiDAR scan data.
+
+        If ``out`` is given (a NumPy array with the LidarScanPoint dtype holding at
+        least ``max_points`` records), the points are written into it and a view of
+        the filled records is returned. With ``as_numpy=True`` the points come back
+        as a structured array over the freshly allocated buffer; otherwise they are
+        a slice of the ctypes LidarScanPoint array.
+        """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy LiDAR scan retrieval")
         # Create scan info structure
         scan_info = LidarSinglelayerScanDataInfo()
         
         # Create scan points buffer
-        scan_points = (LidarScanPoint * max_points)()
+        if out is not None:
+            _check_out_array(out, LidarScanPoint, "LiDAR scan buffer")
+            max_points = min(max_points, len(out))
+            scan_points = out.ctypes.data_as(_P_LidarScanPoint)
+        else:
+            scan_points = (LidarScanPoint * max_points)()
         
         # Create pose structure for scan pose
         scan_pose = PoseSE3()
         
         # Call the C function with all 6 required arguments
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_recent_lidar_scan_singlelayer(
+        error_code = self._fn_peek_recent_lidar_scan(
             handle, 
             ctypes.byref(scan_info), 
             scan_points, 
@@ -1349,12 +1650,18 @@ class CBindings:
             force_latest
         )
         
-        if error_code != ERRORCODE_OK:
+        if error_code:  # ERRORCODE_OK is 0, as in _check
             if error_code == ERRORCODE_NOT_READY:
                 return None  # No scan data available yet
             else:
                 raise AuroraSDKError("Failed to get LiDAR scan data, error code: {}".format(error_code))
         
+        if out is not None:
+            return scan_info, out[:min(scan_info.scan_count, max_points)], scan_pose
+        if as_numpy:
+            points = np.frombuffer(scan_points, dtype=np.dtype(LidarScanPoint),
+                                   count=min(scan_info.scan_count, max_points))
+            return scan_info, points, scan_pose
         return scan_info, scan_points[:scan_info.scan_count], scan_pose
     
     # 2D Grid Map functions
@@ -1363,8 +1670,7 @@ class CBindings:
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_start_background_update(
             handle, ctypes.byref(options)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to start LIDAR 2D map preview, error code: {}".format(error_code))
+        _check(error_code, "Failed to start LIDAR 2D map preview")
     
     def stop_lidar2dmap_preview(self, handle):
         """Stop LIDAR 2D grid map preview generation."""
@@ -1381,36 +1687,42 @@ class CBindings:
     
     def is_lidar2dmap_preview_updating(self, handle):
         """Check if LIDAR 2D grid map preview is updating."""
-        return bool(self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_is_background_updating(handle))
+        return self._fn_previewmap_is_background_updating(handle)
     
     def require_lidar2dmap_redraw(self, handle):
         """Require redraw of the 2D map preview."""
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_require_redraw(handle)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to require map redraw, error code: {}".format(error_code))
+        _check(error_code, "Failed to require map redraw")
     
     def get_lidar2dmap_dirty_rect(self, handle):
         """Get and reset the dirty rectangle of the 2D map preview."""
-        from .data_types import Rect
-        
         dirty_rect = Rect()
-        map_changed = ctypes.c_int()
+        scratch = self._scratch
         
-        error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_and_reset_update_dirty_rect(
-            handle, ctypes.byref(dirty_rect), ctypes.byref(map_changed)
+        error_code = self._fn_previewmap_get_dirty_rect(
+            handle, ctypes.byref(dirty_rect), scratch.flag_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get dirty rect, error code: {}".format(error_code))
+        _check(error_code, "Failed to get dirty rect")
+        
+        return dirty_rect, bool(scratch.flag.value)
+    
+    def get_lidar2dmap_dirty_rect_fast(self, handle):
+        """Get and reset the dirty rectangle as ((x, y, width, height), map_changed) using reused output storage."""
+        scratch = self._scratch
+        error_code = self._fn_previewmap_get_dirty_rect(
+            handle, scratch.rect_ref, scratch.flag_ref
+        )
+        _check(error_code, "Failed to get dirty rect")
         
-        return dirty_rect, bool(map_changed.value)
+        rect = scratch.rect
+        return (rect.x, rect.y, rect.width, rect.height), bool(scratch.flag.value)
     
     def set_lidar2dmap_auto_floor_detection(self, handle, enable):
         """Enable/disable auto floor detection for 2D map."""
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_set_auto_floor_detection(
-            handle, int(enable)
+            handle, enable
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to set auto floor detection, error code: {}".format(error_code))
+        _check(error_code, "Failed to set auto floor detection")
     
     def is_lidar2dmap_auto_floor_detection(self, handle):
         """Check if auto floor detection is enabled."""
@@ -1418,14 +1730,11 @@ class CBindings:
     
     def get_gridmap_dimension(self, gridmap_handle, get_max_capacity=False):
         """Get the dimension of a 2D grid map."""
-        from .data_types import GridMap2DDimension
-        
         dimension = GridMap2DDimension()
-        error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_dimension(
-            gridmap_handle, ctypes.byref(dimension), int(get_max_capacity)
+        error_code = self._fn_gridmap_get_dimension(
+            gridmap_handle, ctypes.byref(dimension), get_max_capacity
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get grid map dimension, error code: {}".format(error_code))
+        _check(error_code, "Failed to get grid map dimension")
         
         return dimension
     
@@ -1436,14 +1745,16 @@ class CBindings:
         Args:
             gridmap_handle: Handle to the grid map
             fetch_rect: Rectangle area to fetch (in meters)
-            resolution: Map resolution in meters per cell (default: 0.05m = 5cm)
+            resolution: Map resolution in meters per cell (default: 0.05m = 5cm), used
+                        only if the map's own resolution cannot be queried
             l2p_mapping: If True, perform log-odd to linear (0-255) mapping for visualization.
                         If False, return raw data for navigation (default: True)
         
         Returns:
-            tuple: (cell_data_list, fetch_info)
+            tuple: (cell_data, fetch_info). cell_data is a flat uint8 NumPy array
+            of cell_width * cell_height cells when NumPy is available, else a list.
         """
-        from .data_types import GridMap2DFetchInfo
+        empty_cells = np.zeros(0, dtype=np.uint8) if NUMPY_AVAILABLE else []
         
         # Validate input rectangle
         if fetch_rect.width <= 0 or fetch_rect.height <= 0:
@@ -1453,19 +1764,25 @@ class CBindings:
             fetch_info.real_y = fetch_rect.y
             fetch_info.cell_width = 0
             fetch_info.cell_height = 0
-            return [], fetch_info
+            return empty_cells, fetch_info
+        
+        # Size the buffer from the map's own resolution rather than the caller's
+        # hint, so it can be exact instead of padded with 2x slack
+        try:
+            resolution = self.gridmap_get_resolution(gridmap_handle) or resolution
+        except AuroraSDKError:
+            pass
         
-        # Calculate buffer size based on fetch rectangle and resolution
-        # This is the correct way to calculate expected cell count
-        expected_width_cells = int(abs(fetch_rect.width) / resolution) + 1
-        expected_height_cells = int(abs(fetch_rect.height) / resolution) + 1
+        # The rect may straddle cell boundaries on both sides, hence +2
+        expected_width_cells = int(abs(fetch_rect.width) / resolution) + 2
+        expected_height_cells = int(abs(fetch_rect.height) / resolution) + 2
         buffer_size = expected_width_cells * expected_height_cells
         
-        # Add some safety margin but cap at reasonable size
-        buffer_size = min(buffer_size * 2, 50000000)  # Cap at 50M cells for safety
+        # Cap at reasonable size
+        buffer_size = min(buffer_size, 50000000)  # Cap at 50M cells for safety
         
-        # Allocate buffer
-        cell_buffer = (ctypes.c_uint8 * buffer_size)()
+        # Receive into this thread's reusable buffer; the cells are copied out below
+        cell_buffer = self._scratch.receive_buffer(buffer_size)
         fetch_info = GridMap2DFetchInfo()
         
         # Initialize fetch_info
@@ -1475,17 +1792,16 @@ class CBindings:
         fetch_info.cell_height = 0
         
         # Call C function with correct parameter order and l2p_mapping
-        error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_read_cell_data(
+        error_code = self._fn_gridmap_read_cell_data(
             gridmap_handle,
             ctypes.byref(fetch_rect),
             ctypes.byref(fetch_info),  # info_out comes before cell_buffer
             cell_buffer,
             buffer_size,  # explicit buffer size
-            int(l2p_mapping)  # l2p_mapping parameter
+            l2p_mapping  # l2p_mapping parameter
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to read grid map cell data, error code: {}".format(error_code))
+        _check(error_code, "Failed to read grid map cell data")
         
         # Get actual data size from fetch_info
         actual_data_size = fetch_info.cell_width * fetch_info.cell_height
@@ -1496,19 +1812,21 @@ class CBindings:
             # Return empty data if fetch_info contains invalid values
             fetch_info.cell_width = 0
             fetch_info.cell_height = 0
-            return [], fetch_info
+            return empty_cells, fetch_info
         
         # Return actual data based on fetch_info
         if actual_data_size > 0:
+            if NUMPY_AVAILABLE:
+                # One memcpy out of the (oversized) receive buffer instead of
+                # boxing every cell into a Python int
+                return np.frombuffer(cell_buffer, dtype=np.uint8, count=actual_data_size).copy(), fetch_info
             return list(cell_buffer[:actual_data_size]), fetch_info
         else:
-            return [], fetch_info
+            return empty_cells, fetch_info
     
     # Auto floor detection operations
     def get_floor_detection_histogram(self, handle):
         """Get floor detection histogram data."""
-        from .data_types import FloorDetectionHistogramInfo
-        
         # Get histogram info first
         histogram_info = FloorDetectionHistogramInfo()
         
@@ -1523,47 +1841,60 @@ class CBindings:
             max_bins
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get floor detection histogram, error code: {}".format(error_code))
+        _check(error_code, "Failed to get floor detection histogram")
         
         # Extract actual histogram data based on bin_total_count
-        actual_count = min(histogram_info.bin_total_count, max_bins)
-        histogram_data = [histogram_buffer[i] for i in range(actual_count)]
+        actual_count = max(0, min(histogram_info.bin_total_count, max_bins))
+        if NUMPY_AVAILABLE:
+            histogram_data = np.frombuffer(histogram_buffer, dtype=np.float32, count=actual_count).copy()
+        else:
+            histogram_data = histogram_buffer[:actual_count]
         
         return histogram_info, histogram_data
     
-    def get_all_floor_detection_info(self, handle):
-        """Get all floor detection descriptions and current floor ID."""
-        from .data_types import FloorDetectionDesc
-        
+    def get_all_floor_detection_info(self, handle, as_numpy=False):
+        """Get all floor detection descriptions and current floor ID.
+
+        With ``as_numpy=True`` the descriptions are returned as a NumPy record
+        array with the FloorDetectionDesc dtype, so ``desc.floorID`` style
+        attribute access keeps working on its elements.
+        """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy floor detection retrieval")
         # Allocate buffer for floor descriptions
         max_floors = 20  # Should be enough for most scenarios
-        desc_buffer = (FloorDetectionDesc * max_floors)()
-        actual_count = ctypes.c_size_t()
-        current_floor_id = ctypes.c_int()
+        scratch = self._scratch
+        if as_numpy:
+            # Copied out below, so this thread's array can be reused
+            desc_buffer = scratch.struct_array(FloorDetectionDesc, max_floors)
+        else:
+            desc_buffer = (FloorDetectionDesc * max_floors)()
+        actual_count = scratch.count
+        current_floor_id = scratch.flag
         
         error_code = self.lib.slamtec_aurora_sdk_autofloordetection_get_all_detection_info(
             handle,
             desc_buffer,
             max_floors,
-            ctypes.byref(actual_count),
-            ctypes.byref(current_floor_id)
+            scratch.count_ref,
+            scratch.flag_ref
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get all floor detection info, error code: {}".format(error_code))
+        _check(error_code, "Failed to get all floor detection info")
         
         # Extract floor descriptions
-        floor_descriptions = []
-        for i in range(min(actual_count.value, max_floors)):
-            floor_descriptions.append(desc_buffer[i])
+        floor_count = min(actual_count.value, max_floors)
+        if as_numpy:
+            floor_descriptions = np.frombuffer(
+                desc_buffer, dtype=np.dtype(FloorDetectionDesc), count=floor_count
+            ).copy().view(np.recarray)
+        else:
+            floor_descriptions = desc_buffer[:floor_count]
         
         return floor_descriptions, current_floor_id.value
     
     def get_current_floor_detection_desc(self, handle):
         """Get current floor detection description."""
-        from .data_types import FloorDetectionDesc
-        
         desc = FloorDetectionDesc()
         
         error_code = self.lib.slamtec_aurora_sdk_autofloordetection_get_current_detection_desc(
@@ -1571,8 +1902,7 @@ class CBindings:
             ctypes.byref(desc)
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get current floor detection desc, error code: {}".format(error_code))
+        _check(error_code, "Failed to get current floor detection desc")
         
         return desc
     
@@ -1589,8 +1919,6 @@ class CBindings:
         Returns:
             Handle to the generated 2D grid map
         """
-        from .data_types import GridMapGenerationOptions
-        
         # Output handle for the generated map
         generated_handle = ctypes.c_void_p()
         
@@ -1599,11 +1927,10 @@ class CBindings:
             ctypes.byref(generated_handle),
             ctypes.byref(build_options),
             int(wait_for_data_sync),
-            ctypes.c_uint64(timeout_ms)
+            timeout_ms
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to generate full 2D LiDAR map, error code: {}".format(error_code))
+        _check(error_code, "Failed to generate full 2D LiDAR map")
         
         return generated_handle
     
@@ -1613,149 +1940,141 @@ class CBindings:
         error_code = self.lib.slamtec_aurora_sdk_controller_set_enhanced_imaging_subscription(
             handle, enhanced_image_type, int(enable)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to set enhanced imaging subscription, error code: {}".format(error_code))
+        _check(error_code, "Failed to set enhanced imaging subscription")
     
     def is_enhanced_imaging_subscribed(self, handle, enhanced_image_type):
         """Check if enhanced imaging is subscribed for specific image type."""
-        return bool(self.lib.slamtec_aurora_sdk_controller_is_enhanced_imaging_subscribed(
-            handle, enhanced_image_type
-        ))
+        return bool(self._fn_is_enhanced_imaging_subscribed(handle, enhanced_image_type))
     
     def require_semantic_segmentation_alternative_model(self, handle, use_alternative_model, timeout_ms=5000):
         """Require semantic segmentation to use alternative model."""
         error_code = self.lib.slamtec_aurora_sdk_controller_require_semantic_segmentation_alternative_model(
             handle, int(use_alternative_model), timeout_ms
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to set semantic segmentation model, error code: {}".format(error_code))
+        _check(error_code, "Failed to set semantic segmentation model")
     
     # Enhanced Imaging API methods (SDK 2.0)
     def get_camera_calibration(self, handle):
         """Get camera calibration parameters."""
-        from .data_types import CameraCalibrationInfo
-        
         calibration_info = CameraCalibrationInfo()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_camera_calibration(
             handle, ctypes.byref(calibration_info)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get camera calibration, error code: {}".format(error_code))
+        _check(error_code, "Failed to get camera calibration")
         
         return calibration_info
     
     def get_transform_calibration(self, handle):
         """Get transform calibration parameters."""
-        from .data_types import TransformCalibrationInfo
-        
         transform_info = TransformCalibrationInfo()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_transform_calibration(
             handle, ctypes.byref(transform_info)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get transform calibration, error code: {}".format(error_code))
+        _check(error_code, "Failed to get transform calibration")
         
         return transform_info
     
-    def peek_depth_camera_frame(self, handle, frame_type=None):
-        """Get depth camera frame data using correct C API (two-step process like C++)."""
-        from .data_types import EnhancedImagingFrameDesc, EnhancedImagingFrameBuffer, DEPTHCAM_FRAME_TYPE_DEPTH_MAP
-        
-        # Use default frame type if not specified
-        if frame_type is None:
-            frame_type = DEPTHCAM_FRAME_TYPE_DEPTH_MAP
-        
+    def _peek_enhanced_frame(self, stream, peek, copy, what):
+        """Peek an enhanced imaging frame through ``peek(frame_desc_ref, frame_buffer_ref)``.
+
+        The C API is two-step: a call with an empty buffer reports the frame
+        size and a second call fills the buffer. Once the frame size of
+        ``stream`` is known, a buffer of that size is passed straight away so
+        steady-state frames take a single call; a failure or a size change
+        falls back to the two-step path.
+        """
         frame_desc = EnhancedImagingFrameDesc()
         frame_buffer = EnhancedImagingFrameBuffer()
+        desc_ref = ctypes.byref(frame_desc)
+        buffer_ref = ctypes.byref(frame_buffer)
+        
+        def receive(data_size):
+            # Copied results can reuse this thread's receive buffer; views must
+            # keep their own buffer alive, so they get a freshly allocated one
+            if copy:
+                data_buffer = self._scratch.receive_buffer(data_size)
+            else:
+                data_buffer = (ctypes.c_uint8 * data_size)()
+            frame_buffer.frame_data = ctypes.addressof(data_buffer)
+            frame_buffer.frame_data_size = data_size
+            return data_buffer
+        
+        def extract(data_buffer, data_size):
+            if copy:
+                return ctypes.string_at(ctypes.addressof(data_buffer), data_size)
+            return memoryview(data_buffer).cast('B')
+        
+        data_size = self._enhanced_frame_sizes.get(stream, 0)
+        if data_size > 0:
+            data_buffer = receive(data_size)
+            if not peek(desc_ref, buffer_ref) and frame_desc.image_desc.data_size == data_size:
+                return frame_desc, extract(data_buffer, data_size)
+            # The cached size no longer matches the stream - probe again
+            self._enhanced_frame_sizes.pop(stream, None)
         
         # First call: Get frame descriptor and data size (with empty buffer)
         frame_buffer.frame_data = None
         frame_buffer.frame_data_size = 0
-        
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_frame(
-            handle, frame_type, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
-        )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get depth camera frame info, error code: {}".format(error_code))
+        _check(peek(desc_ref, buffer_ref), "Failed to get {} info".format(what))
         
         # Allocate buffer for frame data based on the returned size
-        frame_data = None
-        if frame_desc.image_desc.data_size > 0:
-            data_buffer = (ctypes.c_uint8 * frame_desc.image_desc.data_size)()
-            frame_buffer.frame_data = ctypes.cast(data_buffer, ctypes.c_void_p)
-            frame_buffer.frame_data_size = frame_desc.image_desc.data_size
-            
-            # Second call: Get actual frame data
-            error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_frame(
-                handle, frame_type, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
-            )
-            if error_code != ERRORCODE_OK:
-                raise AuroraSDKError("Failed to get depth camera frame data, error code: {}".format(error_code))
-            
-            # Extract the frame data
-            frame_data = bytes(data_buffer)
+        data_size = frame_desc.image_desc.data_size
+        if data_size <= 0:
+            return frame_desc, None
+        data_buffer = receive(data_size)
+        
+        # Second call: Get actual frame data
+        _check(peek(desc_ref, buffer_ref), "Failed to get {} data".format(what))
+        self._enhanced_frame_sizes[stream] = data_size
+        return frame_desc, extract(data_buffer, data_size)
+    
+    def peek_depth_camera_frame(self, handle, frame_type=None, copy=True):
+        """Get depth camera frame data using correct C API (two-step process like C++).
+
+        With ``copy=False`` the frame data is returned as a memoryview over a
+        freshly allocated ctypes buffer instead of being copied into bytes.
+        """
+        # Use default frame type if not specified
+        if frame_type is None:
+            frame_type = DEPTHCAM_FRAME_TYPE_DEPTH_MAP
         
-        return frame_desc, frame_data
+        peek = self._fn_depthcam_peek_frame
+        return self._peek_enhanced_frame(
+            ('depthcam', frame_type),
+            lambda desc_ref, buffer_ref: peek(handle, frame_type, desc_ref, buffer_ref),
+            copy, "depth camera frame"
+        )
     
-    def peek_depth_camera_related_rectified_image(self, handle, timestamp):
-        """Get depth camera related rectified image using correct C API."""
-        from .data_types import EnhancedImagingFrameDesc, EnhancedImagingFrameBuffer
-        
-        frame_desc = EnhancedImagingFrameDesc()
-        frame_buffer = EnhancedImagingFrameBuffer()
-        
-        # First call: Get frame descriptor and data size (with empty buffer)
-        frame_buffer.frame_data = None
-        frame_buffer.frame_data_size = 0
-        
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image(
-            handle, timestamp, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
+    def peek_depth_camera_related_rectified_image(self, handle, timestamp, copy=True):
+        """Get depth camera related rectified image using correct C API.
+
+        With ``copy=False`` the image data is returned as a memoryview over a
+        freshly allocated ctypes buffer instead of being copied into bytes.
+        """
+        peek = self._fn_depthcam_peek_related_rectified_image
+        return self._peek_enhanced_frame(
+            'rectified',
+            lambda desc_ref, buffer_ref: peek(handle, timestamp, desc_ref, buffer_ref),
+            copy, "rectified image"
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get rectified image info, error code: {}".format(error_code))
-        
-        # Allocate buffer for frame data based on the returned size
-        frame_data = None
-        if frame_desc.image_desc.data_size > 0:
-            data_buffer = (ctypes.c_uint8 * frame_desc.image_desc.data_size)()
-            frame_buffer.frame_data = ctypes.cast(data_buffer, ctypes.c_void_p)
-            frame_buffer.frame_data_size = frame_desc.image_desc.data_size
-            
-            # Second call: Get actual frame data
-            error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_peek_related_rectified_image(
-                handle, timestamp, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
-            )
-            if error_code != ERRORCODE_OK:
-                raise AuroraSDKError("Failed to get rectified image data, error code: {}".format(error_code))
-            
-            # Extract the frame data
-            frame_data = bytes(data_buffer)
-        
-        return frame_desc, frame_data
     
     def get_semantic_segmentation_config(self, handle):
         """Get semantic segmentation configuration."""
-        from .data_types import SemanticSegmentationConfig
-        
         config = SemanticSegmentationConfig()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_config_info(
             handle, ctypes.byref(config)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get semantic segmentation config, error code: {}".format(error_code))
+        _check(error_code, "Failed to get semantic segmentation config")
         
         return config
     
     def get_semantic_segmentation_labels(self, handle):
         """Get semantic segmentation label information."""
-        from .data_types import SemanticSegmentationLabelInfo
-        
         label_info = SemanticSegmentationLabelInfo()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_get_labels(
             handle, ctypes.byref(label_info)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get semantic segmentation labels, error code: {}".format(error_code))
+        _check(error_code, "Failed to get semantic segmentation labels")
         
         return label_info
     
@@ -1773,45 +2092,22 @@ class CBindings:
         
         return buffer.value.decode('utf-8').rstrip('\0')
     
-    def peek_semantic_segmentation_frame(self, handle, timestamp_ns=0, allow_nearest=True):
-        """Get semantic segmentation frame data using two-step buffer allocation."""
-        from .data_types import EnhancedImagingFrameDesc, EnhancedImagingFrameBuffer
-        
-        frame_desc = EnhancedImagingFrameDesc()
-        frame_buffer = EnhancedImagingFrameBuffer()
-        
-        # First call: Get frame descriptor and data size (with empty buffer)
-        frame_buffer.frame_data = None
-        frame_buffer.frame_data_size = 0
-        
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame(
-            handle, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
+    def peek_semantic_segmentation_frame(self, handle, timestamp_ns=0, allow_nearest=True, copy=True):
+        """Get semantic segmentation frame data using two-step buffer allocation.
+
+        With ``copy=False`` the frame data is returned as a memoryview over a
+        freshly allocated ctypes buffer instead of being copied into bytes.
+        """
+        peek = self._fn_semantic_segmentation_peek_frame
+        return self._peek_enhanced_frame(
+            'semantic_segmentation',
+            lambda desc_ref, buffer_ref: peek(handle, desc_ref, buffer_ref),
+            copy, "semantic segmentation frame"
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get semantic segmentation frame info, error code: {}".format(error_code))
-        
-        # Allocate buffer for frame data based on the returned size
-        segmentation_data = None
-        if frame_desc.image_desc.data_size > 0:
-            data_buffer = (ctypes.c_uint8 * frame_desc.image_desc.data_size)()
-            frame_buffer.frame_data = ctypes.cast(data_buffer, ctypes.c_void_p)
-            frame_buffer.frame_data_size = frame_desc.image_desc.data_size
-            
-            # Second call: Get actual frame data
-            error_code = self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_peek_frame(
-                handle, ctypes.byref(frame_desc), ctypes.byref(frame_buffer)
-            )
-            if error_code != ERRORCODE_OK:
-                raise AuroraSDKError("Failed to get semantic segmentation frame data, error code: {}".format(error_code))
-            
-            # Extract the frame data
-            segmentation_data = bytes(data_buffer)
-        
-        return frame_desc, segmentation_data
     
     def wait_semantic_segmentation_next_frame(self, handle, timeout_ms=1000):
         """Wait for the next semantic segmentation frame to be available."""
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_wait_next_frame(
+        error_code = self._fn_semantic_segmentation_wait_next_frame(
             handle, timeout_ms
         )
         return error_code == ERRORCODE_OK
@@ -1826,50 +2122,78 @@ class CBindings:
         raise AuroraSDKError("set_semantic_segmentation_model function not available in this SDK version")
     
     def calc_depth_aligned_segmentation_map(self, handle, segmentation_data, seg_width, seg_height):
-        """Calculate depth camera aligned segmentation map (matching C++ implementation)."""
-        # Create input image descriptor
-        desc_in = ImageDesc()
+        """Calculate depth camera aligned segmentation map (matching C++ implementation).
+
+        ``segmentation_data`` may be bytes, a bytearray or memoryview, a uint8
+        NumPy array or a ctypes array. Except for read-only or non-contiguous
+        views, it is handed to the SDK in place; it only has to stay alive for
+        this call.
+        """
+        if NUMPY_AVAILABLE and isinstance(segmentation_data, np.ndarray):
+            segmentation_data = np.ascontiguousarray(segmentation_data, dtype=np.uint8).reshape(-1)
+        elif not isinstance(segmentation_data, bytes):
+            # Flat byte view, so lengths below count bytes rather than the
+            # elements of a typed or multi-dimensional buffer
+            view = memoryview(segmentation_data)
+            try:
+                segmentation_data = view.cast('B')
+            except TypeError:
+                # Non-contiguous views cannot be cast, only copied
+                segmentation_data = view.tobytes()
+        
+        scratch = self._scratch
+        buffers = scratch.alignment
+        if buffers is None:
+            buffers = scratch.alignment = _AlignmentBuffers()
+        
+        # Fill in the input image descriptor
+        desc_in = buffers.desc_in
         desc_in.width = seg_width
         desc_in.height = seg_height
         desc_in.stride = seg_width  # Assuming 1 byte per pixel
-        desc_in.format = 0  # Assuming grayscale format for segmentation
         desc_in.data_size = len(segmentation_data)
         
-        # Create output image descriptor
-        desc_out = ImageDesc()
+        # Clear the output image descriptor left over from the previous call
+        desc_out = buffers.desc_out
+        desc_out.width = 0
+        desc_out.height = 0
         
-        # Create input buffer from segmentation data
+        # Create input buffer from segmentation data; the C API only reads the
+        # input, so it is passed by pointer wherever ctypes can reach the memory
         if isinstance(segmentation_data, bytes):
-            input_buffer = (ctypes.c_uint8 * len(segmentation_data)).from_buffer_copy(segmentation_data)
+            input_buffer = ctypes.c_char_p(segmentation_data)
+        elif NUMPY_AVAILABLE and isinstance(segmentation_data, np.ndarray):
+            input_buffer = ctypes.c_void_p(segmentation_data.ctypes.data)
+        elif not segmentation_data.readonly:
+            # Writable buffers (including copy=False frame views) can be wrapped without copying
+            input_buffer = (ctypes.c_uint8 * len(segmentation_data)).from_buffer(segmentation_data)
         else:
-            input_buffer = segmentation_data
+            input_buffer = (ctypes.c_uint8 * len(segmentation_data)).from_buffer_copy(segmentation_data)
         
         # Create enhanced imaging frame buffer for output (matching C++ logic)
         max_aligned_size = seg_width * seg_height * 2  # Conservative estimate
-        aligned_buffer = (ctypes.c_uint8 * max_aligned_size)()
+        aligned_buffer = scratch.receive_buffer(max_aligned_size)
         
-        # Create enhanced imaging frame buffer structure
-        from .data_types import EnhancedImagingFrameBuffer
-        frame_buffer = EnhancedImagingFrameBuffer()
-        frame_buffer.frame_data = ctypes.cast(aligned_buffer, ctypes.c_void_p)
+        # Point the enhanced imaging frame buffer structure at it
+        frame_buffer = buffers.frame_buffer
+        frame_buffer.frame_data = ctypes.addressof(aligned_buffer)
         frame_buffer.frame_data_size = max_aligned_size
         
         # Call the C API with proper parameters (like C++)
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_calc_aligned_segmentation_map(
             handle,
-            ctypes.byref(desc_in),
+            buffers.desc_in_ref,
             ctypes.cast(input_buffer, ctypes.c_void_p),
-            ctypes.byref(desc_out),
-            ctypes.byref(frame_buffer)
+            buffers.desc_out_ref,
+            buffers.frame_buffer_ref
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to calculate depth aligned segmentation map, error code: {}".format(error_code))
+        _check(error_code, "Failed to calculate depth aligned segmentation map")
         
         # Extract the actual aligned data using output descriptor
         actual_size = desc_out.width * desc_out.height
         if actual_size > 0 and desc_out.width > 0 and desc_out.height > 0:
-            aligned_data = bytes(aligned_buffer[:actual_size])
+            aligned_data = ctypes.string_at(ctypes.addressof(aligned_buffer), min(actual_size, max_aligned_size))
             return aligned_data, desc_out.width, desc_out.height
         else:
             return None, 0, 0
@@ -1877,110 +2201,143 @@ class CBindings:
     def require_map_reset(self, handle, timeout_ms=10000):
         """Require the device to reset its map."""
         error_code = self.lib.slamtec_aurora_sdk_controller_require_map_reset(handle, timeout_ms)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to reset map, error code: {}".format(error_code))
+        _check(error_code, "Failed to reset map")
     
     def require_pure_localization_mode(self, handle, timeout_ms=10000):
         """Require the device to enter pure localization mode (no mapping)."""
         error_code = self.lib.slamtec_aurora_sdk_controller_require_pure_localization_mode(handle, timeout_ms)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to enter pure localization mode, error code: {}".format(error_code))
+        _check(error_code, "Failed to enter pure localization mode")
     
     def is_device_connection_alive(self, handle):
         """Check if the device connection is alive and healthy."""
-        return bool(self.lib.slamtec_aurora_sdk_controller_is_device_connection_alive(handle))
+        return bool(self._fn_is_device_connection_alive(handle))
     
     def is_raw_data_subscribed(self, handle):
         """Check if raw data subscription is active."""
-        return bool(self.lib.slamtec_aurora_sdk_controller_is_raw_data_subscribed(handle))
+        return bool(self._fn_is_raw_data_subscribed(handle))
     
     # Missing high-priority DataProvider operations - IMPLEMENTATION ADDED
     def get_last_device_status(self, handle):
         """Get the last device status information."""
-        from .data_types import DeviceStatus
-        
         status = DeviceStatus()
-        timestamp = ctypes.c_uint64()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_last_device_status(
-            handle, ctypes.byref(status), ctypes.byref(timestamp)
+        scratch = self._scratch
+        error_code = self._fn_get_last_device_status(
+            handle, ctypes.byref(status), scratch.ts_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get device status, error code: {}".format(error_code))
+        _check(error_code, "Failed to get device status")
         
-        return status, timestamp.value
+        return status, scratch.ts.value
     
     def get_relocalization_status(self, handle):
         """Get relocalization status information."""
-        from .data_types import RelocalizationStatus
-        
         status = RelocalizationStatus()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_relocalization_status(
+        error_code = self._fn_get_relocalization_status(
             handle, ctypes.byref(status)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get relocalization status, error code: {}".format(error_code))
+        _check(error_code, "Failed to get relocalization status")
         
         return status
     
     def get_mapping_flags(self, handle):
         """Get current mapping flags."""
-        flags = ctypes.c_uint32()
+        scratch = self._scratch
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_mapping_flags(
-            handle, ctypes.byref(flags)
+            handle, scratch.u32_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get mapping flags, error code: {}".format(error_code))
+        _check(error_code, "Failed to get mapping flags")
         
-        return flags.value
+        return scratch.u32.value
     def convert_quaternion_to_euler(self, qx, qy, qz, qw):
-        """Convert quaternion to Euler angles."""
-        from .data_types import Quaternion, EulerAngle
-        
-        # Create quaternion structure
+        """Convert quaternion to Euler angles.
+
+        Computed in Python with the same formulas as
+        convert_quaternion_to_euler_batch, so no C call is made per quaternion.
+        Use _convert_quaternion_to_euler_sdk to cross-check against the SDK.
+        """
+        roll = math.atan2(2 * (qw * qx + qy * qz), 1 - 2 * (qx * qx + qy * qy))
+        pitch = math.asin(min(1.0, max(-1.0, 2 * (qw * qy - qz * qx))))
+        yaw = math.atan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
+        return roll, pitch, yaw
+    
+    def _convert_quaternion_to_euler_sdk(self, qx, qy, qz, qw):
+        """Convert quaternion to Euler angles with the SDK's own conversion.
+
+        Slower than convert_quaternion_to_euler; kept to cross-check the
+        Python formulas against the SDK's angle convention.
+        """
         quat = Quaternion()
         quat.x = qx
         quat.y = qy
         quat.z = qz
         quat.w = qw
         
-        # Create euler angle output structure
         euler = EulerAngle()
         
         error_code = self.lib.slamtec_aurora_sdk_convert_quaternion_to_euler(
             ctypes.byref(quat), ctypes.byref(euler)
         )
         
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to convert quaternion to euler, error code: {}".format(error_code))
+        _check(error_code, "Failed to convert quaternion to euler")
         
         return euler.roll, euler.pitch, euler.yaw
     
+    def convert_quaternion_to_euler_batch(self, quats):
+        """Convert an (N, 4) NumPy array of (qx, qy, qz, qw) rows to (N, 3) (roll, pitch, yaw).
+
+        Computed in NumPy (roll about x, pitch about y, yaw about z); the result keeps the
+        floating dtype of quats (float32 input gives float32 output).
+        """
+        qx, qy, qz, qw = quats[:, 0], quats[:, 1], quats[:, 2], quats[:, 3]
+        euler = np.empty((quats.shape[0], 3), dtype=quats.dtype)
+        euler[:, 0] = np.arctan2(2 * (qw * qx + qy * qz), 1 - 2 * (qx * qx + qy * qy))
+        euler[:, 1] = np.arcsin(np.clip(2 * (qw * qy - qz * qx), -1, 1))
+        euler[:, 2] = np.arctan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
+        return euler
+    
     # Enhanced Imaging readiness functions
     def depthcam_is_ready(self, handle):
         """Check if depth camera is ready."""
-        return bool(self.lib.slamtec_aurora_sdk_dataprovider_depthcam_is_ready(handle))
+        return bool(self._fn_depthcam_is_ready(handle))
     
     def depthcam_get_config_info(self, handle):
         """Get depth camera configuration."""
-        from .data_types import DepthcamConfigInfo
-        
         config = DepthcamConfigInfo()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_get_config_info(
             handle, ctypes.byref(config)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get depth camera config, error code: {}".format(error_code))
+        _check(error_code, "Failed to get depth camera config")
         
         return config
     
     def depthcam_wait_next_frame(self, handle, timeout_ms=1000):
         """Wait for next depth camera frame."""
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_depthcam_wait_next_frame(handle, timeout_ms)
+        error_code = self._fn_depthcam_wait_next_frame(handle, timeout_ms)
         return error_code == ERRORCODE_OK
     
     def semantic_segmentation_is_ready(self, handle):
         """Check if semantic segmentation is ready."""
-        return bool(self.lib.slamtec_aurora_sdk_dataprovider_semantic_segmentation_is_ready(handle))
+        return bool(self._fn_semantic_segmentation_is_ready(handle))
+    
+    def struct_scratch(self, struct_type, count):
+        """Return this thread's reusable array of ``struct_type`` for results copied out by the caller."""
+        return self._scratch.struct_array(struct_type, count)
+    
+    def get_readiness_flags(self, handle):
+        """Query the connection, subscription and readiness predicates in one batch.
+
+        The SDK has no combined status call, so this still makes one call per
+        predicate, but through the pre-bound functions and without the per-call
+        wrapper layers that polling each predicate separately goes through.
+        """
+        is_enhanced_subscribed = self._fn_is_enhanced_imaging_subscribed
+        return dict(zip(READINESS_FLAG_NAMES, map(bool, (
+            self._fn_is_device_connection_alive(handle),
+            self._fn_is_raw_data_subscribed(handle),
+            is_enhanced_subscribed(handle, ENHANCED_IMAGE_TYPE_DEPTH),
+            is_enhanced_subscribed(handle, ENHANCED_IMAGE_TYPE_SEMANTIC_SEGMENTATION),
+            self._fn_depthcam_is_ready(handle),
+            self._fn_semantic_segmentation_is_ready(handle),
+        ))))
     
     # LIDAR 2D Map critical functions
     def gridmap_release(self, gridmap_handle):
@@ -1989,14 +2346,13 @@ class CBindings:
     
     def gridmap_get_resolution(self, gridmap_handle):
         """Get gridmap resolution."""
-        resolution = ctypes.c_float()
+        scratch = self._scratch
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_gridmap_get_resolution(
-            gridmap_handle, ctypes.byref(resolution)
+            gridmap_handle, scratch.f32_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get gridmap resolution, error code: {}".format(error_code))
+        _check(error_code, "Failed to get gridmap resolution")
         
-        return resolution.value
+        return scratch.f32.value
     
     def get_supported_grid_resolution_range(self, handle):
         """Get supported grid resolution range."""
@@ -2006,8 +2362,7 @@ class CBindings:
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_grid_resultion_range(
             handle, ctypes.byref(min_res), ctypes.byref(max_res)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get resolution range, error code: {}".format(error_code))
+        _check(error_code, "Failed to get resolution range")
         
         return min_res.value, max_res.value
     
@@ -2018,57 +2373,82 @@ class CBindings:
         error_code = self.lib.slamtec_aurora_sdk_lidar2dmap_get_supported_max_grid_cell_count(
             handle, ctypes.byref(max_count)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get max cell count, error code: {}".format(error_code))
+        _check(error_code, "Failed to get max cell count")
         
         return max_count.value
 
     def get_imu_info(self, handle):
         """Get IMU information."""
-        from .data_types import IMUInfo
         info = IMUInfo()
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_imu_info(handle, ctypes.byref(info))
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get IMU info, error code: {}".format(error_code))
+        _check(error_code, "Failed to get IMU info")
         return info
     
-    def get_all_map_info(self, handle, max_count=32):
-        """Get information about all maps."""
-        from .data_types import MapDesc
-        desc_buffer = (MapDesc * max_count)()
-        actual_count = ctypes.c_size_t()
+    def get_all_map_info(self, handle, max_count=32, as_numpy=False):
+        """Get information about all maps.
+
+        With ``as_numpy=True`` the descriptors are returned as one structured
+        array with the MapDesc dtype instead of a list of MapDesc objects.
+        """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy map info retrieval")
+        scratch = self._scratch
+        if as_numpy:
+            # Copied out below, so this thread's array can be reused
+            desc_buffer = scratch.struct_array(MapDesc, max_count)
+        else:
+            desc_buffer = (MapDesc * max_count)()
         
         error_code = self.lib.slamtec_aurora_sdk_dataprovider_get_all_map_info(
-            handle, desc_buffer, max_count, ctypes.byref(actual_count)
+            handle, desc_buffer, max_count, scratch.count_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to get all map info, error code: {}".format(error_code))
+        _check(error_code, "Failed to get all map info")
         
-        return list(desc_buffer[:actual_count.value])
+        actual_count = min(scratch.count.value, max_count)
+        if as_numpy:
+            return np.frombuffer(desc_buffer, dtype=np.dtype(MapDesc), count=actual_count).copy()
+        return list(desc_buffer[:actual_count])
     
     def peek_history_pose(self, handle, timestamp_ns=0, allow_interpolation=True, max_time_diff_ns=1000000000):
         """Peek historical pose at specific timestamp."""
         pose = PoseSE3()
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_history_pose(
+        error_code = self._fn_peek_history_pose(
             handle, ctypes.byref(pose), timestamp_ns, int(allow_interpolation), max_time_diff_ns
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to peek history pose, error code: {}".format(error_code))
+        _check(error_code, "Failed to peek history pose")
         return pose
     
-    def peek_imu_data(self, handle, max_count=100):
-        """Peek recent IMU data."""
-        from .data_types import IMUData
-        imu_buffer = (IMUData * max_count)()
-        actual_count = ctypes.c_size_t()
+    def peek_imu_data(self, handle, max_count=100, out=None, as_numpy=False):
+        """Peek recent IMU data.
+
+        If ``out`` is given (a NumPy array with the IMUData dtype), the samples are
+        written into it and a view of the filled records is returned instead of a list.
+        With ``as_numpy=True`` the samples are returned as a new structured array.
+        """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy IMU retrieval")
+        scratch = self._scratch
+        if out is not None:
+            _check_out_array(out, IMUData, "IMU buffer")
+            max_count = min(max_count, len(out))
+            imu_buffer = out.ctypes.data_as(_P_IMUData)
+        elif as_numpy:
+            # Copied out below, so this thread's array can be reused
+            imu_buffer = scratch.struct_array(IMUData, max_count)
+        else:
+            imu_buffer = (IMUData * max_count)()
         
-        error_code = self.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data(
-            handle, imu_buffer, max_count, ctypes.byref(actual_count)
+        error_code = self._fn_peek_imu_data(
+            handle, imu_buffer, max_count, scratch.count_ref
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to peek IMU data, error code: {}".format(error_code))
+        _check(error_code, "Failed to peek IMU data")
         
-        return list(imu_buffer[:actual_count.value])
+        actual_count = min(scratch.count.value, max_count)
+        if out is not None:
+            return out[:actual_count]
+        if as_numpy:
+            return np.frombuffer(imu_buffer, dtype=np.dtype(IMUData), count=actual_count).copy()
+        return list(imu_buffer[:actual_count])
     
     # CORRECTED CONTROLLER METHOD IMPLEMENTATIONS
     def set_low_rate_mode(self, handle, enable):
@@ -2078,14 +2458,12 @@ class CBindings:
     def set_loop_closure(self, handle, enable, timeout_ms=5000):
         """Enable/disable loop closure - CORRECTED: added missing timeout_ms parameter."""
         error_code = self.lib.slamtec_aurora_sdk_controller_set_loop_closure(handle, int(enable), timeout_ms)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to set loop closure, error code: {}".format(error_code))
+        _check(error_code, "Failed to set loop closure")
     
     def force_map_global_optimization(self, handle, timeout_ms=30000):
         """Force global map optimization."""
         error_code = self.lib.slamtec_aurora_sdk_controller_force_map_global_optimization(handle, timeout_ms)
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to force global optimization, error code: {}".format(error_code))
+        _check(error_code, "Failed to force global optimization")
     
     def send_custom_command(self, handle, command_id, data=None, timeout_ms=5000):
         """Send custom command - CORRECTED: proper parameter order and types."""
@@ -2108,8 +2486,7 @@ class CBindings:
             ctypes.cast(response_buffer, ctypes.c_void_p), response_buffer_size,
             ctypes.byref(actual_response_size)
         )
-        if error_code != ERRORCODE_OK:
-            raise AuroraSDKError("Failed to send custom command, error code: {}".format(error_code))
+        _check(error_code, "Failed to send custom command")
         
         return response_buffer.raw[:actual_response_size.value]
     
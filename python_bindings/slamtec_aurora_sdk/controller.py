@@ -4,8 +4,9 @@ Aurora SDK Controller component.
 Handles device connection, session management, and control operations.
 """
 
+import ctypes
 from .c_bindings import get_c_bindings
-from .data_types import DeviceInfo
+from .data_types import DeviceInfo, PoseSE3, ERRORCODE_OK
 from .exceptions import AuroraSDKError, ConnectionError
 
 
@@ -108,6 +109,30 @@ class Controller:
         except Exception as e:
             raise AuroraSDKError("Device discovery failed: {}".format(e))
     
+    def discover_devices_until_first(self, timeout=5.0, poll_interval=0.05):
+        """
+        Discover Aurora devices, returning as soon as the first one responds.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_interval: Interval between checks of the discovered list in seconds
+            
+        Returns:
+            List of discovered device information dictionaries (empty on timeout)
+            
+        Raises:
+            AuroraSDKError: If discovery fails
+        """
+        self._ensure_c_bindings()
+        
+        if self._session_handle is None:
+            raise AuroraSDKError("Session not created")
+        
+        try:
+            return self._c_bindings.discover_devices_until_first(self._session_handle, timeout, poll_interval)
+        except Exception as e:
+            raise AuroraSDKError("Device discovery failed: {}".format(e))
+    
     def connect(self, device_info=None, connection_string=None):
         """
         Connect to an Aurora device.
@@ -377,7 +402,6 @@ class Controller:
             raise ConnectionError("Not connected to any device")
         
         try:
-            from .data_types import ERRORCODE_OK
             error_code = self._c_bindings.lib.slamtec_aurora_sdk_controller_require_relocalization(
                 self._session_handle, 
                 timeout_ms
@@ -407,7 +431,6 @@ class Controller:
             raise ConnectionError("Not connected to any device")
         
         try:
-            from .data_types import ERRORCODE_OK
             error_code = self._c_bindings.lib.slamtec_aurora_sdk_controller_cancel_relocalization(
                 self._session_handle
             )
@@ -452,9 +475,6 @@ class Controller:
             raise ConnectionError("Not connected to any device")
 
         try:
-            from .data_types import ERRORCODE_OK, PoseSE3
-            import ctypes
-
             # Convert pose to PoseSE3 if needed
             if isinstance(center_pose, tuple):
                 position, quaternion = center_pose
@@ -507,9 +527,6 @@ class Controller:
             raise ConnectionError("Not connected to any device")
 
         try:
-            from .data_types import ERRORCODE_OK, PoseSE3
-            import ctypes
-
             # Convert pose to PoseSE3 if needed
             if isinstance(center_pose, tuple):
                 position, quaternion = center_pose
@@ -560,9 +577,6 @@ class Controller:
             raise ConnectionError("Not connected to any device")
 
         try:
-            from .data_types import ERRORCODE_OK
-            import ctypes
-
             status_out = ctypes.c_uint32()
 
             error_code = self._c_bindings.lib.slamtec_aurora_sdk_controller_get_last_relocalization_status(
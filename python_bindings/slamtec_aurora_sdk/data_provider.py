@@ -4,10 +4,15 @@ Aurora SDK DataProvider component.
 Handles data retrieval operations including pose, images, tracking data, and sensor data.
 """
 
+import ctypes
 import time
-from .c_bindings import get_c_bindings
-from .data_types import ImageFrame, TrackingFrame, ScanData, LidarScanData, DeviceBasicInfoWrapper, DeviceInfo
-from .exceptions import AuroraSDKError, ConnectionError, DataNotReadyError
+from .c_bindings import get_c_bindings, _check_out_array, _check_map_point_out, _P_Pose, _P_PoseSE3, _P_IMUData
+from .data_types import ImageFrame, ImageFrameView, TrackingFrame, ScanData, LidarScanData, DeviceBasicInfoWrapper, DeviceInfo
+from .data_types import (
+    np, NUMPY_AVAILABLE, IMUData, ERRORCODE_NOT_READY,
+    SLAMTEC_AURORA_SDK_KF_FETCH_FLAG_ALL, SLAMTEC_AURORA_SDK_MP_FETCH_FLAG_ALL,
+)
+from .exceptions import AuroraSDKError, ConnectionError, DataNotReadyError, InvalidArgumentError
 
 
 class DataProvider:
@@ -70,29 +75,55 @@ class DataProvider:
         
         try:
             if use_se3:
-                pose, timestamp_ns = self._c_bindings.get_current_pose_se3(self._controller.session_handle)
-                position = pose.translation.to_tuple()
-                rotation = pose.quaternion.to_tuple()
-            else:
-                pose, timestamp_ns = self._c_bindings.get_current_pose(self._controller.session_handle)
-                position = pose.translation.to_tuple()
-                rotation = pose.rpy.to_tuple()
+                return self._c_bindings.get_current_pose_se3_fast(self._controller.session_handle)
+            return self._c_bindings.get_current_pose_fast(self._controller.session_handle)
+            
+        except Exception as e:
+            raise AuroraSDKError(f"Failed to get current pose: {e}")
+    
+    def get_current_pose_into(self, buf, use_se3=True):
+        """
+        Get current device pose written directly into a NumPy buffer.
+        
+        Args:
+            buf: C-contiguous float64 NumPy array with at least 7 elements. Receives
+                 (x, y, z, qx, qy, qz, qw) if use_se3, (x, y, z, roll, pitch, yaw) otherwise
+            use_se3: Select SE3 (quaternion) or Euler rotation format
             
-            return position, rotation, timestamp_ns
+        Returns:
+            int: Timestamp in nanoseconds
             
+        Raises:
+            ConnectionError: If not connected to a device
+            InvalidArgumentError: If buf has the wrong dtype, size or layout
+            AuroraSDKError: If failed to get pose
+        """
+        self._ensure_connected()
+        
+        if buf.dtype != 'float64' or buf.size < 7 or not buf.flags.c_contiguous:
+            raise InvalidArgumentError("Pose buffer must be a C-contiguous float64 array with at least 7 elements")
+        
+        pose_ptr_type = _P_PoseSE3 if use_se3 else _P_Pose
+        try:
+            return self._c_bindings.get_current_pose_into(
+                self._controller.session_handle, buf.ctypes.data_as(pose_ptr_type), use_se3)
         except Exception as e:
             raise AuroraSDKError(f"Failed to get current pose: {e}")
     
-    def get_camera_preview(self, timestamp_ns=0, allow_nearest_frame=True):
+    def get_camera_preview(self, timestamp_ns=0, allow_nearest_frame=True, copy=True, want_pixels=True):
         """
         Get camera preview frames.
         
         Args:
             timestamp_ns (int): Timestamp in nanoseconds (0 for latest frame)
             allow_nearest_frame (bool): Allow nearest frame if exact timestamp not available
+            copy (bool): If False, return ImageFrameView objects whose data is a
+                memoryview over a buffer owned by the frame instead of bytes
+            want_pixels (bool): If False, only fetch the image descriptors; the
+                returned frames carry size/format/timestamp but no data
         
         Returns:
-            Tuple of (left_frame, right_frame) ImageFrame objects
+            Tuple of (left_frame, right_frame) ImageFrame (or ImageFrameView) objects
             
         Raises:
             ConnectionError: If not connected to a device
@@ -103,11 +134,13 @@ class DataProvider:
         
         try:
             desc, left_data, right_data = self._c_bindings.peek_camera_preview_image(
-                self._controller.session_handle, timestamp_ns, allow_nearest_frame)
+                self._controller.session_handle, timestamp_ns, allow_nearest_frame, copy=copy,
+                want_pixels=want_pixels)
             
             # Create ImageFrame objects
-            left_frame = ImageFrame.from_c_desc(desc.left_image_desc, data=left_data)
-            right_frame = ImageFrame.from_c_desc(desc.right_image_desc, data=right_data)
+            frame_cls = ImageFrame if copy else ImageFrameView
+            left_frame = frame_cls.from_c_desc(desc.left_image_desc, data=left_data)
+            right_frame = frame_cls.from_c_desc(desc.right_image_desc, data=right_data)
             
             # Set timestamp from stereo pair
             left_frame.timestamp_ns = desc.timestamp_ns
@@ -123,10 +156,17 @@ class DataProvider:
             else:
                 raise AuroraSDKError(f"Failed to get camera preview: {e}")
     
-    def get_tracking_frame(self):
+    def get_tracking_frame(self, copy=True, keypoints_as_numpy=False):
         """
         Get tracking frame data with keypoints and images.
         
+        Args:
+            copy (bool): If False, the frame images are ImageFrameView objects whose
+                data is a memoryview over a buffer the SDK fills directly (after the
+                first frame of a given size) instead of bytes
+            keypoints_as_numpy (bool): If True, the keypoints are NumPy record arrays
+                (fields x, y, flags) instead of lists of Keypoint objects
+        
         Returns:
             TrackingFrame object containing images, keypoints, pose, and tracking status
             
@@ -138,7 +178,8 @@ class DataProvider:
         self._ensure_connected()
         
         try:
-            tracking_info, left_keypoints, right_keypoints, left_image_data, right_image_data = self._c_bindings.peek_tracking_data(self._controller.session_handle)
+            tracking_info, left_keypoints, right_keypoints, left_image_data, right_image_data = self._c_bindings.peek_tracking_data(
+                self._controller.session_handle, copy=copy, keypoints_as_numpy=keypoints_as_numpy)
             
             # Create TrackingFrame object with image data
             tracking_frame = TrackingFrame.from_c_struct(
@@ -146,7 +187,8 @@ class DataProvider:
                 left_keypoints=left_keypoints,
                 right_keypoints=right_keypoints,
                 left_image_data=left_image_data,
-                right_image_data=right_image_data
+                right_image_data=right_image_data,
+                image_cls=ImageFrame if copy else ImageFrameView
             )
             
             return tracking_frame
@@ -159,12 +201,18 @@ class DataProvider:
             else:
                 raise AuroraSDKError(f"Failed to get tracking frame: {e}")
     
-    def get_recent_lidar_scan(self, max_points=8192):
+    def get_recent_lidar_scan(self, max_points=8192, out=None, force_latest=False, as_numpy=False):
         """
         Get recent LiDAR scan data.
         
         Args:
             max_points: Maximum number of scan points to retrieve
+            force_latest: If True, ask the SDK for the newest scan it has received
+            out: Optional C-contiguous NumPy array with the LidarScanPoint dtype to
+                 fill in place; the returned scan's points are then a view of it
+            as_numpy: If True, the returned scan's points are a new structured
+                 NumPy array with 'dist', 'angle' and 'quality' fields instead of
+                 a list of (dist, angle, quality) tuples
             
         Returns:
             LidarScanData object containing scan points and metadata, or None if not available
@@ -173,23 +221,33 @@ class DataProvider:
             ConnectionError: If not connected to a device
             DataNotReadyError: If LiDAR data is not ready
             AuroraSDKError: If failed to get scan data
+            InvalidArgumentError: If out has the wrong dtype or layout
+            ImportError: If as_numpy is True and NumPy is not installed
         """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy LiDAR scan retrieval")
         self._ensure_connected()
         self._ensure_c_bindings()
         
         try:
-            result = self._c_bindings.peek_recent_lidar_scan(self._controller.session_handle, max_points)
+            result = self._c_bindings.peek_recent_lidar_scan(
+                self._controller.session_handle, max_points, force_latest=int(force_latest), out=out,
+                as_numpy=as_numpy)
             if result is None:
                 return None  # No scan data available
             
             scan_info, scan_points, scan_pose = result
             
-            # Create LidarScanData object
-            from .data_types import LidarScanData
-            scan_data = LidarScanData.from_c_data(scan_info, scan_points)
+            # Create LidarScanData object; NumPy results keep their structured array
+            if out is None and not as_numpy:
+                scan_data = LidarScanData.from_c_data(scan_info, scan_points)
+            else:
+                scan_data = LidarScanData.from_c_array(scan_info, scan_points)
             
             return scan_data
             
+        except InvalidArgumentError:
+            raise
         except Exception as e:
             if "error code: -7" in str(e):  # NOT_READY
                 raise DataNotReadyError("LiDAR data not ready")
@@ -210,7 +268,7 @@ class DataProvider:
         """
         return self.peek_imu_data()
     
-    def peek_imu_data(self, max_count=100):
+    def peek_imu_data(self, max_count=100, out=None, as_numpy=False):
         """
         Peek at cached IMU data from the device.
         
@@ -221,32 +279,49 @@ class DataProvider:
         
         Args:
             max_count (int): Maximum number of IMU samples to retrieve (default: 100)
+            out: Optional writable, C-contiguous NumPy array with the IMUData dtype
+                 (np.dtype(IMUData)) to fill in place; up to len(out) samples are
+                 written into it
+            as_numpy (bool): If True, return the samples as a structured NumPy
+                 array with the IMUData dtype (e.g. samples['acc'] is an (N, 3)
+                 array) instead of a list of IMUData objects
             
         Returns:
-            List of IMUData objects containing accelerometer and gyroscope data
+            List of IMUData objects containing accelerometer and gyroscope data,
+            a view of the filled records of out when out is given, or a
+            structured array when as_numpy is True
             
         Raises:
             ConnectionError: If not connected to a device
             AuroraSDKError: If failed to get IMU data
+            InvalidArgumentError: If out has the wrong dtype or layout
+            ImportError: If as_numpy is True and NumPy is not installed
         """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy IMU retrieval")
+        if out is not None:
+            _check_out_array(out, IMUData, "IMU buffer")
         self._ensure_connected()
         self._ensure_c_bindings()
         
         try:
-            import ctypes
-            from .data_types import IMUData, ERRORCODE_OK, ERRORCODE_NOT_READY
-            
-            # Use fixed 4096 buffer like C++ implementation
-            max_count = 4096
-            
-            # Prepare output arrays exactly like C++ version
-            imu_data_array = (IMUData * max_count)()
+            if out is not None:
+                # Let the SDK write straight into the caller's structured array
+                max_count = len(out)
+                imu_data_array = out.ctypes.data_as(_P_IMUData)
+            else:
+                # Use fixed 4096 buffer like C++ implementation
+                max_count = 4096
+                
+                # Every sample is copied out below, so the same per-thread
+                # array serves each call instead of a fresh 256 KiB one
+                imu_data_array = self._c_bindings.struct_scratch(IMUData, max_count)
             actual_count = ctypes.c_size_t(0)
             
             # Call C API function exactly like C++ version
             error_code = self._c_bindings.lib.slamtec_aurora_sdk_dataprovider_peek_imu_data(
                 self._controller.session_handle,
-                ctypes.cast(imu_data_array, ctypes.POINTER(IMUData)),
+                imu_data_array,
                 max_count,
                 ctypes.byref(actual_count)
             )
@@ -254,10 +329,20 @@ class DataProvider:
             # Handle error codes as specified in C++ SDK behavior
             if error_code == ERRORCODE_NOT_READY:
                 # No data available yet - return empty list (non-blocking behavior)
-                return []
-            elif error_code != ERRORCODE_OK:
+                if out is not None:
+                    return out[:0]
+                return np.zeros(0, dtype=np.dtype(IMUData)) if as_numpy else []
+            elif error_code:  # Any code other than OK (0) is a failure
                 raise AuroraSDKError(f"Failed to get IMU data, error code: {error_code}")
             
+            if out is not None:
+                return out[:min(actual_count.value, max_count)]
+            
+            if as_numpy:
+                # One memcpy of the filled records instead of a Python object per sample
+                return np.frombuffer(imu_data_array, dtype=np.dtype(IMUData),
+                                     count=min(actual_count.value, max_count)).copy()
+            
             # Convert to Python list with proper data copying
             result = []
             count = actual_count.value
@@ -283,7 +368,7 @@ class DataProvider:
                 raise AuroraSDKError(f"Failed to get IMU data: {e}")
     
     def get_map_data(self, map_ids=None, fetch_kf=True, fetch_mp=True, fetch_mapinfo=False,
-                     kf_fetch_flags=None, mp_fetch_flags=None):
+                     kf_fetch_flags=None, mp_fetch_flags=None, out=None):
         """
         Get visual map data including map points and keyframes.
         
@@ -297,25 +382,32 @@ class DataProvider:
             fetch_mapinfo: Whether to fetch map info (default: False)
             kf_fetch_flags: Keyframe fetch flags (default: None, uses FETCH_ALL)
             mp_fetch_flags: Map point fetch flags (default: None, uses FETCH_ALL)
+            out: Optional dict of preallocated NumPy arrays reused across calls:
+                 'positions' (N,3) float32 or float64, 'ids' (N,) uint64,
+                 'map_ids' (N,) uint32, 'timestamps' (N,) float64. Any subset may
+                 be given; all arrays must be writable, C-contiguous and of equal length.
         
         Returns:
             dict: Dictionary containing 'map_points', 'keyframes', 'loop_closures', and 'map_info'.
+                  With out, 'map_points' is a dict of views of the filled rows of each array
+                  and 'map_point_count' is the number of map points reported (may exceed N).
                   Each map point contains: {'position': (x,y,z), 'id': int, 'map_id': int, 'timestamp': float}
                   Each keyframe contains: {'position': (x,y,z), 'rotation': (qx,qy,qz,qw), 'id': int, 'map_id': int, 'timestamp': float, 'fixed': bool}
                   Loop closures are tuples: [(from_keyframe_id, to_keyframe_id), ...]
                   Map info is a dict keyed by map_id containing: {'id': int, 'point_count': int, 'keyframe_count': int, 'connection_count': int}
             
         Raises:
+            InvalidArgumentError: If an out array has the wrong shape, dtype or length
             ConnectionError: If not connected to a device
             DataNotReadyError: If map data is not ready
             AuroraSDKError: If failed to get map data
         """
+        if out is not None:
+            _check_map_point_out(out)
+        
         self._ensure_connected()
         self._ensure_c_bindings()
         
-        # Import default flags
-        from .data_types import SLAMTEC_AURORA_SDK_KF_FETCH_FLAG_ALL, SLAMTEC_AURORA_SDK_MP_FETCH_FLAG_ALL
-        
         # Use default flags if not specified
         if kf_fetch_flags is None:
             kf_fetch_flags = SLAMTEC_AURORA_SDK_KF_FETCH_FLAG_ALL
@@ -330,7 +422,8 @@ class DataProvider:
                 fetch_mp=fetch_mp,
                 fetch_mapinfo=fetch_mapinfo,
                 kf_fetch_flags=kf_fetch_flags,
-                mp_fetch_flags=mp_fetch_flags
+                mp_fetch_flags=mp_fetch_flags,
+                mp_out=out
             )
             
         except Exception as e:
@@ -364,7 +457,9 @@ class DataProvider:
         with all available fields for map status monitoring and processing.
         
         Returns:
-            dict: Complete global mapping information with all fields:
+            GlobalMappingInfo: Complete global mapping information. Fields are
+            available as attributes and, for compatibility, as read-only dict
+            keys:
                 - lastMPCountToFetch: Last map point count to fetch
                 - lastKFCountToFetch: Last keyframe count to fetch  
                 - lastMapCountToFetch: Last map count to fetch
@@ -557,25 +652,31 @@ class DataProvider:
         except Exception as e:
             raise AuroraSDKError(f"Failed to get IMU info: {e}")
     
-    def get_all_map_info(self, max_count=32):
+    def get_all_map_info(self, max_count=32, as_numpy=False):
         """
         Get information about all maps.
         
         Args:
             max_count (int): Maximum number of maps to retrieve (default: 32)
+            as_numpy (bool): If True, return a structured NumPy array with the
+                MapDesc dtype instead of a list of MapDesc objects
             
         Returns:
             list: List of MapDesc objects containing map information
+            (a structured array when as_numpy is True)
             
         Raises:
             ConnectionError: If not connected to a device
             AuroraSDKError: If failed to retrieve map info
+            ImportError: If as_numpy is True and NumPy is not installed
         """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy map info retrieval")
         self._ensure_connected()
         self._ensure_c_bindings()
         
         try:
-            return self._c_bindings.get_all_map_info(self._controller.session_handle, max_count)
+            return self._c_bindings.get_all_map_info(self._controller.session_handle, max_count, as_numpy)
         except Exception as e:
             raise AuroraSDKError(f"Failed to get all map info: {e}")
     
@@ -3,13 +3,32 @@ Data types and structures for Aurora SDK Python bindings.
 """
 
 import ctypes
+import importlib.util
 import math
+import sys
+from collections.abc import Mapping
 
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
+
+class _LazyNumpy:
+    """Proxy for the numpy module, imported on first use so importing the SDK stays cheap.
+
+    The first attribute access imports numpy and rebinds ``np`` to the real
+    module in every SDK module that took the proxy (``from .data_types import np``
+    or ``*``), so the hot paths afterwards do plain module attribute lookups
+    instead of going through this ``__getattr__``.
+    """
+
+    def __getattr__(self, name):
+        import numpy
+        package = __name__.rpartition('.')[0]
+        for module_name, module in list(sys.modules.items()):
+            if module_name.startswith(package + '.') and getattr(module, 'np', None) is self:
+                module.np = numpy
+        return getattr(numpy, name)
+
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+np = _LazyNumpy() if NUMPY_AVAILABLE else None
 
 
 class Vector3(ctypes.Structure):
@@ -906,6 +925,72 @@ class ImageFrame:
         return points_xyz, valid_mask
 
 
+class ImageFrameView(ImageFrame):
+    """ImageFrame whose pixel data is a memoryview instead of bytes.
+
+    ``data`` is a writable ``memoryview`` over a buffer owned by this frame
+    (never one the SDK reuses for later calls), so ``numpy.frombuffer(frame.data)``
+    (or ``memoryview(frame)`` on Python 3.12+) does not copy the pixels. The
+    view keeps the buffer alive until it is released.
+    """
+
+    def __init__(self, width, height, pixel_format, timestamp_ns, data=None, **kwargs):
+        if data is not None and not isinstance(data, memoryview):
+            data = memoryview(data).cast('B')
+        super().__init__(width, height, pixel_format, timestamp_ns, data=data, **kwargs)
+
+    def __buffer__(self, flags):
+        if self.data is None:
+            raise BufferError("image frame has no pixel data")
+        return memoryview(self.data)
+
+    def __len__(self):
+        return 0 if self.data is None else len(self.data)
+
+    def __bytes__(self):
+        return b'' if self.data is None else self.data.tobytes()
+
+    def to_numpy(self):
+        """Return an array aliasing the frame buffer, or None if no data.
+
+        Depth frames come back as a (height, width) float32 array and point3d
+        frames as an (N, 3) float32 array, as from to_numpy_depth_map() and
+        to_point3d_array(). Image frames are uint8: grayscale as
+        (height, width), BGR and RGBA as (height, width, channels); a buffer
+        too short for that shape is returned flat.
+        """
+        if self.data is None:
+            return None
+        if self.is_depth_frame():
+            return self.to_numpy_depth_map()
+        if self.is_point3d_frame():
+            return self.to_point3d_array()
+        array = np.frombuffer(self.data, dtype=np.uint8)
+        channels = {1: 3, 2: 4}.get(self.pixel_format, 1)
+        size = self.width * self.height * channels
+        if size == 0 or len(array) < size:
+            return array
+        shape = (self.height, self.width) if channels == 1 else (self.height, self.width, channels)
+        return array[:size].reshape(shape)
+
+    def release(self):
+        """Release the underlying buffer; the frame has no pixel data afterwards."""
+        if self.data is not None:
+            try:
+                self.data.release()
+            except BufferError:
+                # Still exported (e.g. to a NumPy array); that owner keeps it alive
+                pass
+            self.data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+        return False
+
+
 class TrackingFrame:
     """Python wrapper for tracking frame data."""
     
@@ -914,26 +999,26 @@ class TrackingFrame:
                  pose = None, timestamp_ns = 0, tracking_status = 0):
         self.left_image = left_image
         self.right_image = right_image
-        self.left_keypoints = left_keypoints or []
-        self.right_keypoints = right_keypoints or []
+        self.left_keypoints = left_keypoints if left_keypoints is not None else []
+        self.right_keypoints = right_keypoints if right_keypoints is not None else []
         self.pose = pose
         self.timestamp_ns = timestamp_ns
         self.tracking_status = tracking_status
     
     @classmethod
     def from_c_struct(cls, tracking_info, left_keypoints=None, right_keypoints=None, 
-                      left_image_data=None, right_image_data=None):
+                      left_image_data=None, right_image_data=None, image_cls=ImageFrame):
         """Create TrackingFrame from C structures."""
         # Create image frames
         left_image = None
         right_image = None
         
         if tracking_info.left_image_desc.width > 0:
-            left_image = ImageFrame.from_c_desc(tracking_info.left_image_desc, data=left_image_data)
+            left_image = image_cls.from_c_desc(tracking_info.left_image_desc, data=left_image_data)
             left_image.timestamp_ns = tracking_info.timestamp_ns
             
         if tracking_info.right_image_desc.width > 0:
-            right_image = ImageFrame.from_c_desc(tracking_info.right_image_desc, data=right_image_data)
+            right_image = image_cls.from_c_desc(tracking_info.right_image_desc, data=right_image_data)
             right_image.timestamp_ns = tracking_info.timestamp_ns
         
         # Convert pose - handle case where pose might be invalid
@@ -949,8 +1034,8 @@ class TrackingFrame:
         return cls(
             left_image=left_image,
             right_image=right_image,
-            left_keypoints=left_keypoints or [],
-            right_keypoints=right_keypoints or [],
+            left_keypoints=left_keypoints if left_keypoints is not None else [],
+            right_keypoints=right_keypoints if right_keypoints is not None else [],
             pose=(pose_position, pose_rotation),
             timestamp_ns=tracking_info.timestamp_ns,
             tracking_status=tracking_info.tracking_status
@@ -984,7 +1069,7 @@ class TrackingFrame:
             raise ValueError("image_side must be 'left' or 'right'")
         
         # Check if we have keypoints
-        if not keypoints:
+        if len(keypoints) == 0:
             return opencv_image
             
         try:
@@ -1079,7 +1164,10 @@ class LidarScanData:
         self.layer_id = layer_id
         self.binded_kf_id = binded_kf_id
         self.dyaw = dyaw
-        self.points = points or []  # List of (dist, angle, quality) tuples
+        # List of (dist, angle, quality) tuples by default, or a structured NumPy
+        # array with the same fields when requested with out= or as_numpy=True
+        # (see from_c_array)
+        self.points = points if points is not None else []
     
     @classmethod
     def from_c_data(cls, scan_info, scan_points):
@@ -1097,6 +1185,17 @@ class LidarScanData:
             points=points
         )
     
+    @classmethod
+    def from_c_array(cls, scan_info, points):
+        """Create LidarScanData around a structured array of LidarScanPoint records."""
+        return cls(
+            timestamp_ns=scan_info.timestamp_ns,
+            layer_id=scan_info.layer_id,
+            binded_kf_id=scan_info.binded_kf_id,
+            dyaw=scan_info.dyaw,
+            points=points
+        )
+    
     def to_cartesian(self):
         """Convert polar coordinates to cartesian (x, y) points."""
         if not NUMPY_AVAILABLE:
@@ -1107,9 +1206,13 @@ class LidarScanData:
                     y = dist * math.sin(angle)
                     cartesian_points.append((x, y, quality))
             return cartesian_points
+        elif isinstance(self.points, np.ndarray):
+            valid = self.points[self.points['quality'] > 0]
+            x = valid['dist'] * np.cos(valid['angle'])
+            y = valid['dist'] * np.sin(valid['angle'])
+            return list(zip(x, y, valid['quality']))
         else:
             # Use numpy for faster computation
-            import math
             valid_points = [(dist, angle, quality) for dist, angle, quality in self.points if quality > 0]
             if not valid_points:
                 return []
@@ -1129,7 +1232,13 @@ class LidarScanData:
         return len(self.points)
     
     def get_valid_points(self):
-        """Get only valid scan points (quality > 0)."""
+        """Get only valid scan points (quality > 0).
+
+        Returns a list of (dist, angle, quality) tuples, or a structured array
+        with the same fields when the scan's points are a structured array.
+        """
+        if NUMPY_AVAILABLE and isinstance(self.points, np.ndarray):
+            return self.points[self.points['quality'] > 0]
         return [(dist, angle, quality) for dist, angle, quality in self.points if quality > 0]
 
 
@@ -1205,6 +1314,70 @@ class GlobalMapDesc(ctypes.Structure):
     ]
 
 
+class GlobalMappingInfo(Mapping):
+    """
+    Snapshot of slamtec_aurora_sdk_global_map_desc_t.
+
+    Fields are exposed as attributes named after the C structure. The object
+    also behaves as a read-only mapping keyed by the legacy dict keys
+    (e.g. ``info['total_kf_count']``) so existing callers keep working.
+    """
+
+    __slots__ = tuple(name for name, _ in GlobalMapDesc._fields_)
+
+    # Legacy dict keys that differ from the structure field names
+    _KEY_ALIASES = {
+        'total_kf_count': 'totalKFCount',
+        'total_kf_count_fetched': 'totalKFCountFetched',
+        'active_map_id': 'activeMapID',
+    }
+    _KEYS = (
+        'lastMPCountToFetch', 'lastKFCountToFetch', 'lastMapCountToFetch',
+        'lastMPRetrieved', 'lastKFRetrieved',
+        'totalMPCount', 'total_kf_count', 'totalMapCount',
+        'totalMPCountFetched', 'total_kf_count_fetched', 'totalMapCountFetched',
+        'currentActiveMPCount', 'currentActiveKFCount',
+        'active_map_id', 'mappingFlags', 'slidingWindowStartKFId',
+    )
+
+    def __init__(self, desc):
+        """Initialize from a GlobalMapDesc structure."""
+        self.lastMPCountToFetch = desc.lastMPCountToFetch
+        self.lastKFCountToFetch = desc.lastKFCountToFetch
+        self.lastMapCountToFetch = desc.lastMapCountToFetch
+        self.lastMPRetrieved = desc.lastMPRetrieved
+        self.lastKFRetrieved = desc.lastKFRetrieved
+        self.totalMPCount = desc.totalMPCount
+        self.totalKFCount = desc.totalKFCount
+        self.totalMapCount = desc.totalMapCount
+        self.totalMPCountFetched = desc.totalMPCountFetched
+        self.totalKFCountFetched = desc.totalKFCountFetched
+        self.totalMapCountFetched = desc.totalMapCountFetched
+        self.currentActiveMPCount = desc.currentActiveMPCount
+        self.currentActiveKFCount = desc.currentActiveKFCount
+        self.activeMapID = desc.activeMapID
+        self.mappingFlags = desc.mappingFlags
+        self.slidingWindowStartKFId = desc.slidingWindowStartKFId
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, self._KEY_ALIASES.get(key, key))
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def to_dict(self):
+        """Return the information as a plain dict using the legacy keys."""
+        return {key: self[key] for key in self._KEYS}
+
+    def __repr__(self):
+        return "GlobalMappingInfo({})".format(self.to_dict())
+
+
 class MapPointDesc(ctypes.Structure):
     """Map point description structure (slamtec_aurora_sdk_map_point_desc_t)."""
     _fields_ = [
@@ -5,10 +5,12 @@ Handles Enhanced Imaging operations including depth camera frames, semantic segm
 camera calibration, and transform calibration.
 """
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from .c_bindings import get_c_bindings
 from .data_types import (
-    CameraCalibrationInfo, TransformCalibrationInfo, ImageFrame,
+    CameraCalibrationInfo, TransformCalibrationInfo, ImageFrame, ImageFrameView,
     DEPTHCAM_FRAME_TYPE_DEPTH_MAP, DEPTHCAM_FRAME_TYPE_POINT3D
 )
 from .exceptions import AuroraSDKError, ConnectionError, DataNotReadyError
@@ -37,6 +39,7 @@ class EnhancedImaging:
         """
         self._controller = controller
         self._data_provider = None  # Will be set by SDK
+        self._wait_executors = {}  # One worker thread per stream for the async waits
         try:
             self._c_bindings = c_bindings or get_c_bindings()
         except Exception as e:
@@ -53,6 +56,27 @@ class EnhancedImaging:
         if self._c_bindings is None:
             raise AuroraSDKError(f"Aurora SDK not available: {getattr(self, '_c_bindings_error', 'Unknown error')}")
     
+    def _run_wait_async(self, stream, wait_func, timeout_ms):
+        """Run a blocking wait on the stream's worker thread and return an awaitable result."""
+        executor = self._wait_executors.get(stream)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._wait_executors[stream] = executor
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(executor, wait_func, timeout_ms)
+    
+    def release(self):
+        """
+        Stop the worker threads used by the async frame waits.
+        
+        Waits already running finish on their own. This method is safe to call
+        multiple times; a later async wait starts a new worker thread.
+        """
+        executors = list(self._wait_executors.values())
+        self._wait_executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False)
+    
     def _ensure_connected(self):
         """Ensure we're connected to a device."""
         if not self._controller.is_connected():
@@ -93,7 +117,23 @@ class EnhancedImaging:
         except Exception:
             return False
     
-    def peek_depth_camera_frame(self, frame_type=DEPTHCAM_FRAME_TYPE_DEPTH_MAP, timestamp_ns=0, allow_nearest_frame=True):
+    async def wait_depth_camera_next_frame_async(self, timeout_ms=1000):
+        """
+        Wait for the next depth camera frame without blocking the event loop.
+        
+        The wait runs on a dedicated worker thread for the depth camera stream,
+        so concurrent waits on the same stream are served one after another.
+        
+        Args:
+            timeout_ms (int): Timeout in milliseconds
+            
+        Returns:
+            bool: True if frame is available, False if timeout
+        """
+        return await self._run_wait_async('depthcam', self.wait_depth_camera_next_frame, timeout_ms)
+    
+    def peek_depth_camera_frame(self, frame_type=DEPTHCAM_FRAME_TYPE_DEPTH_MAP, timestamp_ns=0, allow_nearest_frame=True,
+                                copy=True):
         """
         Get the latest depth camera frame from the device.
         
@@ -103,6 +143,8 @@ class EnhancedImaging:
                 - DEPTHCAM_FRAME_TYPE_POINT3D (1): point3d
             timestamp_ns (int): Specific timestamp to retrieve (0 for latest)
             allow_nearest_frame (bool): Allow nearest frame if exact timestamp not available
+            copy (bool): If False, return an ImageFrameView over a freshly allocated
+                buffer instead of copying the data into bytes
             
         Returns:
             ImageFrame: Image frame with depth data (depth map or point3d)
@@ -117,15 +159,16 @@ class EnhancedImaging:
         
         try:
             frame_desc, frame_data = self._c_bindings.peek_depth_camera_frame(
-                self._controller.session_handle, frame_type
+                self._controller.session_handle, frame_type, copy=copy
             )
             
             if frame_data:
+                frame_cls = ImageFrame if copy else ImageFrameView
                 # Use appropriate format based on frame type
                 if frame_type == DEPTHCAM_FRAME_TYPE_POINT3D:
-                    return ImageFrame.from_point3d_struct(frame_desc, frame_data)
+                    return frame_cls.from_point3d_struct(frame_desc, frame_data)
                 else:  # DEPTHCAM_FRAME_TYPE_DEPTH_MAP
-                    return ImageFrame.from_depth_camera_struct(frame_desc, frame_data)
+                    return frame_cls.from_depth_camera_struct(frame_desc, frame_data)
             return None
             
         except AuroraSDKError as e:
@@ -135,12 +178,14 @@ class EnhancedImaging:
         except Exception as e:
             raise AuroraSDKError(f"Failed to get depth camera frame: {e}")
     
-    def peek_depth_camera_related_rectified_image(self, timestamp_ns):
+    def peek_depth_camera_related_rectified_image(self, timestamp_ns, copy=True):
         """
         Get the related rectified camera image for a depth frame.
         
         Args:
             timestamp_ns (int): Timestamp of the depth frame to get related image for
+            copy (bool): If False, return an ImageFrameView over a freshly allocated
+                buffer instead of copying the data into bytes
             
         Returns:
             ImageFrame: Camera image frame data with rectified image
@@ -155,12 +200,12 @@ class EnhancedImaging:
         
         try:
             frame_desc, frame_data = self._c_bindings.peek_depth_camera_related_rectified_image(
-                self._controller.session_handle, timestamp_ns
+                self._controller.session_handle, timestamp_ns, copy=copy
             )
             
             if frame_data:
                 # Create ImageFrame from the enhanced imaging frame descriptor
-                image_frame = ImageFrame(
+                image_frame = (ImageFrame if copy else ImageFrameView)(
                     width=frame_desc.image_desc.width,
                     height=frame_desc.image_desc.height,
                     pixel_format=frame_desc.image_desc.format,
@@ -214,6 +259,21 @@ class EnhancedImaging:
         except Exception as e:
             return False
     
+    async def wait_semantic_segmentation_next_frame_async(self, timeout_ms=1000):
+        """
+        Wait for the next semantic segmentation frame without blocking the event loop.
+        
+        The wait runs on a dedicated worker thread for the segmentation stream,
+        so concurrent waits on the same stream are served one after another.
+        
+        Args:
+            timeout_ms (int): Timeout in milliseconds
+            
+        Returns:
+            bool: True if frame is available, False if timeout
+        """
+        return await self._run_wait_async('semantic_segmentation', self.wait_semantic_segmentation_next_frame, timeout_ms)
+    
     def get_semantic_segmentation_config(self):
         """
         Get semantic segmentation configuration information.
@@ -269,13 +329,15 @@ class EnhancedImaging:
         except Exception as e:
             raise AuroraSDKError(f"Failed to get label set name: {e}")
     
-    def peek_semantic_segmentation_frame(self, timestamp_ns=0, allow_nearest_frame=True):
+    def peek_semantic_segmentation_frame(self, timestamp_ns=0, allow_nearest_frame=True, copy=True):
         """
         Get the latest semantic segmentation frame from the device.
         
         Args:
             timestamp_ns (int): Specific timestamp to retrieve (0 for latest)
             allow_nearest_frame (bool): Allow nearest frame if exact timestamp not available
+            copy (bool): If False, return an ImageFrameView over a freshly allocated
+                buffer instead of copying the data into bytes
             
         Returns:
             ImageFrame: Semantic segmentation frame as unified ImageFrame with class IDs and metadata
@@ -290,12 +352,12 @@ class EnhancedImaging:
         
         try:
             frame_desc, segmentation_data = self._c_bindings.peek_semantic_segmentation_frame(
-                self._controller.session_handle, timestamp_ns, allow_nearest_frame
+                self._controller.session_handle, timestamp_ns, allow_nearest_frame, copy=copy
             )
             
             if segmentation_data:
                 # Create unified ImageFrame from the enhanced imaging frame descriptor
-                image_frame = ImageFrame(
+                image_frame = (ImageFrame if copy else ImageFrameView)(
                     width=frame_desc.image_desc.width,
                     height=frame_desc.image_desc.height,
                     pixel_format=frame_desc.image_desc.format,
@@ -9,6 +9,8 @@ Provides access to auto floor detection functionality including:
 - Floor detection status
 """
 
+from .c_bindings import get_c_bindings
+from .data_types import NUMPY_AVAILABLE
 from .exceptions import AuroraSDKError, ConnectionError
 
 
@@ -34,7 +36,6 @@ class FloorDetector:
     def _ensure_c_bindings(self):
         """Ensure C bindings are available."""
         if self._c_bindings is None:
-            from .c_bindings import get_c_bindings
             self._c_bindings = get_c_bindings()
             
     def _ensure_connected(self):
@@ -49,7 +50,8 @@ class FloorDetector:
         Returns:
             tuple: (histogram_info, histogram_data)
                 - histogram_info: FloorDetectionHistogramInfo with bin info
-                - histogram_data: list of float values for each bin
+                - histogram_data: float32 NumPy array with the value of each bin
+                  (a list of floats when NumPy is not available)
                 
         Raises:
             ConnectionError: If not connected to device
@@ -63,24 +65,33 @@ class FloorDetector:
         except Exception as e:
             raise AuroraSDKError("Failed to get floor detection histogram: {}".format(e))
     
-    def get_all_detection_info(self):
+    def get_all_detection_info(self, as_numpy=False):
         """
         Get all floor detection descriptions and current floor ID.
         
+        Args:
+            as_numpy: If True, return the descriptions as a NumPy record array
+                with the FloorDetectionDesc dtype (attribute access such as
+                desc.floorID still works on its elements)
+        
         Returns:
             tuple: (floor_descriptions, current_floor_id)
                 - floor_descriptions: list of FloorDetectionDesc objects
+                  (a record array when as_numpy is True)
                 - current_floor_id: int, ID of current floor
                 
         Raises:
             ConnectionError: If not connected to device
             AuroraSDKError: If failed to get floor info
+            ImportError: If as_numpy is True and NumPy is not installed
         """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for as_numpy floor detection retrieval")
         self._ensure_connected()
         self._ensure_c_bindings()
         
         try:
-            return self._c_bindings.get_all_floor_detection_info(self._controller.session_handle)
+            return self._c_bindings.get_all_floor_detection_info(self._controller.session_handle, as_numpy)
         except Exception as e:
             raise AuroraSDKError("Failed to get all floor detection info: {}".format(e))
     
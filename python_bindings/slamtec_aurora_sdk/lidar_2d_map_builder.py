@@ -4,7 +4,9 @@ Aurora SDK LIDAR2DMapBuilder component.
 Handles CoMap (2D LIDAR-based mapping) operations.
 """
 
+import ctypes
 from .c_bindings import get_c_bindings
+from .data_types import ERRORCODE_OK, GridMapGenerationOptions
 from .exceptions import AuroraSDKError, ConnectionError
 
 
@@ -117,9 +119,6 @@ class LIDAR2DMapBuilder:
         self._ensure_connected()
 
         try:
-            from .data_types import ERRORCODE_OK, GridMapGenerationOptions
-            import ctypes
-
             options_out = GridMapGenerationOptions()
 
             error_code = self._c_bindings.lib.slamtec_aurora_sdk_lidar2dmap_previewmap_get_generation_options(
@@ -510,7 +509,8 @@ class GridMapRef:
                         If False, return raw data for navigation (default: True)
         
         Returns:
-            tuple: (cell_data_list, fetch_info)
+            tuple: (cell_data, fetch_info). cell_data is a flat uint8 NumPy array
+            of cell_width * cell_height cells when NumPy is available, else a list.
         """
         if self._released:
             raise AuroraSDKError("GridMap has been released")
@@ -18,7 +18,8 @@ def get_map_sync_status(global_mapping_info):
     Calculate map data synchronization status from global mapping info.
     
     Args:
-        global_mapping_info: Dictionary returned from DataProvider.get_global_mapping_info()
+        global_mapping_info: GlobalMappingInfo (or legacy dict) returned from
+            DataProvider.get_global_mapping_info()
         
     Returns:
         dict: Map sync status with sync ratio and derived information
@@ -27,7 +28,7 @@ def get_map_sync_status(global_mapping_info):
             - total_kf_count_fetched: int - keyframes successfully fetched
             - is_synced: bool - True if sync ratio >= 95%
             - is_sufficient: bool - True if has enough data for map generation
-            - raw_info: dict - original global mapping info
+            - raw_info: GlobalMappingInfo - original global mapping info
     """
     total_kf_count = global_mapping_info.get('total_kf_count', 0)
     total_kf_count_fetched = global_mapping_info.get('total_kf_count_fetched', 0)
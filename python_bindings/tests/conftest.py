@@ -0,0 +1,14 @@
+"""
+Shared pytest setup for the Aurora SDK Python bindings tests.
+
+These tests cover the pure-Python parts of the bindings and do not need the
+native SDK library or a device.
+"""
+
+import os
+import sys
+
+# Make slamtec_aurora_sdk and setup.py importable when pytest is run from any directory
+BINDINGS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BINDINGS_DIR not in sys.path:
+    sys.path.insert(0, BINDINGS_DIR)
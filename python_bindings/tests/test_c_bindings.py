@@ -0,0 +1,120 @@
+"""
+Tests for the pure-Python helpers in slamtec_aurora_sdk.c_bindings.
+
+CBindings instances are created without loading the native library, so only
+methods that never call into the SDK are exercised here.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from slamtec_aurora_sdk import c_bindings
+from slamtec_aurora_sdk.data_types import IMUData
+from slamtec_aurora_sdk.exceptions import InvalidArgumentError
+
+
+@pytest.fixture
+def bindings():
+    return c_bindings.CBindings.__new__(c_bindings.CBindings)
+
+
+def _random_quaternions(count, seed=0):
+    quats = np.random.default_rng(seed).normal(size=(count, 4))
+    quats /= np.linalg.norm(quats, axis=1, keepdims=True)
+    # Include the identity and the gimbal-lock poles
+    half = math.sqrt(0.5)
+    return np.vstack([quats, [[0, 0, 0, 1], [0, half, 0, half], [0, -half, 0, half]]])
+
+
+class TestQuaternionToEuler:
+    def test_identity(self, bindings):
+        assert bindings.convert_quaternion_to_euler(0.0, 0.0, 0.0, 1.0) == (0.0, 0.0, 0.0)
+
+    def test_single_axis_rotations(self, bindings):
+        half = math.radians(30.0)
+        s, c = math.sin(half), math.cos(half)
+        np.testing.assert_allclose(bindings.convert_quaternion_to_euler(s, 0, 0, c), (math.radians(60), 0, 0),
+                                   atol=1e-12)
+        np.testing.assert_allclose(bindings.convert_quaternion_to_euler(0, s, 0, c), (0, math.radians(60), 0),
+                                   atol=1e-12)
+        np.testing.assert_allclose(bindings.convert_quaternion_to_euler(0, 0, s, c), (0, 0, math.radians(60)),
+                                   atol=1e-12)
+
+    def test_single_matches_batch(self, bindings):
+        quats = _random_quaternions(200)
+        batch = bindings.convert_quaternion_to_euler_batch(quats)
+        assert batch.shape == (len(quats), 3)
+        single = np.array([bindings.convert_quaternion_to_euler(*q) for q in quats])
+        np.testing.assert_allclose(batch, single, atol=1e-12)
+
+    def test_batch_keeps_float32(self, bindings):
+        # Away from the poles, where float32 asin loses precision
+        quats = _random_quaternions(10)[:10].astype(np.float32)
+        batch = bindings.convert_quaternion_to_euler_batch(quats)
+        assert batch.dtype == np.float32
+        single = np.array([bindings.convert_quaternion_to_euler(*map(float, q)) for q in quats])
+        np.testing.assert_allclose(batch, single, atol=1e-5)
+
+
+class TestCheckOutArray:
+    def test_accepts_matching_array(self):
+        c_bindings._check_out_array(np.zeros(4, dtype=IMUData), IMUData, "IMU buffer")
+
+    @pytest.mark.parametrize("out", [
+        None,
+        [0, 0, 0],
+        np.zeros(4),
+        np.zeros((2, 2), dtype=IMUData),
+        np.zeros(8, dtype=IMUData)[::2],
+    ])
+    def test_rejects_unusable_arrays(self, out):
+        with pytest.raises(InvalidArgumentError):
+            c_bindings._check_out_array(out, IMUData, "IMU buffer")
+
+    def test_rejects_read_only_array(self):
+        out = np.zeros(4, dtype=IMUData)
+        out.flags.writeable = False
+        with pytest.raises(InvalidArgumentError):
+            c_bindings._check_out_array(out, IMUData, "IMU buffer")
+
+
+class TestCheckMapPointOut:
+    def test_returns_common_length(self):
+        out = {
+            'positions': np.zeros((5, 3), dtype=np.float32),
+            'ids': np.zeros(5, dtype=np.uint64),
+            'map_ids': np.zeros(5, dtype=np.uint32),
+            'timestamps': np.zeros(5),
+        }
+        assert c_bindings._check_map_point_out(out) == 5
+        assert c_bindings._check_map_point_out({}) == 0
+
+    @pytest.mark.parametrize("out", [
+        {'positions': np.zeros((5, 2))},
+        {'positions': np.zeros(15)},
+        {'ids': None},
+        {'ids': np.zeros(5)},
+        {'ids': np.zeros(5, dtype=np.uint64), 'map_ids': np.zeros(4, dtype=np.uint32)},
+        {'descriptors': np.zeros((5, 32), dtype=np.uint8)},
+        [np.zeros(5, dtype=np.uint64)],
+    ])
+    def test_rejects_invalid_arrays(self, out):
+        with pytest.raises(InvalidArgumentError):
+            c_bindings._check_map_point_out(out)
+
+
+class TestReceiveBuffer:
+    def test_reused_buffer_is_zeroed(self):
+        scratch = c_bindings._CallScratch()
+        buf = scratch.receive_buffer(16)
+        buf[:16] = [0xFF] * 16
+        again = scratch.receive_buffer(16)
+        assert again is buf
+        assert bytes(again[:16]) == bytes(16)
+
+    def test_grows_in_power_of_two_steps(self):
+        scratch = c_bindings._CallScratch()
+        assert len(scratch.receive_buffer(100)) == 128
+        assert len(scratch.receive_buffer(129)) == 256
@@ -0,0 +1,142 @@
+"""
+Tests for the Python wrapper types in slamtec_aurora_sdk.data_types.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pytest
+
+from slamtec_aurora_sdk.data_types import (
+    GlobalMapDesc, GlobalMappingInfo, ImageFrame, ImageFrameView,
+    LidarScanData, LidarScanPoint, LidarSinglelayerScanDataInfo
+)
+
+
+def _global_map_desc():
+    desc = GlobalMapDesc()
+    for value, (name, _) in enumerate(GlobalMapDesc._fields_, start=1):
+        setattr(desc, name, value)
+    return desc
+
+
+class TestGlobalMappingInfo:
+    def test_fields_are_attributes(self):
+        desc = _global_map_desc()
+        info = GlobalMappingInfo(desc)
+        for name, _ in GlobalMapDesc._fields_:
+            assert getattr(info, name) == getattr(desc, name)
+
+    def test_legacy_keys_alias_structure_fields(self):
+        info = GlobalMappingInfo(_global_map_desc())
+        assert info['total_kf_count'] == info.totalKFCount
+        assert info['total_kf_count_fetched'] == info.totalKFCountFetched
+        assert info['active_map_id'] == info.activeMapID
+        assert info['totalMPCount'] == info.totalMPCount
+
+    def test_behaves_as_read_only_mapping(self):
+        info = GlobalMappingInfo(_global_map_desc())
+        assert isinstance(info, Mapping)
+        assert len(info) == len(GlobalMapDesc._fields_)
+        assert list(info) == list(info.to_dict())
+        assert dict(info) == info.to_dict()
+        assert info.get('active_map_id') == info.activeMapID
+        with pytest.raises(TypeError):
+            info['active_map_id'] = 0
+
+    def test_structure_names_of_aliased_keys_are_not_keys(self):
+        info = GlobalMappingInfo(_global_map_desc())
+        assert 'totalKFCount' not in info
+        with pytest.raises(KeyError):
+            info['totalKFCount']
+
+
+class TestImageFrameViewToNumpy:
+    def test_grayscale(self):
+        frame = ImageFrameView(4, 2, 0, 0, data=bytearray(range(8)))
+        array = frame.to_numpy()
+        assert array.dtype == np.uint8
+        assert array.shape == (2, 4)
+        assert array[1, 0] == 4
+
+    @pytest.mark.parametrize("pixel_format, channels", [(1, 3), (2, 4)])
+    def test_color(self, pixel_format, channels):
+        frame = ImageFrameView(4, 2, pixel_format, 0, data=bytearray(4 * 2 * channels))
+        assert frame.to_numpy().shape == (2, 4, channels)
+
+    def test_short_buffer_is_returned_flat(self):
+        frame = ImageFrameView(4, 2, 1, 0, data=bytearray(5))
+        assert frame.to_numpy().shape == (5,)
+
+    def test_depth_frame(self):
+        depth = np.arange(8, dtype=np.float32)
+        frame = ImageFrameView(4, 2, ImageFrame.FORMAT_DEPTH_FLOAT32, 0, data=bytearray(depth.tobytes()))
+        array = frame.to_numpy()
+        assert array.dtype == np.float32
+        assert array.shape == (2, 4)
+        np.testing.assert_array_equal(array.ravel(), depth)
+
+    def test_point3d_frame(self):
+        points = np.arange(24, dtype=np.float32)
+        frame = ImageFrameView(4, 2, ImageFrame.FORMAT_POINT3D_FLOAT32, 0, data=bytearray(points.tobytes()))
+        array = frame.to_numpy()
+        assert array.dtype == np.float32
+        assert array.shape == (8, 3)
+        np.testing.assert_array_equal(array.ravel(), points)
+
+    def test_aliases_frame_buffer(self):
+        frame = ImageFrameView(2, 1, 0, 0, data=bytearray(2))
+        frame.to_numpy()[0] = 7
+        assert frame.data[0] == 7
+
+    def test_no_data(self):
+        assert ImageFrameView(4, 2, 0, 0).to_numpy() is None
+
+
+def _scan_info(count):
+    info = LidarSinglelayerScanDataInfo()
+    info.timestamp_ns = 123
+    info.layer_id = 1
+    info.binded_kf_id = 7
+    info.dyaw = 0.5
+    info.scan_count = count
+    return info
+
+
+def _scan_points():
+    points = (LidarScanPoint * 3)()
+    for point, (dist, angle, quality) in zip(points, [(1.0, 0.0, 10), (2.0, 0.5, 0), (3.0, 1.0, 20)]):
+        point.dist = dist
+        point.angle = angle
+        point.quality = quality
+    return points
+
+
+class TestLidarScanData:
+    def test_from_c_data_builds_tuples(self):
+        scan = LidarScanData.from_c_data(_scan_info(3), _scan_points())
+        assert scan.timestamp_ns == 123
+        assert scan.binded_kf_id == 7
+        assert scan.points == [(1.0, 0.0, 10), (2.0, 0.5, 0), (3.0, 1.0, 20)]
+        assert scan.get_valid_points() == [(1.0, 0.0, 10), (3.0, 1.0, 20)]
+
+    def test_from_c_array_keeps_structured_array(self):
+        points = np.frombuffer(_scan_points(), dtype=np.dtype(LidarScanPoint)).copy()
+        scan = LidarScanData.from_c_array(_scan_info(3), points)
+        assert scan.points is points
+        assert scan.get_scan_count() == 3
+        assert scan.timestamp_ns == 123
+        assert scan.layer_id == 1
+
+        valid = scan.get_valid_points()
+        assert isinstance(valid, np.ndarray)
+        np.testing.assert_array_equal(valid['quality'], [10, 20])
+        np.testing.assert_allclose(valid['dist'], [1.0, 3.0])
+
+    def test_cartesian_matches_between_list_and_array(self):
+        info = _scan_info(3)
+        from_list = LidarScanData.from_c_data(info, _scan_points()).to_cartesian()
+        points = np.frombuffer(_scan_points(), dtype=np.dtype(LidarScanPoint)).copy()
+        from_array = LidarScanData.from_c_array(info, points).to_cartesian()
+        np.testing.assert_allclose(np.array(from_array, dtype=float), np.array(from_list, dtype=float),
+                                   rtol=1e-6)
@@ -0,0 +1,115 @@
+"""
+Tests for the native library copy helpers in python_bindings/setup.py.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+from conftest import BINDINGS_DIR
+
+
+@pytest.fixture
+def setup_module():
+    spec = importlib.util.spec_from_file_location("aurora_setup", os.path.join(BINDINGS_DIR, "setup.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def sdk_tree(tmp_path, setup_module, monkeypatch):
+    """A fake checkout: cpp_sdk libraries next to a python_bindings dir holding setup.py."""
+    bindings_dir = tmp_path / "python_bindings"
+    (bindings_dir / "slamtec_aurora_sdk").mkdir(parents=True)
+    cpp_lib_dir = tmp_path / "cpp_sdk" / "aurora_remote_public" / "lib"
+    for platform_name in ("linux_x86_64", "linux_aarch64"):
+        (cpp_lib_dir / platform_name).mkdir(parents=True)
+        (cpp_lib_dir / platform_name / "libslamtec_aurora_remote_sdk.so").write_bytes(
+            platform_name.encode() * 1000)
+    (cpp_lib_dir / "win64").mkdir()
+    (cpp_lib_dir / "win64" / "slamtec_aurora_remote_sdk.dll").write_bytes(b"dll" * 1000)
+    # setup.py locates everything relative to its own __file__
+    monkeypatch.setattr(setup_module, "__file__", str(bindings_dir / "setup.py"))
+    return cpp_lib_dir, bindings_dir / "slamtec_aurora_sdk" / "lib"
+
+
+class TestCopyNativeLibrary:
+    def test_copies_content_and_mtime(self, tmp_path, setup_module):
+        src = tmp_path / "src.so"
+        src.write_bytes(os.urandom(300000))
+        os.utime(src, (1000000000, 1000000000))
+        dst = tmp_path / "dst.so"
+        dst.write_bytes(b"previous, longer content" * 100000)
+
+        setup_module._copy_native_library(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert int(os.stat(dst).st_mtime) == 1000000000
+        assert setup_module._library_fingerprint(dst) == setup_module._library_fingerprint(src)
+
+    def test_falls_back_without_copy_file_range(self, tmp_path, setup_module, monkeypatch):
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        src = tmp_path / "src.so"
+        src.write_bytes(b"library" * 100)
+        dst = tmp_path / "dst.so"
+
+        setup_module._copy_native_library(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_fingerprint_of_missing_file(self, tmp_path, setup_module):
+        assert setup_module._library_fingerprint(tmp_path / "missing.so") is None
+
+
+class TestCopyNativeLibraries:
+    def test_single_platform(self, sdk_tree, setup_module):
+        cpp_lib_dir, lib_dir = sdk_tree
+        copied = setup_module.copy_native_libraries("linux_x86_64")
+
+        assert copied == ["lib/libslamtec_aurora_remote_sdk.so"]
+        assert (lib_dir / "libslamtec_aurora_remote_sdk.so").read_bytes() == (
+            cpp_lib_dir / "linux_x86_64" / "libslamtec_aurora_remote_sdk.so").read_bytes()
+        assert (lib_dir / "__init__.py").exists()
+
+    def test_multiple_platforms_use_per_platform_dirs(self, sdk_tree, setup_module):
+        _, lib_dir = sdk_tree
+        copied = setup_module.copy_native_libraries(["linux_x86_64", "win64"])
+
+        assert sorted(copied) == ["lib/linux_x86_64/libslamtec_aurora_remote_sdk.so",
+                                  "lib/win64/slamtec_aurora_remote_sdk.dll"]
+        assert (lib_dir / "linux_x86_64" / "libslamtec_aurora_remote_sdk.so").exists()
+        assert (lib_dir / "win64" / "slamtec_aurora_remote_sdk.dll").exists()
+
+    def test_stale_libraries_are_removed(self, sdk_tree, setup_module):
+        _, lib_dir = sdk_tree
+        setup_module.copy_native_libraries(["linux_x86_64", "win64"])
+        (lib_dir / "leftover.dylib").write_bytes(b"old")
+
+        copied = setup_module.copy_native_libraries("linux_aarch64")
+
+        assert copied == ["lib/libslamtec_aurora_remote_sdk.so"]
+        remaining = sorted(p.relative_to(lib_dir).as_posix() for p in lib_dir.rglob("*")
+                           if p.name != "__pycache__")
+        assert remaining == ["__init__.py", "libslamtec_aurora_remote_sdk.so"]
+        assert (lib_dir / "libslamtec_aurora_remote_sdk.so").read_bytes() == b"linux_aarch64" * 1000
+
+    def test_up_to_date_library_is_not_copied_again(self, sdk_tree, setup_module, monkeypatch, capsys):
+        setup_module.copy_native_libraries("linux_x86_64")
+        capsys.readouterr()
+        monkeypatch.setattr(setup_module, "_copy_native_library",
+                            lambda src, dst: pytest.fail("library copied although up to date"))
+
+        setup_module.copy_native_libraries("linux_x86_64")
+
+        assert "Up to date" in capsys.readouterr().out
+
+    def test_unknown_platform(self, sdk_tree, setup_module):
+        with pytest.raises(ValueError):
+            setup_module.copy_native_libraries("amiga")
+
+    def test_missing_library(self, sdk_tree, setup_module):
+        with pytest.raises(FileNotFoundError):
+            setup_module.copy_native_libraries("macos_arm64")